@@ -2,6 +2,9 @@
 
 import json
 import logging
+import os
+import stat
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -14,7 +17,10 @@ class ConfigValidationError(Exception):
     pass
 
 
-VALID_MODELS = {"tiny", "base", "small", "medium", "large"}
+VALID_MODELS = frozenset({"tiny", "base", "small", "medium", "large"})
+
+# Transcription engines: mlx-whisper (Metal) or faster-whisper (CTranslate2, int8)
+VALID_BACKENDS = frozenset({"mlx", "faster-whisper"})
 
 MODEL_INFO = {
     "tiny": {"size": "39MB", "label": "tiny (39MB, fastest)"},
@@ -25,7 +31,7 @@ MODEL_INFO = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration."""
 
@@ -36,9 +42,10 @@ class Config:
     debug: bool
     clear_clipboard: bool
     last_output_dir: str | None
+    backend: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Dictionary:
     """User vocabulary dictionary."""
 
@@ -54,6 +61,7 @@ DEFAULT_CONFIG = {
     "debug": False,
     "clear_clipboard": False,
     "last_output_dir": None,
+    "backend": "mlx",
 }
 
 
@@ -65,25 +73,30 @@ def load_config(config_dir: Path) -> Config:
     Merges partial config with defaults.
     Validates config values.
     """
-    # Create config directory if missing
-    config_dir.mkdir(parents=True, exist_ok=True)
-
     config_file = config_dir / "config.json"
 
     # Start with defaults
     config_data = DEFAULT_CONFIG.copy()
 
+    # Read the whole file in one call; a missing file (or directory) is the
+    # uncommon case, so try the read instead of stat-ing first
+    try:
+        raw_config = config_file.read_bytes()
+    except FileNotFoundError:
+        # Create config directory if missing
+        config_dir.mkdir(parents=True, exist_ok=True)
+        raw_config = None
+
     # Merge with file config if it exists
-    if config_file.exists():
-        with open(config_file) as f:
-            file_config = json.load(f)
+    if raw_config is not None:
+        file_config = json.loads(raw_config)
 
-            # Warn about unrecognized keys
-            for key in file_config:
-                if key not in DEFAULT_CONFIG:
-                    logger.warning(f"Unrecognized config key: {key}")
+        # Warn about unrecognized keys
+        for key in file_config:
+            if key not in DEFAULT_CONFIG:
+                logger.warning("Unrecognized config key: %s", key)
 
-            config_data.update(file_config)
+        config_data.update(file_config)
 
     # Validate
     _validate_config(config_data)
@@ -96,6 +109,7 @@ def load_config(config_dir: Path) -> Config:
         debug=config_data["debug"],
         clear_clipboard=config_data["clear_clipboard"],
         last_output_dir=config_data["last_output_dir"],
+        backend=config_data["backend"],
     )
 
 
@@ -108,6 +122,13 @@ def _validate_config(config_data: dict) -> None:
             f"Must be one of: {', '.join(sorted(VALID_MODELS))}"
         )
 
+    # Validate backend
+    if config_data["backend"] not in VALID_BACKENDS:
+        raise ConfigValidationError(
+            f"Invalid backend: {config_data['backend']}. "
+            f"Must be one of: {', '.join(sorted(VALID_BACKENDS))}"
+        )
+
     # Validate hotkey
     if not config_data["hotkey"] or not config_data["hotkey"].strip():
         raise ConfigValidationError("Invalid hotkey: cannot be empty")
@@ -116,14 +137,13 @@ def _validate_config(config_data: dict) -> None:
 def save_config(config: Config, config_dir: Path) -> None:
     """Save configuration to config file.
 
-    Creates config directory if it doesn't exist.
+    Creates config directory if it doesn't exist. The file is replaced
+    atomically, so a crash mid-save never leaves a truncated config.json.
 
     Args:
         config: Configuration to save.
         config_dir: Path to configuration directory.
     """
-    config_dir.mkdir(parents=True, exist_ok=True)
-
     config_file = config_dir / "config.json"
     config_data = {
         "hotkey": config.hotkey,
@@ -133,10 +153,55 @@ def save_config(config: Config, config_dir: Path) -> None:
         "debug": config.debug,
         "clear_clipboard": config.clear_clipboard,
         "last_output_dir": config.last_output_dir,
+        "backend": config.backend,
     }
 
-    with open(config_file, "w") as f:
-        json.dump(config_data, f, indent=2)
+    # Encode once and write in a single call instead of streaming json.dump chunks
+    data = json.dumps(config_data, indent=2)
+
+    try:
+        _write_atomic(config_file, data)
+    except FileNotFoundError:
+        # Only create the directory when it's actually missing, rather than
+        # paying for a mkdir on every save
+        config_dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(config_file, data)
+
+
+def _read_umask() -> int:
+    """Return the process umask (os.umask can only read it by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import: os.umask briefly changes process-wide state, so doing it
+# on every save could race files being created on other threads
+_UMASK = _read_umask()
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """Write data to path via a temp file in the same directory and os.replace.
+
+    The file keeps the mode of the file it replaces, or gets the usual umask
+    default if it's new, rather than mkstemp's owner-only 0600.
+
+    Raises:
+        FileNotFoundError: If the parent directory doesn't exist.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
 
 
 def load_dictionary(config_dir: Path) -> Dictionary:
@@ -146,12 +211,11 @@ def load_dictionary(config_dir: Path) -> Dictionary:
     """
     dict_file = config_dir / "dictionary.json"
 
-    if not dict_file.exists():
+    try:
+        data = json.loads(dict_file.read_bytes())
+    except FileNotFoundError:
         return Dictionary()
 
-    with open(dict_file) as f:
-        data = json.load(f)
-
     return Dictionary(
         terms=data.get("terms", []),
         replacements=data.get("replacements", {}),
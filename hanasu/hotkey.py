@@ -4,10 +4,31 @@ Uses CGEventTap to intercept and suppress hotkey events so they don't
 pass through to other applications.
 """
 
+import functools
 import threading
 from collections.abc import Callable
+from typing import Any
 
-import Quartz
+# Quartz is imported on first use (see _import_quartz) so that importing this
+# module - e.g. just to parse a hotkey - doesn't load the framework.
+Quartz: Any = None
+
+# Quartz functions called on every keystroke by the event tap callback, bound
+# by _import_quartz so the callback does one global lookup per call instead
+# of a global lookup plus an attribute lookup on the Quartz module.
+_CGEventGetIntegerValueField: Any = None
+_CGEventGetFlags: Any = None
+
+
+def _import_quartz() -> None:
+    """Import the Quartz framework into this module on first use."""
+    global Quartz, _CGEventGetIntegerValueField, _CGEventGetFlags
+    if Quartz is None:
+        import Quartz as quartz_module
+
+        Quartz = quartz_module
+        _CGEventGetIntegerValueField = quartz_module.CGEventGetIntegerValueField
+        _CGEventGetFlags = quartz_module.CGEventGetFlags
 
 
 class HotkeyParseError(Exception):
@@ -98,16 +119,45 @@ KEYCODE_MAP = {
     "f20": 90,
 }
 
+# CGEventFlags modifier bits (CGEventTypes.h), matching Quartz.kCGEventFlagMask*.
+# Spelled out so parsing a hotkey doesn't require importing Quartz.
+FLAG_MASK_SHIFT = 0x00020000
+FLAG_MASK_CONTROL = 0x00040000
+FLAG_MASK_ALTERNATE = 0x00080000
+FLAG_MASK_COMMAND = 0x00100000
+
+# CGEventType and CGEventField values (CGEventTypes.h) matching Quartz.kCGEvent*
+# and Quartz.kCGKeyboardEventKeycode, compared against on every keystroke.
+EVENT_KEY_DOWN = 10
+EVENT_KEY_UP = 11
+EVENT_FLAGS_CHANGED = 12
+EVENT_TAP_DISABLED_BY_TIMEOUT = 0xFFFFFFFE
+KEYBOARD_EVENT_KEYCODE_FIELD = 9
+
 # Modifier key names to Quartz flags
 MODIFIER_FLAGS = {
-    "cmd": Quartz.kCGEventFlagMaskCommand,
-    "command": Quartz.kCGEventFlagMaskCommand,
-    "meta": Quartz.kCGEventFlagMaskCommand,
-    "shift": Quartz.kCGEventFlagMaskShift,
-    "alt": Quartz.kCGEventFlagMaskAlternate,
-    "option": Quartz.kCGEventFlagMaskAlternate,
-    "ctrl": Quartz.kCGEventFlagMaskControl,
-    "control": Quartz.kCGEventFlagMaskControl,
+    "cmd": FLAG_MASK_COMMAND,
+    "command": FLAG_MASK_COMMAND,
+    "meta": FLAG_MASK_COMMAND,
+    "shift": FLAG_MASK_SHIFT,
+    "alt": FLAG_MASK_ALTERNATE,
+    "option": FLAG_MASK_ALTERNATE,
+    "ctrl": FLAG_MASK_CONTROL,
+    "control": FLAG_MASK_CONTROL,
+}
+
+# Union of all modifier flags we match on (excludes caps lock, fn, etc.)
+MODIFIER_MASK = FLAG_MASK_COMMAND | FLAG_MASK_SHIFT | FLAG_MASK_ALTERNATE | FLAG_MASK_CONTROL
+
+# Virtual keycodes fit in 16 bits; modifier bits are packed above them so
+# (modifiers, keycode) can be matched with a single integer comparison
+KEYCODE_BITS = 16
+
+# Single lookup table for parse_hotkey: name -> (is_modifier, flag or keycode).
+# Modifier and key names don't overlap, so one dict lookup classifies each part.
+_HOTKEY_TOKENS: dict[str, tuple[bool, int]] = {
+    **{name: (False, code) for name, code in KEYCODE_MAP.items()},
+    **{name: (True, flag) for name, flag in MODIFIER_FLAGS.items()},
 }
 
 
@@ -126,27 +176,47 @@ def parse_hotkey(hotkey_str: str) -> dict:
     if not hotkey_str or not hotkey_str.strip():
         raise HotkeyParseError("Hotkey string cannot be empty")
 
-    parts = [p.strip().lower() for p in hotkey_str.split("+")]
+    modifier_mask, keycode = _parse_hotkey_parts(hotkey_str)
+
+    # Fresh dict per call so callers can't mutate the memoized result
+    return {
+        "modifier_mask": modifier_mask,
+        "keycode": keycode,
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_hotkey_parts(hotkey_str: str) -> tuple[int, int]:
+    """Parse a non-empty hotkey string into (modifier_mask, keycode).
+
+    Memoized so re-validating the same hotkey (menu dialog, listener restarts)
+    skips re-parsing. Invalid strings raise and are not cached.
+
+    Raises:
+        HotkeyParseError: If hotkey string is invalid.
+    """
+
     modifier_mask = 0
     keycode = None
 
-    for part in parts:
-        if part in MODIFIER_FLAGS:
-            modifier_mask |= MODIFIER_FLAGS[part]
-        elif part in KEYCODE_MAP:
-            if keycode is not None:
-                raise HotkeyParseError("Multiple keys specified")
-            keycode = KEYCODE_MAP[part]
-        else:
+    # Lowercase once for the whole string, then one table lookup per part
+    for raw_part in hotkey_str.lower().split("+"):
+        part = raw_part.strip()
+        token = _HOTKEY_TOKENS.get(part)
+        if token is None:
             raise HotkeyParseError(f"Unknown key: {part}")
+        is_modifier, value = token
+        if is_modifier:
+            modifier_mask |= value
+        elif keycode is not None:
+            raise HotkeyParseError("Multiple keys specified")
+        else:
+            keycode = value
 
     if keycode is None:
         raise HotkeyParseError("No key specified in hotkey")
 
-    return {
-        "modifier_mask": modifier_mask,
-        "keycode": keycode,
-    }
+    return modifier_mask, keycode
 
 
 class HotkeyListener:
@@ -166,16 +236,26 @@ class HotkeyListener:
             on_release: Callback when hotkey is released.
         """
         self._hotkey_config = parse_hotkey(hotkey)
+        # Pack (modifiers, keycode) into one int so the callback, which runs on
+        # every keystroke, matches the hotkey with a single comparison
+        self._target_packed: int = (
+            self._hotkey_config["modifier_mask"] << KEYCODE_BITS
+        ) | self._hotkey_config["keycode"]
         self._on_press = on_press
         self._on_release = on_release
         self._hotkey_active = False
+        # Set while no modifier keys are held; tracked from flags-changed events
+        # so text injection can wait on it instead of polling the HID state
+        self.modifiers_released = threading.Event()
+        self.modifiers_released.set()
         self._tap = None
-        self._run_loop_source = None
+        self._run_loop = None
         self._thread: threading.Thread | None = None
         self._running = False
 
     def start(self) -> None:
         """Start listening for hotkey."""
+        _import_quartz()
         self._running = True
         self._thread = threading.Thread(target=self._run_event_tap, daemon=True)
         self._thread.start()
@@ -184,23 +264,11 @@ class HotkeyListener:
         """Stop listening for hotkey."""
         self._running = False
 
-        # Disable the event tap first
-        if self._tap:
-            Quartz.CGEventTapEnable(self._tap, False)
-
-        # Remove run loop source from run loop
-        if self._run_loop_source:
-            Quartz.CFRunLoopRemoveSource(
-                Quartz.CFRunLoopGetCurrent(),
-                self._run_loop_source,
-                Quartz.kCFRunLoopCommonModes,
-            )
-            self._run_loop_source = None
-
-        # Invalidate the mach port to fully release the event tap
-        if self._tap:
-            Quartz.CFMachPortInvalidate(self._tap)
-            self._tap = None
+        # Wake the listener thread out of CFRunLoopRun (safe to call cross-thread);
+        # the thread tears down its own event tap on the way out
+        run_loop = self._run_loop
+        if run_loop:
+            Quartz.CFRunLoopStop(run_loop)
 
         # Wait for thread to stop
         if self._thread:
@@ -212,8 +280,8 @@ class HotkeyListener:
     def _run_event_tap(self) -> None:
         """Run the event tap in a background thread."""
         # Create event tap
-        mask = (1 << Quartz.kCGEventKeyDown) | (1 << Quartz.kCGEventKeyUp)
-        self._tap = Quartz.CGEventTapCreate(
+        mask = (1 << EVENT_KEY_DOWN) | (1 << EVENT_KEY_UP) | (1 << EVENT_FLAGS_CHANGED)
+        tap = Quartz.CGEventTapCreate(
             Quartz.kCGSessionEventTap,
             Quartz.kCGHeadInsertEventTap,
             Quartz.kCGEventTapOptionDefault,
@@ -222,57 +290,71 @@ class HotkeyListener:
             None,
         )
 
-        if self._tap is None:
+        if tap is None:
             print("Error: Could not create event tap. Check Accessibility permissions.")
             return
 
-        # Create run loop source
-        self._run_loop_source = Quartz.CFMachPortCreateRunLoopSource(None, self._tap, 0)
-        Quartz.CFRunLoopAddSource(
-            Quartz.CFRunLoopGetCurrent(),
-            self._run_loop_source,
-            Quartz.kCFRunLoopCommonModes,
-        )
-
-        # Enable the tap
-        Quartz.CGEventTapEnable(self._tap, True)
-
-        # Run the loop
-        while self._running:
-            Quartz.CFRunLoopRunInMode(Quartz.kCFRunLoopDefaultMode, 0.1, False)
+        # The tap, source and run loop belong to this thread, which also tears
+        # them down. self._tap is only kept so the callback can re-enable the
+        # tap after a timeout, and self._run_loop so stop() can wake us.
+        run_loop = Quartz.CFRunLoopGetCurrent()
+        run_loop_source = Quartz.CFMachPortCreateRunLoopSource(None, tap, 0)
+        Quartz.CFRunLoopAddSource(run_loop, run_loop_source, Quartz.kCFRunLoopCommonModes)
+        self._tap = tap
+        self._run_loop = run_loop
+
+        try:
+            # Enable the tap
+            Quartz.CGEventTapEnable(tap, True)
+
+            # Block in the run loop until stop() calls CFRunLoopStop, instead of
+            # waking every 100ms to poll. _run_loop is published before _running
+            # is checked, so a stop() that comes first ends the loop here, and a
+            # later one finds the run loop to stop. A CFRunLoopStop that lands
+            # before CFRunLoopRun is entered makes that run return immediately.
+            while self._running:
+                Quartz.CFRunLoopRun()
+        finally:
+            Quartz.CGEventTapEnable(tap, False)
+            Quartz.CFRunLoopRemoveSource(run_loop, run_loop_source, Quartz.kCFRunLoopCommonModes)
+            # Invalidate the mach port to fully release the event tap
+            Quartz.CFMachPortInvalidate(tap)
+            # Leave a newer listener thread's tap and run loop alone
+            if self._tap is tap:
+                self._tap = None
+            if self._run_loop is run_loop:
+                self._run_loop = None
 
     def _event_callback(self, proxy, event_type, event, refcon):
         """Handle keyboard events from the event tap."""
-        # Check if tap was disabled (e.g., due to timeout)
-        if event_type == Quartz.kCGEventTapDisabledByTimeout:
-            Quartz.CGEventTapEnable(self._tap, True)
+        # Fast path out for everything that isn't a key press/release, before
+        # making any PyObjC calls on the event
+        if event_type != EVENT_KEY_DOWN and event_type != EVENT_KEY_UP:
+            # Track modifier state for modifiers_released, never suppress these
+            if event_type == EVENT_FLAGS_CHANGED:
+                if _CGEventGetFlags(event) & MODIFIER_MASK:
+                    self.modifiers_released.clear()
+                else:
+                    self.modifiers_released.set()
+            # Check if tap was disabled (e.g., due to timeout)
+            elif event_type == EVENT_TAP_DISABLED_BY_TIMEOUT:
+                Quartz.CGEventTapEnable(self._tap, True)
             return event
 
         # Get key code and flags
-        keycode = Quartz.CGEventGetIntegerValueField(event, Quartz.kCGKeyboardEventKeycode)
-        flags = Quartz.CGEventGetFlags(event)
-
-        # Check if this is our hotkey
-        target_keycode = self._hotkey_config["keycode"]
-        target_modifiers = self._hotkey_config["modifier_mask"]
-
-        # Mask out non-modifier flags (like caps lock state)
-        modifier_only_flags = flags & (
-            Quartz.kCGEventFlagMaskCommand
-            | Quartz.kCGEventFlagMaskShift
-            | Quartz.kCGEventFlagMaskAlternate
-            | Quartz.kCGEventFlagMaskControl
-        )
+        keycode = _CGEventGetIntegerValueField(event, KEYBOARD_EVENT_KEYCODE_FIELD)
+        flags = _CGEventGetFlags(event)
 
-        if keycode == target_keycode and modifier_only_flags == target_modifiers:
+        # Check if this is our hotkey, masking out non-modifier flags (like caps lock state)
+        if (((flags & MODIFIER_MASK) << KEYCODE_BITS) | keycode) == self._target_packed:
             # This is our hotkey
-            if event_type == Quartz.kCGEventKeyDown:
+            if event_type == EVENT_KEY_DOWN:
                 if not self._hotkey_active:
                     self._hotkey_active = True
                     self._on_press()
                 # Suppress the event by returning None
                 return None
-            elif event_type == Quartz.kCGEventKeyUp:
+            else:
                 if self._hotkey_active:
                     self._hotkey_active = False
                     self._on_release()
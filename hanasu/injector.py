@@ -4,36 +4,73 @@ Uses CGEvent with session-level event tap for reliable paste simulation.
 Based on Maccy clipboard manager's proven implementation.
 """
 
+import threading
 import time
+from typing import Any
 
-import Quartz
-from AppKit import NSPasteboard, NSPasteboardTypeString
+# PyObjC frameworks are imported on first use (see _import_quartz and
+# _import_appkit) so that importing this module doesn't load Quartz and AppKit.
+Quartz: Any = None
+NSPasteboard: Any = None
+NSPasteboardTypeString: Any = None
 
 # Virtual key code for 'v' on US QWERTY keyboard
 V_KEY_CODE = 0x09
 
+# Gap between posting Cmd+V key-down and key-up. Keeps the two events from
+# being coalesced without adding noticeable paste latency.
+KEY_EVENT_GAP = 0.001
 
-def inject_text(text: str, clear_after: bool = False) -> None:
+# Reused across pastes so each injection doesn't re-bridge them through PyObjC
+_pasteboard: Any = None
+_event_source: Any = None
+
+
+def _import_quartz() -> None:
+    """Import the Quartz framework into this module on first use."""
+    global Quartz
+    if Quartz is None:
+        import Quartz as quartz_module
+
+        Quartz = quartz_module
+
+
+def _import_appkit() -> None:
+    """Import the AppKit pasteboard symbols into this module on first use."""
+    global NSPasteboard, NSPasteboardTypeString
+    if NSPasteboard is None:
+        from AppKit import NSPasteboard as pasteboard_class
+        from AppKit import NSPasteboardTypeString as pasteboard_type_string
+
+        NSPasteboard = pasteboard_class
+        NSPasteboardTypeString = pasteboard_type_string
+
+
+def inject_text(
+    text: str,
+    clear_after: bool = False,
+    modifiers_released: threading.Event | None = None,
+) -> None:
     """Inject text at cursor position using clipboard paste.
 
     Args:
         text: Text to inject.
         clear_after: If True, clear clipboard after paste.
+        modifiers_released: Event set when all modifier keys are up (see
+            HotkeyListener.modifiers_released). If None, modifier state is polled.
     """
     if not text:
         return
 
-    pasteboard = NSPasteboard.generalPasteboard()
+    pasteboard = _get_pasteboard()
 
-    # Set text to clipboard
+    # Set text to clipboard. The write is synchronous - the pasteboard server
+    # has the text once setString_forType_ returns - so there's nothing to wait for
     pasteboard.clearContents()
     pasteboard.setString_forType_(text, NSPasteboardTypeString)
 
-    # Small delay for clipboard to update
-    time.sleep(0.05)
-
     # Wait for user's modifier keys to be released (from hotkey)
-    _wait_for_modifiers_released()
+    _wait_for_modifiers_released(released_event=modifiers_released)
 
     # Simulate Cmd+V
     _simulate_paste()
@@ -44,23 +81,47 @@ def inject_text(text: str, clear_after: bool = False) -> None:
         pasteboard.clearContents()
 
 
-def _simulate_paste() -> None:
-    """Simulate Cmd+V keystroke using session-level CGEvent.
+def _get_pasteboard() -> Any:
+    """Return the general pasteboard, fetched once and then reused."""
+    global _pasteboard
+    if _pasteboard is None:
+        _import_appkit()
+        _pasteboard = NSPasteboard.generalPasteboard()
+    return _pasteboard
 
-    Uses CGEventSource with combinedSessionState and posts to
-    cgSessionEventTap for reliable, non-interfering paste.
-    Sends both key-down and key-up events for full keystroke cycle.
-    """
-    # Create event source at session level
-    source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateCombinedSessionState)
 
-    if source:
+def _get_event_source() -> Any:
+    """Return the session-level event source used for paste, created once.
+
+    Creation can fail (e.g. without Accessibility permission); a failed source
+    is not cached so the next paste tries again.
+    """
+    global _event_source
+    if _event_source is None:
+        source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateCombinedSessionState)
+        if not source:
+            return None
         Quartz.CGEventSourceSetLocalEventsFilterDuringSuppressionState(
             source,
             Quartz.kCGEventFilterMaskPermitLocalMouseEvents
             | Quartz.kCGEventFilterMaskPermitSystemDefinedEvents,
             Quartz.kCGEventSuppressionStateSuppressionInterval,
         )
+        _event_source = source
+    return _event_source
+
+
+def _simulate_paste() -> None:
+    """Simulate Cmd+V keystroke using session-level CGEvent.
+
+    Uses CGEventSource with combinedSessionState and posts to
+    cgSessionEventTap for reliable, non-interfering paste.
+    Sends both key-down and key-up events for full keystroke cycle.
+    """
+    _import_quartz()
+
+    # Event source at session level (reused across pastes)
+    source = _get_event_source()
 
     # Create key down event with Command flag
     key_down = Quartz.CGEventCreateKeyboardEvent(source, V_KEY_CODE, True)
@@ -68,8 +129,8 @@ def _simulate_paste() -> None:
         Quartz.CGEventSetFlags(key_down, Quartz.kCGEventFlagMaskCommand)
         Quartz.CGEventPost(Quartz.kCGSessionEventTap, key_down)
 
-    # Small delay for event processing
-    time.sleep(0.01)
+    # Minimal delay for event processing
+    time.sleep(KEY_EVENT_GAP)
 
     # Create key up event with Command flag (required for browser apps)
     key_up = Quartz.CGEventCreateKeyboardEvent(source, V_KEY_CODE, False)
@@ -78,12 +139,21 @@ def _simulate_paste() -> None:
         Quartz.CGEventPost(Quartz.kCGSessionEventTap, key_up)
 
 
-def _wait_for_modifiers_released(timeout: float = 1.0) -> None:
+def _wait_for_modifiers_released(
+    timeout: float = 1.0, released_event: threading.Event | None = None
+) -> None:
     """Wait until all modifier keys are released.
 
     Args:
         timeout: Maximum time to wait in seconds.
+        released_event: Event set by the hotkey event tap when no modifiers are
+            held. When given, blocks on it instead of polling every 10ms.
     """
+    if released_event is not None:
+        released_event.wait(timeout)
+        return
+
+    _import_quartz()
     start = time.time()
 
     while time.time() - start < timeout:
@@ -1,16 +1,30 @@
 """Logging configuration for Hanasu."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_FORMAT_SIMPLE = "[%(levelname)s] %(message)s"
 
+# Formatters are stateless, so build them once and share across re-initialization
+_CONSOLE_FORMATTER = logging.Formatter(LOG_FORMAT_SIMPLE)
+_FILE_FORMATTER = logging.Formatter(LOG_FORMAT)
+
+# Background listener that owns the file handler (see setup_logging)
+_file_listener: QueueListener | None = None
+
 
 def setup_logging(debug: bool = False, log_to_file: bool = True) -> logging.Logger:
     """Configure logging for the application.
 
+    File output goes through a QueueHandler so logging calls on the hotkey and
+    transcription threads never block on disk I/O; a QueueListener thread does
+    the actual writes.
+
     Args:
         debug: Enable DEBUG level logging.
         log_to_file: Write logs to ~/Library/Logs/Hanasu/hanasu.log
@@ -18,19 +32,25 @@ def setup_logging(debug: bool = False, log_to_file: bool = True) -> logging.Logg
     Returns:
         Root logger for the application.
     """
+    # Neither format uses thread/process fields, so skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     root_logger = logging.getLogger("hanasu")
     root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
     # Clear existing handlers to avoid duplicates on re-initialization
     root_logger.handlers.clear()
+    shutdown_logging()
 
     # Console handler (stderr)
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(logging.DEBUG if debug else logging.WARNING)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT_SIMPLE))
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     root_logger.addHandler(console_handler)
 
-    # File handler
+    # File handler, fed from a queue by a background listener thread
     if log_to_file:
         log_dir = Path.home() / "Library" / "Logs" / "Hanasu"
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -38,7 +58,30 @@ def setup_logging(debug: bool = False, log_to_file: bool = True) -> logging.Logg
 
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(_FILE_FORMATTER)
+
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        root_logger.addHandler(QueueHandler(log_queue))
+
+        global _file_listener
+        _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
 
     return root_logger
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records to file and stop the background listener.
+
+    Safe to call more than once. Registered with atexit so records logged
+    right before exit (e.g. fatal errors) still reach the log file.
+    """
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(shutdown_logging)
@@ -1,6 +1,8 @@
 """Main entry point for Hanasu."""
 
 import argparse
+import functools
+import importlib.util
 import json
 import logging
 import os
@@ -8,14 +10,16 @@ import shutil
 import subprocess
 import sys
 import threading
+import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from hanasu import __version__
 from hanasu.config import (
     DEFAULT_CONFIG,
+    VALID_BACKENDS,
     VALID_MODELS,
-    Config,
     load_config,
     load_dictionary,
     save_config,
@@ -23,24 +27,38 @@ from hanasu.config import (
 from hanasu.hotkey import HotkeyListener
 from hanasu.injector import inject_text
 from hanasu.logging_config import setup_logging
-from hanasu.menubar import (
-    open_file_picker,
-    run_menubar_app,
-    save_file_picker,
-    show_format_picker,
-    start_app_loop,
-)
-from hanasu.recorder import Recorder, list_input_devices
-from hanasu.transcriber import Transcriber
+from hanasu.transcribe_worker import TranscribeWorker, WorkerUnavailableError
 from hanasu.updater import check_for_update
 
+# menubar (AppKit), recorder (sounddevice) and transcriber (numpy) are imported
+# where they're used, so CLI commands that don't need them start quickly
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+    from hanasu.transcriber import Transcriber
+
 DEFAULT_CONFIG_DIR = Path.home() / ".hanasu"
 
+# 10 minute timeout for transcribing large files
+FILE_TRANSCRIPTION_TIMEOUT = 600
+
+# How often a one-off transcription process is checked for quit/timeout
+TRANSCRIPTION_POLL_INTERVAL = 1.0
+
+# How much of the app launcher script run_doctor reads to find the install path
+LAUNCHER_HEAD_BYTES = 4096
+
+# Minimum recording length to transcribe (0.5 seconds at 16kHz)
+MIN_RECORDING_SAMPLES = 8000
+
+# Audio/video extensions offered by the transcribe-file picker
+FILE_PICKER_EXTENSIONS = ("mp3", "wav", "m4a", "mp4", "mov", "mkv", "avi", "webm")
+
 # Homebrew paths for macOS - GUI apps don't inherit shell PATH
-HOMEBREW_PATHS = [
+HOMEBREW_PATHS = (
     "/opt/homebrew/bin",  # Apple Silicon
     "/usr/local/bin",  # Intel Mac
-]
+)
 
 
 def ensure_homebrew_in_path() -> None:
@@ -51,14 +69,14 @@ def ensure_homebrew_in_path() -> None:
     adds common Homebrew paths to PATH so subprocess calls can find them.
     """
     current_path = os.environ.get("PATH", "")
-    path_parts = current_path.split(":") if current_path else []
+    path_parts = current_path.split(os.pathsep) if current_path else []
 
     # Prepend Homebrew paths that aren't already present
-    paths_to_add = [p for p in HOMEBREW_PATHS if p not in path_parts]
+    present = set(path_parts)
+    paths_to_add = [p for p in HOMEBREW_PATHS if p not in present]
 
     if paths_to_add:
-        new_path = ":".join(paths_to_add + path_parts)
-        os.environ["PATH"] = new_path
+        os.environ["PATH"] = os.pathsep.join(paths_to_add + path_parts)
 
 
 class Hanasu:
@@ -78,11 +96,15 @@ class Hanasu:
         setup_logging(debug=self.config.debug, log_to_file=True)
         self._logger = logging.getLogger("hanasu.main")
 
+        from hanasu.recorder import Recorder
+        from hanasu.transcriber import Transcriber
+
         # Initialize components - fallback to default if configured device unavailable
         self.recorder = Recorder(device=self.config.audio_device, fallback_to_default=True)
         self.transcriber = Transcriber(
             model=self.config.model,
             language=self.config.language,
+            backend=self.config.backend,
         )
         self.hotkey_listener = HotkeyListener(
             hotkey=self.config.hotkey,
@@ -93,10 +115,28 @@ class Hanasu:
         self._recording = False
         self._menubar_app = None
         self._model_change_in_progress = False
+        self._update_in_progress = False
+        self._quitting = False
+        self._hotkey_lock = threading.Lock()
+        # Guards the check-and-set of the *_in_progress flags
+        self._in_progress_lock = threading.Lock()
+        # Started on the first file transcription, then reused for later ones
+        self._transcribe_worker = TranscribeWorker()
+        # Dictations are transcribed and pasted here rather than on the event tap
+        # thread, which has to keep delivering key events (modifier releases the
+        # paste waits on) while they run. One worker keeps dictations in order.
+        self._dictation_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="hanasu-dictation"
+        )
 
-        self._logger.info(f"Initialized with hotkey: {self.config.hotkey}")
-        self._logger.info(f"Model: {self.config.model}")
-        self._logger.info(f"Audio device: {self.config.audio_device or 'system default'}")
+        self._logger.info("Initialized with hotkey: %s", self.config.hotkey)
+        self._logger.info("Model: %s", self.config.model)
+        self._logger.info("Audio device: %s", self.config.audio_device or "system default")
+
+        # Load the model in the background so the first dictation doesn't pay for it
+        threading.Thread(
+            target=self._warmup_transcriber, args=(self.transcriber,), daemon=True
+        ).start()
 
     def change_hotkey(self, new_hotkey: str) -> None:
         """Change the hotkey while running (hot-reload).
@@ -107,41 +147,77 @@ class Hanasu:
         Raises:
             HotkeyParseError: If the hotkey string is invalid.
         """
-        # Stop old listener
-        self.hotkey_listener.stop()
+        self._apply_hotkey(new_hotkey)
 
-        # Create new listener (will raise HotkeyParseError if invalid)
-        self.hotkey_listener = HotkeyListener(
-            hotkey=new_hotkey,
-            on_press=self._on_hotkey_press,
-            on_release=self._on_hotkey_release,
-        )
+    def _apply_hotkey(self, new_hotkey: str) -> bool:
+        """Swap the hotkey listener, save config, and update the menu bar.
 
-        # Update config
-        self.config.hotkey = new_hotkey
-        save_config(self.config, self.config_dir)
+        Shared by change_hotkey and the menu bar handler. The new listener is
+        built (which parses the hotkey) before the old one is touched, so an
+        invalid hotkey raises with the old listener still running.
 
-        # Start new listener
-        self.hotkey_listener.start()
+        Args:
+            new_hotkey: New hotkey string.
 
-        # Update menu bar display
-        if self._menubar_app:
-            self._menubar_app.setHotkey_(new_hotkey)
+        Returns:
+            True if the hotkey changed, False if it was already the current one.
 
-        self._logger.info(f"Hotkey changed to: {new_hotkey}")
+        Raises:
+            HotkeyParseError: If the hotkey string is invalid.
+        """
+        with self._hotkey_lock:
+            # No-op if same hotkey - avoids reinstalling the event tap and rewriting config
+            if new_hotkey == self.config.hotkey:
+                return False
+
+            self._logger.debug("Changing hotkey to: %s", new_hotkey)
+
+            # Build the new listener first; this only parses the hotkey (raising
+            # if it's invalid) - the event tap isn't installed until start()
+            new_listener = HotkeyListener(
+                hotkey=new_hotkey,
+                on_press=self._on_hotkey_press,
+                on_release=self._on_hotkey_release,
+            )
+
+            # Stop any in-progress recording; the old listener won't see the release
+            if self._recording:
+                self._recording = False
+                self.recorder.discard()
+                if self._menubar_app:
+                    self._menubar_app.setRecording_(False)
+                self._logger.debug("Stopped recording due to hotkey change")
+
+            # New listener is valid, now update config
+            self.config.hotkey = new_hotkey
+            save_config(self.config, self.config_dir)
+
+            # Switch to new listener
+            self.hotkey_listener.stop()
+            self.hotkey_listener = new_listener
+            self.hotkey_listener.start()
+
+            # Update menu bar display
+            if self._menubar_app:
+                self._menubar_app.setHotkey_(new_hotkey)
+
+            self._logger.info("Hotkey changed to: %s", new_hotkey)
+            return True
 
     def change_model(self, new_model: str) -> None:
         """Change the whisper model (hot-swap).
 
-        Downloads the model if not cached, then creates a new Transcriber.
-        Runs in a background thread to avoid blocking the UI.
+        Downloads the model if not cached, then creates and loads a new
+        Transcriber. If the new model can't be downloaded or loaded, the
+        current one stays in use. Runs in a background thread to avoid
+        blocking the UI.
 
         Args:
             new_model: Model size (tiny, base, small, medium, large).
         """
         # Validate model
         if new_model not in VALID_MODELS:
-            self._logger.warning(f"Invalid model: {new_model}")
+            self._logger.warning("Invalid model: %s", new_model)
             return
 
         # No-op if same model
@@ -154,55 +230,75 @@ class Hanasu:
             return
 
         # Prevent concurrent model changes
-        if self._model_change_in_progress:
-            self._logger.debug("Model change already in progress")
-            return
-
-        self._model_change_in_progress = True
+        with self._in_progress_lock:
+            if self._model_change_in_progress:
+                self._logger.debug("Model change already in progress")
+                return
+            self._model_change_in_progress = True
 
         def do_change():
             try:
-                # Download if not cached
-                if not is_model_cached(new_model):
-                    if self._menubar_app:
-                        self._menubar_app.setModelDownloading_(new_model, True)
-                    try:
+                from hanasu.transcriber import Transcriber
+
+                # Show the download in the menu if the weights aren't cached yet.
+                # mlx-whisper models are fetched by download_model; faster-whisper
+                # fetches its own while loading, so the warmup is covered too.
+                needs_download = not is_model_cached(new_model, self.config.backend)
+                if needs_download and self._menubar_app:
+                    self._menubar_app.setModelDownloading_(new_model, True)
+                try:
+                    if needs_download and self.config.backend == "mlx":
                         download_model(new_model)
-                    finally:
+
+                    # Load the new model before swapping it in, so a model that
+                    # fails to load leaves the old transcriber and config in place.
+                    # mlx-whisper only keeps one model loaded, so this evicts the
+                    # old one (a dictation during the switch reloads it); a
+                    # faster-whisper transcriber holds its own model.
+                    transcriber = Transcriber(
+                        model=new_model,
+                        language=self.config.language,
+                        backend=self.config.backend,
+                    )
+                    transcriber.warmup()
+                except Exception as e:
+                    self._logger.error(
+                        "Failed to load model %s, keeping %s: %s", new_model, self.config.model, e
+                    )
+                    return
+                finally:
+                    if needs_download:
+                        invalidate_model_cache()
                         if self._menubar_app:
                             self._menubar_app.setModelDownloading_(new_model, False)
-
-                # Create new transcriber
-                self.transcriber = Transcriber(
-                    model=new_model,
-                    language=self.config.language,
-                )
+                self.transcriber = transcriber
 
                 # Update config
-                self.config = Config(
-                    hotkey=self.config.hotkey,
-                    model=new_model,
-                    language=self.config.language,
-                    audio_device=self.config.audio_device,
-                    debug=self.config.debug,
-                    clear_clipboard=self.config.clear_clipboard,
-                    last_output_dir=self.config.last_output_dir,
-                )
+                self.config.model = new_model
                 save_config(self.config, self.config_dir)
 
-                # Update menu bar
+                # Update menu bar (this also refreshes the model items, on the main thread)
                 if self._menubar_app:
                     self._menubar_app.setCurrentModel_(new_model)
-                    self._menubar_app.refreshModelStates()
 
-                self._logger.info(f"Model changed to: {new_model}")
+                self._logger.info("Model changed to: %s", new_model)
             finally:
                 self._model_change_in_progress = False
 
         threading.Thread(target=do_change, daemon=True).start()
 
+    def _warmup_transcriber(self, transcriber: "Transcriber") -> None:
+        """Load the transcriber's model, logging rather than raising on failure."""
+        try:
+            transcriber.warmup()
+            self._logger.debug("Model warmed up: %s", transcriber.model)
+        except Exception as e:
+            self._logger.warning("Model warmup failed: %s", e)
+
     def run(self) -> None:
         """Start the daemon and listen for hotkey."""
+        from hanasu.menubar import run_menubar_app, start_app_loop
+
         self._logger.debug("Setting up menu bar...")
         print(f"Hanasu v{__version__} running...")
         print(f"Hotkey: {self.config.hotkey}")
@@ -218,7 +314,8 @@ class Hanasu:
             on_model_change=self._on_model_change,
             version=__version__,
             current_model=self.config.model,
-            is_model_cached=is_model_cached,
+            is_model_cached=functools.partial(is_model_cached, backend=self.config.backend),
+            invalidate_model_cache=invalidate_model_cache,
         )
 
         self._logger.debug("Menu bar ready")
@@ -248,20 +345,21 @@ class Hanasu:
                 self._menubar_app.setUpdateStatus_(status)
 
             if status.update_available:
-                self._logger.info(f"Update available: v{status.latest_version}")
+                self._logger.info("Update available: v%s", status.latest_version)
             elif status.checked:
                 self._logger.debug("Up to date")
             else:
                 self._logger.debug("Could not check for updates")
         except Exception as e:
-            self._logger.error(f"Error checking for updates: {e}")
+            self._logger.error("Error checking for updates: %s", e)
 
     def _on_update(self) -> None:
         """Handle update request from menu bar."""
         # Prevent multiple concurrent updates
-        if getattr(self, "_update_in_progress", False):
-            return
-        self._update_in_progress = True
+        with self._in_progress_lock:
+            if self._update_in_progress:
+                return
+            self._update_in_progress = True
 
         if self._menubar_app:
             self._menubar_app.setUpdateInProgress()
@@ -269,11 +367,11 @@ class Hanasu:
         # Run update in background thread
         def do_update():
             try:
-                run_update()
+                run_update(backend=self.config.backend)
                 if self._menubar_app:
                     self._menubar_app.setUpdateComplete()
             except Exception as e:
-                self._logger.error(f"Update failed: {e}")
+                self._logger.error("Update failed: %s", e)
                 if self._menubar_app:
                     self._menubar_app.setUpdateFailed()
             finally:
@@ -293,7 +391,10 @@ class Hanasu:
     def _on_quit(self) -> None:
         """Handle quit from menu bar."""
         self._logger.info("Shutting down...")
+        self._quitting = True
         self.hotkey_listener.stop()
+        # Cancels a file transcription in progress rather than waiting for it
+        self._transcribe_worker.stop()
 
     def _on_hotkey_change(self, new_hotkey: str) -> None:
         """Handle hotkey change from menu bar.
@@ -306,55 +407,14 @@ class Hanasu:
             self._logger.error("Hotkey cannot be empty")
             return
 
-        self._logger.debug(f"Changing hotkey to: {new_hotkey}")
-
-        # Stop any in-progress recording before changing hotkey
-        if self._recording:
-            self._recording = False
-            self.recorder.stop()
-            if self._menubar_app:
-                self._menubar_app.setRecording_(False)
-            self._logger.debug("Stopped recording due to hotkey change")
-
-        # Stop old listener before creating new one
-        self.hotkey_listener.stop()
-
-        # Try to create new listener before saving config
         try:
-            new_listener = HotkeyListener(
-                hotkey=new_hotkey,
-                on_press=self._on_hotkey_press,
-                on_release=self._on_hotkey_release,
-            )
+            changed = self._apply_hotkey(new_hotkey)
         except Exception as e:
-            # Restore old listener if new hotkey is invalid
             print(f"Error: Invalid hotkey '{new_hotkey}': {e}")
-            self.hotkey_listener.start()
             return
 
-        # New listener is valid, now update config
-        self.config = Config(
-            hotkey=new_hotkey,
-            model=self.config.model,
-            language=self.config.language,
-            audio_device=self.config.audio_device,
-            debug=self.config.debug,
-            clear_clipboard=self.config.clear_clipboard,
-            last_output_dir=self.config.last_output_dir,
-        )
-
-        # Save to file
-        save_config(self.config, self.config_dir)
-
-        # Switch to new listener
-        self.hotkey_listener = new_listener
-        self.hotkey_listener.start()
-
-        # Update menu bar display
-        if self._menubar_app:
-            self._menubar_app.setHotkey_(new_hotkey)
-
-        print(f"Hotkey changed to: {new_hotkey}")
+        if changed:
+            print(f"Hotkey changed to: {new_hotkey}")
 
     def _on_hotkey_press(self) -> None:
         """Called when hotkey is pressed - start recording."""
@@ -377,39 +437,56 @@ class Hanasu:
             pass
 
         self._recording = False
-        audio = self.recorder.stop()
+
+        # Check length before stopping so accidental taps are dropped without
+        # concatenating the recorded chunks
+        sample_count = self.recorder.sample_count()
+        if sample_count < MIN_RECORDING_SAMPLES:
+            self.recorder.discard()
+        else:
+            audio = self.recorder.stop()
 
         # Update menu bar to show idle state
         if self._menubar_app:
             self._menubar_app.setRecording_(False)
 
-        self._logger.debug(f"Recording stopped. Audio length: {len(audio)} samples")
+        self._logger.debug("Recording stopped. Audio length: %d samples", sample_count)
 
-        if len(audio) == 0:
+        if sample_count == 0:
             self._logger.debug("No audio recorded")
             return
 
-        # Check minimum recording length (0.5 seconds at 16kHz)
-        if len(audio) < 8000:
+        if sample_count < MIN_RECORDING_SAMPLES:
             self._logger.debug("Recording too short, ignoring")
             return
 
-        self._logger.debug("Transcribing...")
+        self._dictation_executor.submit(self._transcribe_and_inject, audio)
+
+    def _transcribe_and_inject(self, audio: "np.ndarray") -> None:
+        """Transcribe a dictation and paste it (runs on the dictation worker)."""
+        try:
+            self._logger.debug("Transcribing...")
 
-        text = self.transcriber.transcribe(audio, dictionary=self.dictionary)
+            text = self.transcriber.transcribe(audio, dictionary=self.dictionary)
 
-        self._logger.debug(f"Transcribed: {text}")
+            self._logger.debug("Transcribed: %s", text)
 
-        if text:
-            inject_text(text, clear_after=self.config.clear_clipboard)
+            if text:
+                inject_text(
+                    text,
+                    clear_after=self.config.clear_clipboard,
+                    modifiers_released=self.hotkey_listener.modifiers_released,
+                )
+        except Exception:
+            # The executor would otherwise hold the exception in an unread future
+            self._logger.exception("Dictation failed")
 
     def _on_transcribe_file(self) -> None:
         """Handle file transcription request from menu."""
-        # Audio/video extensions
-        extensions = ["mp3", "wav", "m4a", "mp4", "mov", "mkv", "avi", "webm"]
+        from hanasu.menubar import open_file_picker, save_file_picker, show_format_picker
 
         # Step 1: Select input file
-        input_path = open_file_picker(allowed_extensions=extensions)
+        input_path = open_file_picker(allowed_extensions=FILE_PICKER_EXTENSIONS)
         if not input_path:
             return
 
@@ -429,9 +506,11 @@ class Hanasu:
         if not output_path:
             return
 
-        # Step 4: Update last output dir
-        self.config.last_output_dir = str(Path(output_path).parent)
-        save_config(self.config, self.config_dir)
+        # Step 4: Update last output dir (only written when it changed)
+        output_dir = str(Path(output_path).parent)
+        if output_dir != self.config.last_output_dir:
+            self.config.last_output_dir = output_dir
+            save_config(self.config, self.config_dir)
 
         # Step 5: Run transcription in background
         threading.Thread(
@@ -441,11 +520,46 @@ class Hanasu:
         ).start()
 
     def _run_file_transcription(self, input_path: str, output_path: str, use_vtt: bool) -> None:
-        """Run file transcription via subprocess to isolate Metal GPU context.
+        """Run file transcription in a worker process to isolate Metal GPU context.
 
-        Using subprocess instead of calling mlx_whisper directly avoids Metal/MLX
+        Using a subprocess instead of calling mlx_whisper directly avoids Metal/MLX
         thread-safety issues that cause crashes with large files when transcription
         runs in a background thread while the macOS event loop runs on main thread.
+        The worker process is kept alive between files so the model only loads once.
+
+        Args:
+            input_path: Path to audio/video file.
+            output_path: Path for output file.
+            use_vtt: True to output VTT format, False for plain text.
+        """
+        try:
+            error = self._transcribe_worker.transcribe(
+                input_path,
+                output_path,
+                use_vtt,
+                model=self.config.model,
+                backend=self.config.backend,
+                timeout=FILE_TRANSCRIPTION_TIMEOUT,
+            )
+        except WorkerUnavailableError as e:
+            self._logger.warning("Transcription worker unavailable, using one-off process: %s", e)
+            self._run_file_transcription_subprocess(input_path, output_path, use_vtt)
+            return
+        except subprocess.TimeoutExpired:
+            self._show_transcription_error("Transcription timed out (exceeded 10 minutes)")
+            return
+        except Exception as e:
+            self._show_transcription_error(str(e))
+            return
+
+        # A job cancelled by quitting isn't an error worth reporting
+        if error and not self._quitting:
+            self._show_transcription_error(error)
+
+    def _run_file_transcription_subprocess(
+        self, input_path: str, output_path: str, use_vtt: bool
+    ) -> None:
+        """Run file transcription in a one-off `hanasu transcribe` subprocess.
 
         Args:
             input_path: Path to audio/video file.
@@ -455,26 +569,45 @@ class Hanasu:
         # Build command using current Python interpreter
         cmd = [sys.executable, "-m", "hanasu", "transcribe", input_path, "-o", output_path]
 
-        # Add model flag with configured model
-        cmd.extend(["--model", self.config.model])
+        # Add model and backend flags from config
+        cmd.extend(["--model", self.config.model, "--backend", self.config.backend])
 
         # Add VTT flag if requested
         if use_vtt:
             cmd.append("--vtt")
 
         try:
-            result = subprocess.run(
+            # Output goes to output_path; only stderr is kept for error messages
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=600,  # 10 minute timeout for large files
             )
-            if result.returncode != 0:
-                self._show_transcription_error(result.stderr or "Transcription failed")
-        except subprocess.TimeoutExpired:
-            self._show_transcription_error("Transcription timed out (exceeded 10 minutes)")
         except Exception as e:
             self._show_transcription_error(str(e))
+            return
+
+        # Wait in short slices so quitting can cancel the job. communicate() keeps
+        # draining stderr between slices, so a chatty child can't fill the pipe.
+        deadline = time.monotonic() + FILE_TRANSCRIPTION_TIMEOUT
+        while True:
+            try:
+                _, stderr = process.communicate(timeout=TRANSCRIPTION_POLL_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                if self._quitting:
+                    process.kill()
+                    process.communicate()
+                    return
+                if time.monotonic() >= deadline:
+                    process.kill()
+                    process.communicate()
+                    self._show_transcription_error("Transcription timed out (exceeded 10 minutes)")
+                    return
+
+        if process.returncode != 0:
+            self._show_transcription_error(stderr or "Transcription failed")
 
     def _show_transcription_error(self, message: str) -> None:
         """Show error dialog on main thread.
@@ -504,55 +637,85 @@ def download_model(model: str = "small") -> None:
     """
     import mlx_whisper
 
-    from hanasu.transcriber import MODEL_PATHS
+    from hanasu.transcriber import MODEL_PATHS, SILENCE_1S
 
     model_path = MODEL_PATHS.get(model, MODEL_PATHS["small"])
 
-    # Check if model is already cached
-    cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-    model_cache_name = f"models--{model_path.replace('/', '--')}"
-    model_cached = (cache_dir / model_cache_name).exists()
+    # Nothing to do if the files mlx-whisper loads are already in the hub cache;
+    # the dummy transcription below would load the whole model just to confirm it
+    if _model_files_cached(model_path):
+        print(f"Model {model} already cached")
+        return
 
-    if model_cached:
-        print(f"Model {model} already cached, verifying...")
-    else:
-        print(f"Downloading {model} model from {model_path}...")
-
-    # Trigger download/verification by doing a dummy transcription
-    import numpy as np
-
-    dummy_audio = np.zeros(16000, dtype=np.float32)  # 1 second of silence
+    print(f"Downloading {model} model from {model_path}...")
 
+    # Trigger download by doing a dummy transcription
     try:
         mlx_whisper.transcribe(
-            dummy_audio,
+            SILENCE_1S,
             path_or_hf_repo=model_path,
             language="en",
         )
-        if model_cached:
-            print("Model verified!")
-        else:
-            print("Model downloaded successfully!")
+        print("Model downloaded successfully!")
     except Exception as e:
         print(f"Warning: Could not fully verify model: {e}")
         print("Model files should be cached for future use.")
+    finally:
+        # Files may have landed in the hub cache either way
+        invalidate_model_cache()
+
+
+def _model_files_cached(model_path: str) -> bool:
+    """Check whether the files mlx-whisper loads for a model are in the hub cache.
+
+    Unlike is_model_cached(), this looks for the config and weights themselves,
+    so an interrupted download isn't mistaken for a complete one.
+    """
+    from huggingface_hub import try_to_load_from_cache
+
+    def cached(filename: str) -> bool:
+        # Returns a path when cached, otherwise None or a "known missing" sentinel
+        return isinstance(try_to_load_from_cache(model_path, filename), str)
+
+    # mlx-whisper loads weights.safetensors, or weights.npz in older conversions
+    return cached("config.json") and (cached("weights.safetensors") or cached("weights.npz"))
 
 
-def is_model_cached(model: str) -> bool:
+def is_model_cached(model: str, backend: str = "mlx") -> bool:
     """Check if a whisper model is cached locally.
 
+    Results are memoized since the menu bar asks for every model each time
+    it rebuilds the model menu. Call invalidate_model_cache() after anything
+    that may add files to the HuggingFace cache; the menu bar also calls it
+    each time the model submenu opens.
+
     Args:
         model: Model size (tiny, base, small, medium, large).
+        backend: Transcription engine whose copy of the model to look for.
 
     Returns:
         True if model is cached, False otherwise.
     """
-    from hanasu.transcriber import MODEL_PATHS
+    return _is_model_cached(model, backend)
 
-    model_path = MODEL_PATHS.get(model, MODEL_PATHS["small"])
-    cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-    model_cache_name = f"models--{model_path.replace('/', '--')}"
-    return (cache_dir / model_cache_name).exists()
+
+@functools.lru_cache(maxsize=32)
+def _is_model_cached(model: str, backend: str) -> bool:
+    return _model_cache_dir(model, backend).exists()
+
+
+def _model_cache_dir(model: str, backend: str = "mlx") -> Path:
+    """Return the HuggingFace hub cache directory for a model (small if unknown)."""
+    from hanasu.transcriber import FASTER_WHISPER_CACHE_NAMES, MODEL_CACHE_NAMES
+
+    cache_names = FASTER_WHISPER_CACHE_NAMES if backend == "faster-whisper" else MODEL_CACHE_NAMES
+    cache_name = cache_names.get(model, cache_names["small"])
+    return Path.home() / ".cache" / "huggingface" / "hub" / cache_name
+
+
+def invalidate_model_cache() -> None:
+    """Forget memoized is_model_cached() results so the next call re-checks disk."""
+    _is_model_cached.cache_clear()
 
 
 def find_uv_binary() -> Path:
@@ -592,11 +755,15 @@ def find_uv_binary() -> Path:
     )
 
 
-def run_update() -> None:
+def run_update(backend: str = "mlx") -> None:
     """Update Hanasu to the latest version.
 
     Pulls latest code from git and syncs dependencies.
 
+    Args:
+        backend: Configured transcription backend. The faster-whisper extra is
+            kept installed when it's "faster-whisper" or already importable.
+
     Raises:
         FileNotFoundError: If source directory or uv binary doesn't exist.
         RuntimeError: If git or uv commands fail.
@@ -624,7 +791,8 @@ def run_update() -> None:
     subprocess.run(
         ["git", "checkout", "--", "uv.lock"],
         cwd=source_dir,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
     # Pull latest code
@@ -641,10 +809,17 @@ def run_update() -> None:
 
     # Sync dependencies using explicit path to uv
     print("Syncing dependencies...")
+    # An exact sync removes anything not requested, so ask for the
+    # faster-whisper extra explicitly when it's in use
+    sync_command = [str(uv_path), "sync"]
+    if backend == "faster-whisper" or importlib.util.find_spec("faster_whisper") is not None:
+        sync_command += ["--extra", "faster-whisper"]
+    # Only stderr is needed (for the error message); don't buffer sync output
     result = subprocess.run(
-        [str(uv_path), "sync"],
+        sync_command,
         cwd=source_dir,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
     )
     if result.returncode != 0:
@@ -675,6 +850,8 @@ def run_setup(config_dir: Path = DEFAULT_CONFIG_DIR) -> None:
     Args:
         config_dir: Path to configuration directory.
     """
+    from hanasu.recorder import list_input_devices
+
     print("Hanasu Setup")
     print("=" * 40)
     print()
@@ -683,21 +860,24 @@ def run_setup(config_dir: Path = DEFAULT_CONFIG_DIR) -> None:
     config_dir.mkdir(parents=True, exist_ok=True)
     print(f"Config directory: {config_dir}")
 
-    # Create default config
+    # Create default config ("x" mode creates the file only if it doesn't exist,
+    # without a separate exists() check)
     config_file = config_dir / "config.json"
-    if not config_file.exists():
-        with open(config_file, "w") as f:
-            json.dump(DEFAULT_CONFIG, f, indent=2)
+    try:
+        with open(config_file, "x") as f:
+            f.write(json.dumps(DEFAULT_CONFIG, indent=2))
         print("Created default config.json")
-    else:
+    except FileExistsError:
         print("Config file already exists")
 
     # Create empty dictionary
     dict_file = config_dir / "dictionary.json"
-    if not dict_file.exists():
-        with open(dict_file, "w") as f:
-            json.dump({"terms": [], "replacements": {}}, f, indent=2)
+    try:
+        with open(dict_file, "x") as f:
+            f.write(json.dumps({"terms": [], "replacements": {}}, indent=2))
         print("Created empty dictionary.json")
+    except FileExistsError:
+        pass
 
     print()
 
@@ -746,19 +926,32 @@ def get_status(config_dir: Path = DEFAULT_CONFIG_DIR) -> dict:
     Returns:
         Dict with status information.
     """
-    status = {
-        "version": __version__,
-        "config_dir": str(config_dir),
-        "config_exists": (config_dir / "config.json").exists(),
-        "dictionary_exists": (config_dir / "dictionary.json").exists(),
-        "audio_devices": list_input_devices(),
-        "accessibility": check_accessibility(),
-    }
+
+    def audio_devices() -> list[str]:
+        from hanasu.recorder import list_input_devices
+
+        return list_input_devices()
+
+    # Loading sounddevice/enumerating devices and loading Quartz are the slow
+    # parts of --status and don't depend on each other, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        devices_future = executor.submit(audio_devices)
+        accessibility_future = executor.submit(check_accessibility)
+
+        status = {
+            "version": __version__,
+            "config_dir": str(config_dir),
+            "config_exists": (config_dir / "config.json").exists(),
+            "dictionary_exists": (config_dir / "dictionary.json").exists(),
+            "audio_devices": devices_future.result(),
+            "accessibility": accessibility_future.result(),
+        }
 
     if status["config_exists"]:
         config = load_config(config_dir)
         status["hotkey"] = config.hotkey
         status["model"] = config.model
+        status["backend"] = config.backend
         status["audio_device"] = config.audio_device
         status["debug"] = config.debug
         status["clear_clipboard"] = config.clear_clipboard
@@ -785,6 +978,7 @@ def print_status(config_dir: Path = DEFAULT_CONFIG_DIR) -> None:
         print("Configuration:")
         print(f"  Hotkey: {status['hotkey']}")
         print(f"  Model: {status['model']}")
+        print(f"  Backend: {status['backend']}")
         print(f"  Audio device: {status.get('audio_device') or 'system default'}")
         print(f"  Debug mode: {status['debug']}")
         print(f"  Clear clipboard: {status['clear_clipboard']}")
@@ -829,8 +1023,6 @@ def run_doctor() -> None:
     if manifest_file.exists():
         print(f"  ✓ Install manifest: {manifest_file}")
         try:
-            import json
-
             with open(manifest_file) as f:
                 manifest = json.load(f)
             print(f"    Installed: {manifest.get('installed_at', 'unknown')}")
@@ -863,12 +1055,15 @@ def run_doctor() -> None:
         launcher = app_path / "Contents" / "MacOS" / "hanasu"
         if launcher.exists():
             try:
-                content = launcher.read_text()
-                if str(install_dir) in content:
+                # The install path is set near the top of the launcher script,
+                # so only read (and don't decode) its head
+                with open(launcher, "rb") as f:
+                    head = f.read(LAUNCHER_HEAD_BYTES)
+                if str(install_dir).encode() in head:
                     print("    Launcher: OK")
                 else:
                     warnings.append("App launcher may point to wrong location")
-            except Exception:
+            except OSError:
                 pass
     else:
         issues.append(f"Application bundle missing: {app_path}")
@@ -928,7 +1123,7 @@ def run_doctor() -> None:
         )
 
 
-VIDEO_EXTENSIONS = {".mp4", ".mov", ".mkv", ".avi", ".webm", ".m4v", ".flv", ".wmv"}
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".mkv", ".avi", ".webm", ".m4v", ".flv", ".wmv"})
 
 
 def is_video_file(file_path: str | Path) -> bool:
@@ -940,17 +1135,28 @@ def is_video_file(file_path: str | Path) -> bool:
     Returns:
         True if file is a video file, False otherwise.
     """
-    return Path(file_path).suffix.lower() in VIDEO_EXTENSIONS
+    # splitext matches Path.suffix without building a Path
+    return os.path.splitext(file_path)[1].lower() in VIDEO_EXTENSIONS
 
 
 def find_ffmpeg() -> str | None:
     """Find ffmpeg binary, checking common macOS locations.
 
     macOS GUI apps don't inherit shell PATH, so we check Homebrew paths first.
+    A found path is remembered for the life of the process; a miss isn't, so
+    installing ffmpeg while the app is running still works.
 
     Returns:
         Path to ffmpeg binary, or None if not found.
     """
+    path = _find_ffmpeg()
+    if path is None:
+        _find_ffmpeg.cache_clear()
+    return path
+
+
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg() -> str | None:
     # Check Homebrew paths first (GUI apps don't have shell PATH)
     homebrew_paths = [
         "/opt/homebrew/bin/ffmpeg",  # Apple Silicon
@@ -965,19 +1171,22 @@ def find_ffmpeg() -> str | None:
     return shutil.which("ffmpeg")
 
 
-def extract_audio_from_video(video_path: str) -> str:
-    """Extract audio from a video file to a temporary WAV file.
+def extract_audio_from_video(video_path: str) -> "np.ndarray":
+    """Decode the audio track of a video file into memory.
+
+    ffmpeg writes raw 16kHz mono PCM to a pipe, so nothing is written to disk
+    and mlx-whisper doesn't have to run ffmpeg a second time to read it back.
 
     Args:
         video_path: Path to video file.
 
     Returns:
-        Path to temporary WAV file.
+        Float32 audio samples in [-1, 1] at 16kHz.
 
     Raises:
         RuntimeError: If ffmpeg fails or is not installed.
     """
-    import tempfile
+    import numpy as np
 
     # Find ffmpeg binary (macOS GUI apps don't have shell PATH)
     ffmpeg_path = find_ffmpeg()
@@ -987,44 +1196,53 @@ def extract_audio_from_video(video_path: str) -> str:
             "Install with: brew install ffmpeg"
         )
 
-    # Create temp file for extracted audio
-    temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    temp_path = temp_file.name
-    temp_file.close()
-
     try:
         result = subprocess.run(
             [
                 ffmpeg_path,
+                "-nostdin",  # Never read keyboard commands from stdin
+                "-loglevel",
+                "error",  # stderr only holds what a failure message needs
+                "-threads",
+                "0",  # Decode with as many threads as there are cores
+                "-filter_threads",
+                "0",  # Likewise for the resample/downmix filters
                 "-i",
                 video_path,
                 "-vn",  # No video
+                "-f",
+                "s16le",  # Raw samples, no container
                 "-acodec",
-                "pcm_s16le",  # WAV codec
+                "pcm_s16le",
                 "-ar",
                 "16000",  # 16kHz sample rate (whisper input)
                 "-ac",
                 "1",  # Mono
-                "-y",  # Overwrite
-                temp_path,
+                "pipe:1",
             ],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
-            text=True,
         )
     except FileNotFoundError as err:
-        # Clean up temp file before raising
-        Path(temp_path).unlink()
         raise RuntimeError(
             "ffmpeg not found. Please install ffmpeg to transcribe video files.\n"
             "Install with: brew install ffmpeg"
         ) from err
 
     if result.returncode != 0:
-        # Clean up temp file before raising
-        Path(temp_path).unlink()
-        raise RuntimeError(f"ffmpeg failed to extract audio: {result.stderr}")
+        stderr = result.stderr.decode(errors="replace")
+        raise RuntimeError(f"ffmpeg failed to extract audio: {stderr}")
 
-    return temp_path
+    audio = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32)
+    audio /= 32768.0
+    return audio
+
+
+def _vtt_timestamp(seconds: float) -> str:
+    """Format seconds as a VTT cue timestamp (HH:MM:SS.mmm)."""
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
 
 
 def run_transcribe(
@@ -1033,6 +1251,9 @@ def run_transcribe(
     use_large: bool = False,
     model: str = "small",
     output_file: str | None = None,
+    backend: str = "mlx",
+    batch_size: int | None = None,
+    vad_filter: bool = False,
 ) -> None:
     """Transcribe an audio or video file to text or VTT format.
 
@@ -1042,49 +1263,52 @@ def run_transcribe(
         use_large: Use large model for better accuracy (overrides --model).
         model: Model size to use (tiny, base, small, medium, large).
         output_file: Path to write output to. If None, writes to stdout.
+        backend: "mlx" for mlx-whisper, "faster-whisper" for faster-whisper.
+        batch_size: Chunks to decode in parallel (faster-whisper only).
+        vad_filter: Skip silent stretches with voice activity detection
+            (faster-whisper only).
     """
-    import mlx_whisper
-
-    from hanasu.transcriber import MODEL_PATHS
-
     # --large flag overrides --model for backward compatibility
     model_key = "large" if use_large else model
-    model_path = MODEL_PATHS.get(model_key, MODEL_PATHS["small"])
 
-    # Check if input is a video file
-    temp_audio_path = None
-    if is_video_file(audio_file):
-        temp_audio_path = extract_audio_from_video(audio_file)
-        transcribe_path = temp_audio_path
+    if backend == "faster-whisper":
+        from hanasu.transcriber import load_faster_whisper_model, transcribe_with_faster_whisper
+
+        # faster-whisper decodes audio and video containers itself (PyAV, in
+        # memory), so no ffmpeg is needed
+        result = transcribe_with_faster_whisper(
+            load_faster_whisper_model(model_key),
+            audio_file,
+            batch_size=batch_size,
+            vad_filter=vad_filter,
+        )
     else:
-        transcribe_path = audio_file
+        import mlx_whisper
 
-    try:
-        result = mlx_whisper.transcribe(transcribe_path, path_or_hf_repo=model_path)
-
-        def write_output(out: typing.TextIO) -> None:
-            if use_vtt:
-                out.write("WEBVTT\n\n")
-                for seg in result["segments"]:
-                    start = seg["start"]
-                    end = seg["end"]
-                    sh, sm, ss = int(start // 3600), int((start % 3600) // 60), start % 60
-                    eh, em, es = int(end // 3600), int((end % 3600) // 60), end % 60
-                    out.write(f"{sh:02d}:{sm:02d}:{ss:06.3f} --> {eh:02d}:{em:02d}:{es:06.3f}\n")
-                    out.write(seg["text"].strip() + "\n")
-                    out.write("\n")
-            else:
-                out.write(result["text"] + "\n")
+        from hanasu.transcriber import MODEL_PATHS
 
-        if output_file:
-            with open(output_file, "w") as f:
-                write_output(f)
-        else:
-            write_output(sys.stdout)
-    finally:
-        # Clean up temp file if we created one
-        if temp_audio_path and Path(temp_audio_path).exists():
-            Path(temp_audio_path).unlink()
+        # Video files are decoded to samples first; audio files go to mlx-whisper as-is
+        audio = extract_audio_from_video(audio_file) if is_video_file(audio_file) else audio_file
+
+        model_path = MODEL_PATHS.get(model_key, MODEL_PATHS["small"])
+        result = mlx_whisper.transcribe(audio, path_or_hf_repo=model_path)
+
+    if use_vtt:
+        output = "WEBVTT\n\n" + "".join(
+            f"{_vtt_timestamp(seg['start'])} --> {_vtt_timestamp(seg['end'])}\n"
+            f"{seg['text'].strip()}\n\n"
+            for seg in result["segments"]
+        )
+    else:
+        output = result["text"] + "\n"
+
+    # Written in one go - a line-buffered terminal would flush once per line
+    if output_file:
+        with open(output_file, "w") as f:
+            f.write(output)
+    else:
+        sys.stdout.write(output)
+        sys.stdout.flush()
 
 
 def main() -> None:
@@ -1140,6 +1364,24 @@ def main() -> None:
         default="small",
         help="Model size to use (default: small)",
     )
+    transcribe_parser.add_argument(
+        "--backend",
+        type=str,
+        choices=sorted(VALID_BACKENDS),
+        default="mlx",
+        help="Transcription engine to use (default: mlx)",
+    )
+    transcribe_parser.add_argument(
+        "--batch-size",
+        type=int,
+        metavar="N",
+        help="Decode N 30s chunks in parallel (faster-whisper only)",
+    )
+    transcribe_parser.add_argument(
+        "--vad-filter",
+        action="store_true",
+        help="Skip silence using voice activity detection (faster-whisper only)",
+    )
     transcribe_parser.add_argument(
         "-o",
         "--output",
@@ -1154,19 +1396,26 @@ def main() -> None:
         run_setup(args.config_dir)
     elif args.command == "update":
         try:
-            run_update()
+            run_update(backend=load_config(args.config_dir).backend)
         except (FileNotFoundError, RuntimeError) as e:
             print(f"Error: {e}")
             sys.exit(1)
     elif args.command == "doctor":
         run_doctor()
     elif args.command == "transcribe":
+        if args.backend != "faster-whisper" and (args.batch_size or args.vad_filter):
+            parser.error("--batch-size and --vad-filter require --backend faster-whisper")
+        if args.batch_size is not None and args.batch_size < 1:
+            parser.error("--batch-size must be at least 1")
         run_transcribe(
             args.audio_file,
             use_vtt=args.vtt,
             use_large=args.large,
             model=args.model,
             output_file=args.output,
+            backend=args.backend,
+            batch_size=args.batch_size,
+            vad_filter=args.vad_filter,
         )
     elif args.status:
         print_status(args.config_dir)
@@ -1182,7 +1431,7 @@ def main() -> None:
             print("Error: Config not found. Run 'hanasu setup' first.")
             sys.exit(1)
         except Exception as e:
-            logger.exception(f"Fatal error: {e}")
+            logger.exception("Fatal error: %s", e)
             print(f"Error: {e}")
             sys.exit(1)
 
@@ -1,15 +1,18 @@
 """macOS menu bar integration using PyObjC."""
 
 import signal
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 
 import objc
 from AppKit import (
     NSAlert,
+    NSAlertFirstButtonReturn,
+    NSAlertSecondButtonReturn,
     NSApplication,
     NSMenu,
     NSMenuItem,
+    NSModalResponseOK,
     NSOpenPanel,
     NSSavePanel,
     NSStatusBar,
@@ -47,11 +50,18 @@ class MenuBarApp(NSObject):
         self._update_status = None
         self._is_recording = False
         self._hotkey_display = "?"
+        # Last status bar title and update item (title, enabled) applied, so
+        # repeats don't make AppKit redraw
+        self._status_title = None
+        self._update_item_state = None
 
         # Model selection state
         self._current_model = "small"
         self._model_menu_items: dict[str, NSMenuItem] = {}
+        # Last title set on each model item, so unchanged items aren't retitled
+        self._model_titles: dict[str, str] = {}
         self._is_model_cached_fn = None
+        self._invalidate_model_cache_fn = None
         self._downloading_models: set[str] = set()
         self._model_submenu = None
 
@@ -69,8 +79,10 @@ class MenuBarApp(NSObject):
         # Set initial title (microphone emoji)
         self._updateTitle()
 
-        # Create menu
+        # Create menu. Items are enabled/disabled explicitly with setEnabled_,
+        # which AppKit ignores (revalidating every item on open) if autoenabling is on
         menu = NSMenu.alloc().init()
+        menu.setAutoenablesItems_(False)
 
         # Status item (disabled, just for display)
         self._status_menu_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
@@ -137,7 +149,9 @@ class MenuBarApp(NSObject):
             # Microphone when idle
             title = "\U0001f3a4"  # Microphone emoji
 
-        self._status_item.setTitle_(title)
+        if title != self._status_title:
+            self._status_item.setTitle_(title)
+            self._status_title = title
 
     def setRecording_(self, recording: bool):
         """Update recording state.
@@ -145,15 +159,12 @@ class MenuBarApp(NSObject):
         Args:
             recording: True if currently recording.
         """
+        if recording == self._is_recording:
+            return
+
         self._is_recording = recording
         # Schedule UI update on main thread
-        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "updateRecordingState", None, False
-        )
-
-    def updateRecordingState(self):
-        """Update UI for recording state (must be called on main thread)."""
-        self._updateTitle()
+        AppHelper.callAfter(self._updateTitle)
 
     def setHotkey_(self, hotkey: str):
         """Update hotkey display.
@@ -198,8 +209,8 @@ class MenuBarApp(NSObject):
         # Run modal
         response = alert.runModal()
 
-        # Check if OK was clicked (first button = 1000)
-        if response == 1000:
+        # Check if OK was clicked
+        if response == NSAlertFirstButtonReturn:
             new_hotkey = text_field.stringValue().strip()
             if new_hotkey and new_hotkey != self._hotkey_display:
                 # Validate hotkey syntax using parse_hotkey
@@ -223,49 +234,40 @@ class MenuBarApp(NSObject):
         """
         self._update_status = status
         # Schedule UI update on main thread
-        self.performSelectorOnMainThread_withObject_waitUntilDone_("applyUpdateStatus", None, False)
+        AppHelper.callAfter(self.applyUpdateStatus, status)
 
-    def applyUpdateStatus(self):
+    @objc.python_method
+    def applyUpdateStatus(self, status: "UpdateStatus"):
         """Apply update status on main thread."""
-        status = self._update_status
-        if not self._update_menu_item or not status:
+        if not self._update_menu_item:
             return
 
         if not status.checked:
-            self._update_menu_item.setTitle_("Unable to check for updates")
-            self._update_menu_item.setEnabled_(False)
+            self.applyUpdateTitle("Unable to check for updates", False)
         elif status.update_available:
-            self._update_menu_item.setTitle_(f"⬆ Update available ({status.latest_version})")
-            self._update_menu_item.setEnabled_(True)
+            self.applyUpdateTitle(f"⬆ Update available ({status.latest_version})", True)
         else:
-            self._update_menu_item.setTitle_("✓ Up to date")
-            self._update_menu_item.setEnabled_(False)
+            self.applyUpdateTitle("✓ Up to date", False)
 
     def setUpdateInProgress(self):
         """Show update in progress state (thread-safe)."""
-        self._pending_update_title = "⏳ Updating..."
-        self._pending_update_enabled = False
-        self.performSelectorOnMainThread_withObject_waitUntilDone_("applyUpdateTitle", None, False)
+        AppHelper.callAfter(self.applyUpdateTitle, "⏳ Updating...", False)
 
     def setUpdateComplete(self):
         """Show update complete state (thread-safe)."""
-        self._pending_update_title = "✓ Updated! Restart to apply"
-        self._pending_update_enabled = False
-        self.performSelectorOnMainThread_withObject_waitUntilDone_("applyUpdateTitle", None, False)
+        AppHelper.callAfter(self.applyUpdateTitle, "✓ Updated! Restart to apply", False)
 
     def setUpdateFailed(self):
         """Show update failed state (thread-safe)."""
-        self._pending_update_title = "✗ Update failed - Click to retry"
-        self._pending_update_enabled = True
-        self.performSelectorOnMainThread_withObject_waitUntilDone_("applyUpdateTitle", None, False)
-
-    def applyUpdateTitle(self):
-        """Apply pending update title on main thread."""
-        if self._update_menu_item:
-            if hasattr(self, "_pending_update_title"):
-                self._update_menu_item.setTitle_(self._pending_update_title)
-            if hasattr(self, "_pending_update_enabled"):
-                self._update_menu_item.setEnabled_(self._pending_update_enabled)
+        AppHelper.callAfter(self.applyUpdateTitle, "✗ Update failed - Click to retry", True)
+
+    @objc.python_method
+    def applyUpdateTitle(self, title: str, enabled: bool):
+        """Apply update title on main thread."""
+        if self._update_menu_item and (title, enabled) != self._update_item_state:
+            self._update_menu_item.setTitle_(title)
+            self._update_menu_item.setEnabled_(enabled)
+            self._update_item_state = (title, enabled)
 
     def triggerUpdate_(self, sender):
         """Handle update menu item click."""
@@ -289,12 +291,18 @@ class MenuBarApp(NSObject):
         Refreshes model cache states when the model submenu is opened.
         """
         if menu == self._model_submenu:
+            # Cache checks are memoized, but models can be downloaded or deleted
+            # outside the app, so re-check disk once per open
+            if self._invalidate_model_cache_fn:
+                self._invalidate_model_cache_fn()
             self.refreshModelStates()
 
     @objc.python_method
     def _createModelSubmenu(self) -> NSMenu:
         """Create the model selection submenu."""
         submenu = NSMenu.alloc().init()
+        # Downloading models are disabled with setEnabled_ (see setupStatusBar)
+        submenu.setAutoenablesItems_(False)
 
         # Set delegate for menuWillOpen notification
         submenu.setDelegate_(self)
@@ -303,14 +311,14 @@ class MenuBarApp(NSObject):
         model_order = ["tiny", "base", "small", "medium", "large"]
 
         for model in model_order:
-            info = MODEL_INFO.get(model, {"label": model})
-            title = self._formatModelTitle(model, info)
+            title = self._formatModelTitle(model)
 
             item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(title, "selectModel:", "")
             item.setTarget_(self)
             item.setRepresentedObject_(model)
             submenu.addItem_(item)
             self._model_menu_items[model] = item
+            self._model_titles[model] = title
 
         # Store reference for delegate
         self._model_submenu = submenu
@@ -318,12 +326,11 @@ class MenuBarApp(NSObject):
         return submenu
 
     @objc.python_method
-    def _formatModelTitle(self, model: str, info: dict) -> str:
+    def _formatModelTitle(self, model: str) -> str:
         """Format the title for a model menu item.
 
         Args:
             model: Model name (e.g., "small").
-            info: MODEL_INFO dict entry with 'label' etc.
 
         Returns:
             Formatted title like "● ✓ small (244MB, balanced)".
@@ -331,13 +338,15 @@ class MenuBarApp(NSObject):
         is_current = model == self._current_model
         is_cached = self._is_model_cached_fn(model) if self._is_model_cached_fn else False
         is_downloading = model in self._downloading_models
+        # The menu only lists models that have a MODEL_INFO entry
+        label = MODEL_INFO[model]["label"]
 
         if is_downloading:
-            return f"  ⏳ {info.get('label', model)} (downloading...)"
+            return f"  ⏳ {label} (downloading...)"
 
         indicator = "● " if is_current else "  "
         cache_icon = "✓ " if is_cached else "↓ "
-        return f"{indicator}{cache_icon}{info.get('label', model)}"
+        return f"{indicator}{cache_icon}{label}"
 
     def selectModel_(self, sender):
         """Handle model selection from submenu."""
@@ -361,7 +370,7 @@ class MenuBarApp(NSObject):
             alert.addButtonWithTitle_("Cancel")
 
             response = alert.runModal()
-            if response != 1000:  # Cancel clicked
+            if response != NSAlertFirstButtonReturn:  # Cancel clicked
                 return
 
         if self._callbacks.get("on_model_change"):
@@ -373,16 +382,12 @@ class MenuBarApp(NSObject):
         Args:
             model: The new current model name.
         """
-        self._pending_current_model = model
-        self.performSelectorOnMainThread_withObject_waitUntilDone_("applyCurrentModel", None, False)
+        AppHelper.callAfter(self.applyCurrentModel, model)
 
-    def applyCurrentModel(self):
+    @objc.python_method
+    def applyCurrentModel(self, model: str):
         """Apply current model indicator on main thread."""
-        new_model = getattr(self, "_pending_current_model", None)
-        if not new_model:
-            return
-
-        self._current_model = new_model
+        self._current_model = model
         self.refreshModelStates()
 
     @objc.python_method
@@ -393,18 +398,11 @@ class MenuBarApp(NSObject):
             model: Model name.
             downloading: True if download in progress, False when complete.
         """
-        self._pending_download_state = (model, downloading)
-        self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "applyDownloadState", None, False
-        )
+        AppHelper.callAfter(self.applyDownloadState, model, downloading)
 
-    def applyDownloadState(self):
+    @objc.python_method
+    def applyDownloadState(self, model: str, downloading: bool):
         """Apply download state on main thread."""
-        state = getattr(self, "_pending_download_state", None)
-        if not state:
-            return
-        model, downloading = state
-
         if downloading:
             self._downloading_models.add(model)
         else:
@@ -412,19 +410,22 @@ class MenuBarApp(NSObject):
 
         # Update the specific menu item
         if model in self._model_menu_items:
-            item = self._model_menu_items[model]
-            info = MODEL_INFO.get(model, {"label": model})
-            title = self._formatModelTitle(model, info)
-            item.setTitle_(title)
-            item.setEnabled_(not downloading)
+            self._updateModelTitle(model)
+            self._model_menu_items[model].setEnabled_(not downloading)
 
     @objc.python_method
     def refreshModelStates(self):
         """Refresh all model menu item titles based on current state."""
-        for model, item in self._model_menu_items.items():
-            info = MODEL_INFO.get(model, {"label": model})
-            title = self._formatModelTitle(model, info)
-            item.setTitle_(title)
+        for model in self._model_menu_items:
+            self._updateModelTitle(model)
+
+    @objc.python_method
+    def _updateModelTitle(self, model: str):
+        """Retitle a model's menu item, skipping it if the title hasn't changed."""
+        title = self._formatModelTitle(model)
+        if self._model_titles.get(model) != title:
+            self._model_menu_items[model].setTitle_(title)
+            self._model_titles[model] = title
 
 
 def run_menubar_app(
@@ -437,6 +438,7 @@ def run_menubar_app(
     version: str = "",
     current_model: str = "small",
     is_model_cached: Callable[[str], bool] | None = None,
+    invalidate_model_cache: Callable[[], None] | None = None,
 ) -> MenuBarApp:
     """Create and run the menu bar app.
 
@@ -450,6 +452,8 @@ def run_menubar_app(
         version: Current app version to display.
         current_model: Currently selected model name.
         is_model_cached: Function to check if a model is downloaded.
+        invalidate_model_cache: Function to clear is_model_cached's memoized
+            results, called each time the model submenu opens.
 
     Returns:
         MenuBarApp instance for updating state.
@@ -469,6 +473,7 @@ def run_menubar_app(
     delegate.setHotkey_(hotkey)
     delegate._current_model = current_model
     delegate._is_model_cached_fn = is_model_cached
+    delegate._invalidate_model_cache_fn = invalidate_model_cache
     delegate.setupStatusBar(version=version)
 
     return delegate
@@ -498,11 +503,11 @@ def stop_app_loop():
     AppHelper.stopEventLoop()
 
 
-def open_file_picker(allowed_extensions: list[str] | None = None) -> str | None:
+def open_file_picker(allowed_extensions: Sequence[str] | None = None) -> str | None:
     """Open file picker dialog and return selected path.
 
     Args:
-        allowed_extensions: List of allowed file extensions (e.g., ["mp3", "wav"]).
+        allowed_extensions: Allowed file extensions (e.g., ("mp3", "wav")).
 
     Returns:
         Selected file path as string, or None if cancelled.
@@ -515,7 +520,7 @@ def open_file_picker(allowed_extensions: list[str] | None = None) -> str | None:
     if allowed_extensions:
         panel.setAllowedFileTypes_(allowed_extensions)
 
-    if panel.runModal() == 1:  # NSModalResponseOK
+    if panel.runModal() == NSModalResponseOK:
         return str(panel.URL().path())
     return None
 
@@ -534,9 +539,9 @@ def show_format_picker() -> str | None:
     alert.addButtonWithTitle_("Cancel")
 
     response = alert.runModal()
-    if response == 1000:  # First button
+    if response == NSAlertFirstButtonReturn:
         return "txt"
-    elif response == 1001:  # Second button
+    elif response == NSAlertSecondButtonReturn:
         return "vtt"
     return None
 
@@ -565,6 +570,6 @@ def save_file_picker(
     if file_types:
         panel.setAllowedFileTypes_(file_types)
 
-    if panel.runModal() == 1:  # NSModalResponseOK
+    if panel.runModal() == NSModalResponseOK:
         return str(panel.URL().path())
     return None
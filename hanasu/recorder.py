@@ -46,6 +46,7 @@ class Recorder:
         """
         self.device = device
         self._buffer: list[np.ndarray] = []
+        self._sample_count = 0
         self._stream: sd.InputStream | None = None
         self._recording = False
 
@@ -64,6 +65,7 @@ class Recorder:
         """Callback for audio stream - accumulates audio chunks."""
         if self._recording:
             self._buffer.append(indata.copy().flatten())
+            self._sample_count += frames
 
     def start(self) -> None:
         """Start recording audio.
@@ -73,6 +75,7 @@ class Recorder:
         """
         refresh_devices()
         self._buffer = []
+        self._sample_count = 0
         self._recording = True
         self._stream = sd.InputStream(
             samplerate=SAMPLE_RATE,
@@ -83,8 +86,28 @@ class Recorder:
         )
         self._stream.start()
 
+    def sample_count(self) -> int:
+        """Return the number of samples recorded so far, without copying them."""
+        return self._sample_count
+
     def stop(self) -> np.ndarray:
         """Stop recording and return audio buffer as numpy array."""
+        self._close_stream()
+
+        if not self._buffer:
+            return np.array([], dtype=np.float32)
+
+        # Chunks are already float32, so astype doesn't need another copy
+        return np.concatenate(self._buffer).astype(np.float32, copy=False)
+
+    def discard(self) -> None:
+        """Stop recording and throw the audio away without building a buffer."""
+        self._close_stream()
+        self._buffer = []
+        self._sample_count = 0
+
+    def _close_stream(self) -> None:
+        """Stop accumulating audio and close the input stream."""
         self._recording = False
 
         if self._stream is not None:
@@ -92,11 +115,6 @@ class Recorder:
             self._stream.close()
             self._stream = None
 
-        if not self._buffer:
-            return np.array([], dtype=np.float32)
-
-        return np.concatenate(self._buffer).astype(np.float32)
-
 
 def list_input_devices() -> list[str]:
     """List available audio input devices.
@@ -0,0 +1,175 @@
+"""Long-lived subprocess for file transcription.
+
+File transcription runs out of process to keep MLX/Metal off the app's
+background threads. Spawning ``python -m hanasu transcribe`` for every file
+re-imports mlx-whisper and reloads the model each time, so instead one child
+process is kept around and fed jobs as JSON lines over stdin/stdout. The
+model stays loaded in the child between jobs.
+"""
+
+import json
+import select
+import subprocess
+import sys
+import threading
+from typing import Any
+
+# Command that starts the worker loop in a child process
+WORKER_COMMAND = [sys.executable, "-m", "hanasu.transcribe_worker"]
+
+
+class WorkerUnavailableError(Exception):
+    """Raised when the worker process can't be started."""
+
+
+class TranscribeWorker:
+    """Sends file transcription jobs to a persistent worker process."""
+
+    def __init__(self):
+        """Initialize without starting the process (started on first job)."""
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def transcribe(
+        self,
+        input_path: str,
+        output_path: str,
+        use_vtt: bool,
+        model: str,
+        timeout: float,
+        backend: str = "mlx",
+    ) -> str | None:
+        """Transcribe a file in the worker process.
+
+        Args:
+            input_path: Path to audio/video file.
+            output_path: Path for output file.
+            use_vtt: True to output VTT format, False for plain text.
+            model: Model size to use.
+            timeout: Seconds to wait for the job before killing the worker.
+            backend: Transcription engine ("mlx" or "faster-whisper").
+
+        Returns:
+            None on success, otherwise an error message.
+
+        Raises:
+            WorkerUnavailableError: If the worker process can't be started.
+            subprocess.TimeoutExpired: If the job takes longer than timeout.
+        """
+        job = {
+            "input_path": input_path,
+            "output_path": output_path,
+            "use_vtt": use_vtt,
+            "model": model,
+            "backend": backend,
+        }
+
+        # One job at a time - the protocol is strictly request/response
+        with self._lock:
+            process = self._ensure_started()
+            # Started with stdin/stdout=PIPE, so both pipes exist
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                process.stdin.write(json.dumps(job) + "\n")
+                process.stdin.flush()
+            except OSError:
+                self._kill()
+                return "Transcription worker exited unexpectedly"
+
+            ready, _, _ = select.select([process.stdout], [], [], timeout)
+            if not ready:
+                # Stuck on this job - kill it so the next job gets a fresh worker
+                self._kill()
+                raise subprocess.TimeoutExpired(WORKER_COMMAND, timeout)
+
+            line = process.stdout.readline()
+            if not line:
+                returncode = process.wait()
+                self._process = None
+                return f"Transcription worker exited unexpectedly (exit code {returncode})"
+
+        response = json.loads(line)
+        if response.get("ok"):
+            return None
+        return response.get("error") or "Transcription failed"
+
+    def stop(self) -> None:
+        """Shut down the worker process, cancelling any job in progress.
+
+        Doesn't wait for a running job, so this returns promptly on quit.
+        """
+        process = self._process
+        if process is None:
+            return
+
+        if not self._lock.acquire(blocking=False):
+            # Busy - kill it; the waiting transcribe() sees EOF and cleans up
+            process.kill()
+            return
+
+        try:
+            # Idle - EOF on stdin ends the worker loop
+            assert process.stdin is not None
+            process.stdin.close()
+            process.wait(timeout=2.0)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            self._process = None
+            self._lock.release()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Return the running worker process, starting a new one if needed."""
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+
+        try:
+            # stderr is inherited so progress output and tracebacks stay visible
+            self._process = subprocess.Popen(
+                WORKER_COMMAND,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+        except OSError as e:
+            self._process = None
+            raise WorkerUnavailableError(str(e)) from e
+        return self._process
+
+    def _kill(self) -> None:
+        """Kill the worker process (a new one is started for the next job)."""
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+
+def main() -> None:
+    """Worker loop: read one JSON job per line on stdin, answer one line on stdout."""
+    from hanasu.main import run_transcribe
+
+    # Keep stray prints off the protocol channel
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+
+    for line in sys.stdin:
+        job = json.loads(line)
+        response: dict[str, Any]
+        try:
+            run_transcribe(
+                job["input_path"],
+                use_vtt=job["use_vtt"],
+                model=job["model"],
+                output_file=job["output_path"],
+                backend=job["backend"],
+            )
+            response = {"ok": True}
+        except Exception as e:
+            response = {"ok": False, "error": str(e) or type(e).__name__}
+        protocol.write(json.dumps(response) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
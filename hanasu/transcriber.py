@@ -1,12 +1,22 @@
-"""Transcription functionality using mlx-whisper."""
+"""Transcription functionality using mlx-whisper or faster-whisper."""
 
+import functools
 import re
+import threading
+from typing import Any
 
-import mlx_whisper
 import numpy as np
 
 from hanasu.config import Dictionary
 
+# mlx-whisper is imported on first use (see _import_mlx_whisper) so that CLI
+# commands importing hanasu.main don't pay for loading MLX and Metal.
+mlx_whisper: Any = None
+
+# faster-whisper is optional (uv sync --extra faster-whisper) and imported on
+# first use in the same way
+faster_whisper: Any = None
+
 # Model name to mlx-community HuggingFace path
 MODEL_PATHS = {
     "tiny": "mlx-community/whisper-tiny-mlx",
@@ -16,20 +26,133 @@ MODEL_PATHS = {
     "large": "mlx-community/whisper-large-v3-mlx",
 }
 
+# Model name to faster-whisper (CTranslate2) model name
+FASTER_WHISPER_MODELS = {
+    "tiny": "tiny",
+    "base": "base",
+    "small": "small",
+    "medium": "medium",
+    "large": "large-v3",
+}
+
+# Model name to its directory name in the HuggingFace hub cache
+MODEL_CACHE_NAMES = {
+    name: "models--" + path.replace("/", "--") for name, path in MODEL_PATHS.items()
+}
+
+# Same for faster-whisper, which downloads from Systran/faster-whisper-<model>
+FASTER_WHISPER_CACHE_NAMES = {
+    name: "models--Systran--faster-whisper-" + model
+    for name, model in FASTER_WHISPER_MODELS.items()
+}
+
+# One second of 16kHz silence, enough to load weights and compile kernels.
+# Shared (and read-only) so warmups and model verification don't reallocate it.
+WARMUP_SAMPLES = 16000
+SILENCE_1S = np.zeros(WARMUP_SAMPLES, dtype=np.float32)
+SILENCE_1S.flags.writeable = False
+
+# Both backends keep the loaded model in module-global state, so serialize calls
+# (a warmup running in the background and a real transcription can overlap)
+_transcribe_lock = threading.Lock()
+
+
+def _import_mlx_whisper() -> None:
+    """Import mlx-whisper into this module on first use."""
+    global mlx_whisper
+    if mlx_whisper is None:
+        import mlx_whisper as mlx_whisper_module
+
+        mlx_whisper = mlx_whisper_module
+
+
+def _import_faster_whisper() -> None:
+    """Import faster-whisper into this module on first use.
+
+    Raises:
+        RuntimeError: If faster-whisper isn't installed.
+    """
+    global faster_whisper
+    if faster_whisper is None:
+        try:
+            import faster_whisper as faster_whisper_module
+        except ImportError as err:
+            raise RuntimeError(
+                "faster-whisper is not installed.\nInstall with: uv sync --extra faster-whisper"
+            ) from err
+
+        faster_whisper = faster_whisper_module
+
+
+@functools.lru_cache(maxsize=1)
+def load_faster_whisper_model(model: str) -> Any:
+    """Load a faster-whisper model with int8 weights.
+
+    The last model loaded is kept, like mlx-whisper does for its models, so
+    repeated transcriptions with the same model don't reload the weights.
+
+    Args:
+        model: Model size (tiny, base, small, medium, large).
+
+    Returns:
+        faster_whisper.WhisperModel instance.
+    """
+    _import_faster_whisper()
+    return faster_whisper.WhisperModel(
+        FASTER_WHISPER_MODELS.get(model, FASTER_WHISPER_MODELS["small"]),
+        device="auto",
+        compute_type="int8",
+    )
+
+
+def transcribe_with_faster_whisper(
+    whisper_model: Any,
+    audio: Any,
+    batch_size: int | None = None,
+    **options: Any,
+) -> dict:
+    """Transcribe with faster-whisper, returning a result shaped like mlx-whisper's.
+
+    Args:
+        whisper_model: Model from load_faster_whisper_model().
+        audio: Path to an audio file, or float32 16kHz samples.
+        batch_size: If set, decode this many 30s chunks at a time with
+            BatchedInferencePipeline (faster for long files).
+        **options: Passed through to transcribe (language, vad_filter etc.).
+
+    Returns:
+        Dict with "text" and "segments" (each with "start", "end", "text").
+    """
+    if batch_size:
+        _import_faster_whisper()
+        pipeline = faster_whisper.BatchedInferencePipeline(model=whisper_model)
+        segments, _info = pipeline.transcribe(audio, batch_size=batch_size, beam_size=1, **options)
+    else:
+        # Greedy decoding, as mlx-whisper does by default
+        segments, _info = whisper_model.transcribe(audio, beam_size=1, **options)
+    # Decoding happens as the segment generator is consumed
+    segments = [{"start": seg.start, "end": seg.end, "text": seg.text} for seg in segments]
+    return {"text": "".join(seg["text"] for seg in segments), "segments": segments}
+
 
 class Transcriber:
-    """Transcribes audio using mlx-whisper."""
+    """Transcribes audio using mlx-whisper or faster-whisper."""
 
-    def __init__(self, model: str = "small", language: str = "en"):
+    def __init__(self, model: str = "small", language: str = "en", backend: str = "mlx"):
         """Initialize transcriber with model and language.
 
         Args:
             model: Model size (tiny, base, small, medium, large).
             language: Language code (e.g., 'en' for English).
+            backend: "mlx" for mlx-whisper, "faster-whisper" for faster-whisper.
         """
         self.model = model
         self.language = language
+        self.backend = backend
         self.model_path = MODEL_PATHS.get(model, MODEL_PATHS["small"])
+        # faster-whisper model, held here once loaded so it stays resident even
+        # if another model is loaded meanwhile (e.g. while switching models)
+        self._whisper_model: Any = None
 
     def transcribe(
         self,
@@ -54,13 +177,26 @@ class Transcriber:
         if dictionary and dictionary.terms:
             initial_prompt = "Vocabulary: " + ", ".join(dictionary.terms)
 
-        # Transcribe with mlx-whisper
-        result = mlx_whisper.transcribe(
-            audio,
-            path_or_hf_repo=self.model_path,
-            language=self.language,
-            initial_prompt=initial_prompt,
-        )
+        if self.backend == "faster-whisper":
+            with _transcribe_lock:
+                if self._whisper_model is None:
+                    self._whisper_model = load_faster_whisper_model(self.model)
+                result = transcribe_with_faster_whisper(
+                    self._whisper_model,
+                    audio,
+                    language=self.language,
+                    initial_prompt=initial_prompt,
+                )
+        else:
+            # Transcribe with mlx-whisper
+            _import_mlx_whisper()
+            with _transcribe_lock:
+                result = mlx_whisper.transcribe(
+                    audio,
+                    path_or_hf_repo=self.model_path,
+                    language=self.language,
+                    initial_prompt=initial_prompt,
+                )
 
         text = result["text"].strip()
 
@@ -70,6 +206,15 @@ class Transcriber:
 
         return text
 
+    def warmup(self) -> None:
+        """Load the model ahead of the first real transcription.
+
+        Runs a second of silence through the model so weight loading (and,
+        for mlx-whisper, Metal kernel compilation) don't land on the first
+        dictation.
+        """
+        self.transcribe(SILENCE_1S)
+
 
 def apply_replacements(text: str, replacements: dict[str, str]) -> str:
     """Apply replacement rules to text (case-insensitive).
@@ -44,7 +44,8 @@ def get_latest_version() -> str | None:
     )
     try:
         with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
-            data = json.loads(response.read().decode())
+            # json.loads takes the UTF-8 bytes directly; no intermediate str
+            data = json.loads(response.read())
             tag = data.get("tag_name")
             if not tag:
                 return None
@@ -89,23 +90,22 @@ def check_for_update(current_version: str, cache_dir: Path | None = None) -> Upd
 
     cache_file = cache_dir / "update_cache.json"
 
-    # Check cache first
-    if cache_file.exists():
-        try:
-            cache_data = json.loads(cache_file.read_text())
-            last_check = cache_data.get("last_check", 0)
-            cached_version = cache_data.get("latest_version")
-
-            # Use cache if within 24 hours
-            if time.time() - last_check < CACHE_DURATION and cached_version:
-                available, version = is_update_available(current_version, cached_version)
-                return UpdateStatus(
-                    checked=True,
-                    update_available=available,
-                    latest_version=cached_version,
-                )
-        except (json.JSONDecodeError, KeyError):
-            pass  # Cache invalid, fetch fresh
+    # Check cache first (just try the read; a stat first would be a second syscall)
+    try:
+        cache_data = json.loads(cache_file.read_bytes())
+        last_check = cache_data.get("last_check", 0)
+        cached_version = cache_data.get("latest_version")
+
+        # Use cache if within 24 hours
+        if time.time() - last_check < CACHE_DURATION and cached_version:
+            available, version = is_update_available(current_version, cached_version)
+            return UpdateStatus(
+                checked=True,
+                update_available=available,
+                latest_version=cached_version,
+            )
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass  # No cache yet, or cache invalid - fetch fresh
 
     # Fetch from GitHub
     latest = get_latest_version()
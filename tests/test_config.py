@@ -1,6 +1,8 @@
 """Tests for configuration loading and validation."""
 
 import json
+import os
+import stat
 from pathlib import Path
 
 import pytest
@@ -233,6 +235,7 @@ class TestSaveConfig:
             debug=False,
             clear_clipboard=False,
             last_output_dir=None,
+            backend="mlx",
         )
 
         save_config(config, config_dir=tmp_path)
@@ -255,6 +258,7 @@ class TestSaveConfig:
             debug=True,
             clear_clipboard=True,
             last_output_dir="/some/path",
+            backend="mlx",
         )
 
         save_config(config, config_dir=tmp_path)
@@ -280,6 +284,7 @@ class TestSaveConfig:
             debug=False,
             clear_clipboard=False,
             last_output_dir=None,
+            backend="mlx",
         )
 
         save_config(config, config_dir=config_dir)
@@ -287,6 +292,70 @@ class TestSaveConfig:
         assert config_dir.exists()
         assert (config_dir / "config.json").exists()
 
+    def test_overwrites_existing_config_without_leaving_temp_files(self, tmp_path: Path):
+        """save_config replaces an existing file and cleans up its temp file."""
+        (tmp_path / "config.json").write_text(json.dumps({"hotkey": "f19"}))
+        config = Config(
+            hotkey="cmd+alt+v",
+            model="small",
+            language="en",
+            audio_device=None,
+            debug=False,
+            clear_clipboard=False,
+            last_output_dir=None,
+            backend="mlx",
+        )
+
+        save_config(config, config_dir=tmp_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+        with open(tmp_path / "config.json") as f:
+            assert json.load(f)["hotkey"] == "cmd+alt+v"
+
+    def test_keeps_existing_file_mode(self, tmp_path: Path):
+        """save_config keeps the permissions of the config file it replaces."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text("{}")
+        config_file.chmod(0o640)
+
+        save_config(
+            Config(
+                hotkey="cmd+alt+v",
+                model="small",
+                language="en",
+                audio_device=None,
+                debug=False,
+                clear_clipboard=False,
+                last_output_dir=None,
+                backend="mlx",
+            ),
+            config_dir=tmp_path,
+        )
+
+        assert stat.S_IMODE(config_file.stat().st_mode) == 0o640
+
+    def test_new_file_gets_umask_default_mode(self, tmp_path: Path):
+        """A new config file gets the umask default, not mkstemp's 0600."""
+        umask = os.umask(0)
+        os.umask(umask)
+
+        save_config(
+            Config(
+                hotkey="cmd+alt+v",
+                model="small",
+                language="en",
+                audio_device=None,
+                debug=False,
+                clear_clipboard=False,
+                last_output_dir=None,
+                backend="mlx",
+            ),
+            config_dir=tmp_path,
+        )
+
+        mode = stat.S_IMODE((tmp_path / "config.json").stat().st_mode)
+        assert mode == 0o666 & ~umask
+
 
 class TestLastOutputDir:
     """Test last_output_dir config field for file transcription."""
@@ -316,6 +385,7 @@ class TestLastOutputDir:
             debug=False,
             clear_clipboard=False,
             last_output_dir="/Users/test/output",
+            backend="mlx",
         )
 
         save_config(config, config_dir=tmp_path)
@@ -335,6 +405,7 @@ class TestLastOutputDir:
             debug=False,
             clear_clipboard=False,
             last_output_dir=None,
+            backend="mlx",
         )
 
         save_config(config, config_dir=tmp_path)
@@ -345,6 +416,42 @@ class TestLastOutputDir:
         assert saved["last_output_dir"] is None
 
 
+class TestBackend:
+    """Test backend config field for choosing the transcription engine."""
+
+    def test_default_backend_is_mlx(self, tmp_path: Path):
+        """mlx-whisper is used unless configured otherwise."""
+        config = load_config(config_dir=tmp_path)
+
+        assert config.backend == "mlx"
+
+    def test_loads_backend_from_file(self, tmp_path: Path):
+        """backend is loaded from config file."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"backend": "faster-whisper"}))
+
+        config = load_config(config_dir=tmp_path)
+
+        assert config.backend == "faster-whisper"
+
+    def test_rejects_invalid_backend(self, tmp_path: Path):
+        """Unknown backend raises ConfigValidationError."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"backend": "openai"}))
+
+        with pytest.raises(ConfigValidationError, match="backend"):
+            load_config(config_dir=tmp_path)
+
+    def test_saves_backend_to_file(self, tmp_path: Path):
+        """save_config writes backend to config.json."""
+        config = load_config(config_dir=tmp_path)
+        config.backend = "faster-whisper"
+
+        save_config(config, config_dir=tmp_path)
+
+        assert load_config(config_dir=tmp_path).backend == "faster-whisper"
+
+
 class TestModelInfo:
     """Test MODEL_INFO constant for model metadata."""
 
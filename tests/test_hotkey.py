@@ -5,6 +5,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from hanasu.hotkey import (
+    EVENT_FLAGS_CHANGED,
+    EVENT_KEY_DOWN,
+    EVENT_KEY_UP,
+    EVENT_TAP_DISABLED_BY_TIMEOUT,
+    KEYBOARD_EVENT_KEYCODE_FIELD,
     KEYCODE_MAP,
     MODIFIER_FLAGS,
     HotkeyListener,
@@ -78,6 +83,34 @@ class TestParseHotkey:
         with pytest.raises(HotkeyParseError, match="Multiple keys"):
             parse_hotkey("a+b")
 
+    def test_returns_independent_dicts_for_repeated_calls(self):
+        """Repeated parses of the same string return equal but separate dicts."""
+        result1 = parse_hotkey("cmd+alt+v")
+        result2 = parse_hotkey("cmd+alt+v")
+
+        assert result1 == result2
+        assert result1 is not result2
+
+    def test_modifier_flags_match_quartz_constants(self):
+        """Hardcoded modifier flags match the Quartz framework values."""
+        quartz = pytest.importorskip("Quartz")
+
+        assert MODIFIER_FLAGS["cmd"] == quartz.kCGEventFlagMaskCommand
+        assert MODIFIER_FLAGS["shift"] == quartz.kCGEventFlagMaskShift
+        assert MODIFIER_FLAGS["alt"] == quartz.kCGEventFlagMaskAlternate
+        assert MODIFIER_FLAGS["ctrl"] == quartz.kCGEventFlagMaskControl
+
+    def test_allows_whitespace_around_parts(self):
+        """Whitespace around each part is ignored."""
+        result = parse_hotkey(" cmd + Alt +v ")
+
+        assert result == parse_hotkey("cmd+alt+v")
+
+    def test_raises_error_for_empty_part(self):
+        """An empty part between separators raises HotkeyParseError."""
+        with pytest.raises(HotkeyParseError, match="Unknown key"):
+            parse_hotkey("cmd++v")
+
     def test_raises_error_for_modifiers_only(self):
         """Modifiers without a key raises HotkeyParseError."""
         with pytest.raises(HotkeyParseError, match="No key specified"):
@@ -147,61 +180,65 @@ class TestHotkeyListener:
 class TestHotkeyListenerCleanup:
     """Test proper resource cleanup on stop."""
 
-    def test_stop_removes_run_loop_source(self):
-        """stop() removes run loop source from run loop."""
+    def _run_tap_until_stopped(self, mock_quartz, listener):
+        """Run _run_event_tap with a run loop that stop() ends on first entry."""
+        mock_quartz.CFRunLoopRun.side_effect = listener.stop
+        listener._running = True
+        listener._run_event_tap()
+
+    def test_listener_thread_removes_run_loop_source(self):
+        """The listener thread removes its run loop source from its own run loop."""
         with patch("hanasu.hotkey.Quartz") as mock_quartz:
             listener = HotkeyListener(
                 hotkey="cmd+v",
                 on_press=lambda: None,
                 on_release=lambda: None,
             )
-            listener._running = True
-            listener._tap = MagicMock()
-            listener._run_loop_source = MagicMock()
-            listener._thread = None
 
-            listener.stop()
+            self._run_tap_until_stopped(mock_quartz, listener)
 
-            mock_quartz.CFRunLoopRemoveSource.assert_called_once()
+            mock_quartz.CFRunLoopRemoveSource.assert_called_once_with(
+                mock_quartz.CFRunLoopGetCurrent.return_value,
+                mock_quartz.CFMachPortCreateRunLoopSource.return_value,
+                mock_quartz.kCFRunLoopCommonModes,
+            )
 
-    def test_stop_invalidates_mach_port(self):
-        """stop() invalidates the mach port."""
+    def test_listener_thread_disables_and_invalidates_tap(self):
+        """The listener thread disables and invalidates its own tap on exit."""
         with patch("hanasu.hotkey.Quartz") as mock_quartz:
             listener = HotkeyListener(
                 hotkey="cmd+v",
                 on_press=lambda: None,
                 on_release=lambda: None,
             )
-            listener._running = True
-            mock_tap = MagicMock()
-            listener._tap = mock_tap
-            listener._run_loop_source = MagicMock()
-            listener._thread = None
+            mock_tap = mock_quartz.CGEventTapCreate.return_value
 
-            listener.stop()
+            self._run_tap_until_stopped(mock_quartz, listener)
 
+            mock_quartz.CGEventTapEnable.assert_called_with(mock_tap, False)
             mock_quartz.CFMachPortInvalidate.assert_called_once_with(mock_tap)
+            assert listener._tap is None
+            assert listener._run_loop is None
 
-    def test_stop_sets_tap_to_none_after_cleanup(self):
-        """stop() sets _tap to None after invalidating."""
-        with patch("hanasu.hotkey.Quartz"):
+    def test_stop_before_run_loop_starts_skips_run(self):
+        """A stop() that lands during tap setup ends the thread without running."""
+        with patch("hanasu.hotkey.Quartz") as mock_quartz:
             listener = HotkeyListener(
                 hotkey="cmd+v",
                 on_press=lambda: None,
                 on_release=lambda: None,
             )
             listener._running = True
-            listener._tap = MagicMock()
-            listener._run_loop_source = MagicMock()
-            listener._thread = None
+            mock_quartz.CFRunLoopAddSource.side_effect = lambda *args: listener.stop()
 
-            listener.stop()
+            listener._run_event_tap()
 
-            assert listener._tap is None
+            mock_quartz.CFRunLoopRun.assert_not_called()
+            mock_quartz.CFMachPortInvalidate.assert_called_once()
 
-    def test_stop_sets_run_loop_source_to_none_after_cleanup(self):
-        """stop() sets _run_loop_source to None after removing."""
-        with patch("hanasu.hotkey.Quartz"):
+    def test_stop_does_not_touch_tap(self):
+        """stop() leaves tap teardown to the listener thread."""
+        with patch("hanasu.hotkey.Quartz") as mock_quartz:
             listener = HotkeyListener(
                 hotkey="cmd+v",
                 on_press=lambda: None,
@@ -209,12 +246,14 @@ class TestHotkeyListenerCleanup:
             )
             listener._running = True
             listener._tap = MagicMock()
-            listener._run_loop_source = MagicMock()
+            listener._run_loop = MagicMock()
             listener._thread = None
 
             listener.stop()
 
-            assert listener._run_loop_source is None
+            mock_quartz.CGEventTapEnable.assert_not_called()
+            mock_quartz.CFRunLoopRemoveSource.assert_not_called()
+            mock_quartz.CFMachPortInvalidate.assert_not_called()
 
     def test_stop_warns_if_thread_does_not_stop(self, capsys):
         """stop() prints warning if thread doesn't stop within timeout."""
@@ -226,7 +265,6 @@ class TestHotkeyListenerCleanup:
             )
             listener._running = True
             listener._tap = None
-            listener._run_loop_source = None
 
             # Create a mock thread that is_alive() returns True (didn't stop)
             mock_thread = MagicMock()
@@ -237,3 +275,114 @@ class TestHotkeyListenerCleanup:
 
             captured = capsys.readouterr()
             assert "warning" in captured.out.lower() or "Warning" in captured.out
+
+    def test_stop_stops_listener_run_loop(self):
+        """stop() wakes the listener thread's run loop with CFRunLoopStop."""
+        with patch("hanasu.hotkey.Quartz") as mock_quartz:
+            listener = HotkeyListener(
+                hotkey="cmd+v",
+                on_press=lambda: None,
+                on_release=lambda: None,
+            )
+            listener._running = True
+            mock_run_loop = MagicMock()
+            listener._run_loop = mock_run_loop
+            listener._thread = None
+
+            listener.stop()
+
+            mock_quartz.CFRunLoopStop.assert_called_once_with(mock_run_loop)
+
+
+@pytest.fixture
+def mock_event_fields():
+    """Patch the Quartz event accessors bound for the event tap callback."""
+    with (
+        patch("hanasu.hotkey._CGEventGetIntegerValueField") as get_field,
+        patch("hanasu.hotkey._CGEventGetFlags") as get_flags,
+    ):
+        yield get_field, get_flags
+
+
+class TestEventCallback:
+    """Test the event tap callback that matches the hotkey."""
+
+    def test_matching_key_down_calls_on_press_and_suppresses(self, mock_event_fields):
+        """Key-down for the hotkey calls on_press and swallows the event."""
+        get_field, get_flags = mock_event_fields
+        get_field.return_value = KEYCODE_MAP["v"]
+        get_flags.return_value = MODIFIER_FLAGS["cmd"]
+        on_press = MagicMock()
+        listener = HotkeyListener(hotkey="cmd+v", on_press=on_press, on_release=MagicMock())
+
+        result = listener._event_callback(None, EVENT_KEY_DOWN, "event", None)
+
+        assert result is None
+        on_press.assert_called_once()
+        get_field.assert_called_once_with("event", KEYBOARD_EVENT_KEYCODE_FIELD)
+
+    def test_matching_key_up_calls_on_release_after_press(self, mock_event_fields):
+        """Key-up for the hotkey after a press calls on_release and swallows the event."""
+        get_field, get_flags = mock_event_fields
+        get_field.return_value = KEYCODE_MAP["v"]
+        get_flags.return_value = MODIFIER_FLAGS["cmd"]
+        on_release = MagicMock()
+        listener = HotkeyListener(hotkey="cmd+v", on_press=MagicMock(), on_release=on_release)
+
+        listener._event_callback(None, EVENT_KEY_DOWN, "event", None)
+        result = listener._event_callback(None, EVENT_KEY_UP, "event", None)
+
+        assert result is None
+        on_release.assert_called_once()
+
+    def test_non_matching_modifiers_pass_event_through(self, mock_event_fields):
+        """Same key with different modifiers is passed through untouched."""
+        get_field, get_flags = mock_event_fields
+        get_field.return_value = KEYCODE_MAP["v"]
+        get_flags.return_value = MODIFIER_FLAGS["cmd"] | MODIFIER_FLAGS["shift"]
+        on_press = MagicMock()
+        listener = HotkeyListener(hotkey="cmd+v", on_press=on_press, on_release=MagicMock())
+
+        result = listener._event_callback(None, EVENT_KEY_DOWN, "event", None)
+
+        assert result == "event"
+        on_press.assert_not_called()
+
+    def test_flags_changed_tracks_modifier_release(self, mock_event_fields):
+        """Flags-changed events clear/set modifiers_released and pass through."""
+        _, get_flags = mock_event_fields
+        listener = HotkeyListener(hotkey="cmd+v", on_press=MagicMock(), on_release=MagicMock())
+
+        get_flags.return_value = MODIFIER_FLAGS["cmd"]
+        result = listener._event_callback(None, EVENT_FLAGS_CHANGED, "event", None)
+
+        assert result == "event"
+        assert not listener.modifiers_released.is_set()
+
+        get_flags.return_value = 0
+        listener._event_callback(None, EVENT_FLAGS_CHANGED, "event", None)
+
+        assert listener.modifiers_released.is_set()
+
+    def test_other_event_types_skip_keycode_lookup(self, mock_event_fields):
+        """Events that aren't key down/up pass through without reading the keycode."""
+        get_field, get_flags = mock_event_fields
+        on_press = MagicMock()
+        listener = HotkeyListener(hotkey="cmd+v", on_press=on_press, on_release=MagicMock())
+
+        result = listener._event_callback(None, 0xFFFFFFFF, "event", None)
+
+        assert result == "event"
+        get_field.assert_not_called()
+        get_flags.assert_not_called()
+        on_press.assert_not_called()
+
+    def test_event_constants_match_quartz(self):
+        """Hardcoded event type and field values match the Quartz framework values."""
+        quartz = pytest.importorskip("Quartz")
+
+        assert EVENT_KEY_DOWN == quartz.kCGEventKeyDown
+        assert EVENT_KEY_UP == quartz.kCGEventKeyUp
+        assert EVENT_FLAGS_CHANGED == quartz.kCGEventFlagsChanged
+        assert EVENT_TAP_DISABLED_BY_TIMEOUT == quartz.kCGEventTapDisabledByTimeout
+        assert KEYBOARD_EVENT_KEYCODE_FIELD == quartz.kCGKeyboardEventKeycode
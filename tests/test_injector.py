@@ -2,13 +2,27 @@
 
 from unittest.mock import MagicMock, call, patch
 
+import pytest
+
+from hanasu import injector
 from hanasu.injector import (
+    KEY_EVENT_GAP,
     _simulate_paste,
     _wait_for_modifiers_released,
     inject_text,
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_cached_objects():
+    """Drop the cached pasteboard and event source so each test sees its own mocks."""
+    injector._pasteboard = None
+    injector._event_source = None
+    yield
+    injector._pasteboard = None
+    injector._event_source = None
+
+
 class TestInjectText:
     """Test main text injection function."""
 
@@ -39,6 +53,35 @@ class TestInjectText:
                         # Paste should be simulated
                         mock_paste.assert_called_once()
 
+    def test_posts_paste_right_after_writing_clipboard(self):
+        """The clipboard write is synchronous, so Cmd+V is posted with no sleep first."""
+        order = MagicMock()
+        with patch("hanasu.injector.NSPasteboard") as mock_pb_class:
+            with patch("hanasu.injector._wait_for_modifiers_released"):
+                with patch("hanasu.injector.Quartz") as mock_quartz:
+                    with patch("hanasu.injector.time.sleep") as mock_sleep:
+                        mock_key_down = MagicMock()
+                        mock_key_up = MagicMock()
+                        mock_quartz.CGEventCreateKeyboardEvent.side_effect = [
+                            mock_key_down,
+                            mock_key_up,
+                        ]
+                        mock_pasteboard = mock_pb_class.generalPasteboard.return_value
+                        order.attach_mock(mock_pasteboard.setString_forType_, "set_string")
+                        order.attach_mock(mock_quartz.CGEventPost, "post")
+                        order.attach_mock(mock_sleep, "sleep")
+
+                        inject_text("hello")
+
+                        # Key-down follows the write directly; the only sleep is
+                        # the gap between key-down and key-up
+                        assert order.mock_calls == [
+                            call.set_string("hello", injector.NSPasteboardTypeString),
+                            call.post(mock_quartz.kCGSessionEventTap, mock_key_down),
+                            call.sleep(KEY_EVENT_GAP),
+                            call.post(mock_quartz.kCGSessionEventTap, mock_key_up),
+                        ]
+
     def test_waits_for_modifiers_before_paste(self):
         """Waits for modifier keys to be released before pasting."""
         with patch("hanasu.injector.NSPasteboard") as mock_pb_class:
@@ -121,6 +164,18 @@ class TestSimulatePaste:
                 # Key up should be posted
                 mock_quartz.CGEventPost.assert_any_call(mock_quartz.kCGSessionEventTap, mock_key_up)
 
+    def test_reuses_event_source_across_pastes(self):
+        """The event source is created once and reused for later pastes."""
+        with patch("hanasu.injector.Quartz") as mock_quartz:
+            with patch("hanasu.injector.time.sleep"):
+                mock_quartz.CGEventSourceCreate.return_value = MagicMock()
+                mock_quartz.CGEventCreateKeyboardEvent.return_value = MagicMock()
+
+                _simulate_paste()
+                _simulate_paste()
+
+                mock_quartz.CGEventSourceCreate.assert_called_once()
+
     def test_delay_between_key_down_and_up(self):
         """Small delay between key-down and key-up for event processing."""
         with patch("hanasu.injector.Quartz") as mock_quartz:
@@ -131,7 +186,7 @@ class TestSimulatePaste:
                 _simulate_paste()
 
                 # Should sleep between key down and key up
-                mock_sleep.assert_called_with(0.01)
+                mock_sleep.assert_called_with(KEY_EVENT_GAP)
 
 
 class TestWaitForModifiersReleased:
@@ -158,6 +213,18 @@ class TestWaitForModifiersReleased:
                     # Should not sleep (returned immediately)
                     mock_sleep.assert_not_called()
 
+    def test_waits_on_released_event_instead_of_polling(self):
+        """With a released_event, blocks on it and never polls flags state."""
+        with patch("hanasu.injector.Quartz") as mock_quartz:
+            with patch("hanasu.injector.time.sleep") as mock_sleep:
+                released_event = MagicMock()
+
+                _wait_for_modifiers_released(timeout=1.0, released_event=released_event)
+
+                released_event.wait.assert_called_once_with(1.0)
+                mock_quartz.CGEventSourceFlagsState.assert_not_called()
+                mock_sleep.assert_not_called()
+
     def test_waits_until_modifiers_released(self):
         """Waits in loop until modifier keys are released."""
         with patch("hanasu.injector.Quartz") as mock_quartz:
@@ -206,6 +273,21 @@ class TestWaitForModifiersReleased:
                     assert True  # If we get here, timeout worked
 
 
+class TestPasteboardReuse:
+    """Test that the general pasteboard is looked up once."""
+
+    def test_reuses_general_pasteboard_across_calls(self):
+        """generalPasteboard() is only called on the first injection."""
+        with patch("hanasu.injector.NSPasteboard") as mock_pb_class:
+            with patch("hanasu.injector._wait_for_modifiers_released"):
+                with patch("hanasu.injector._simulate_paste"):
+                    with patch("hanasu.injector.time.sleep"):
+                        inject_text("first")
+                        inject_text("second")
+
+                        mock_pb_class.generalPasteboard.assert_called_once()
+
+
 class TestClipboardClearing:
     """Test clipboard clearing after paste."""
 
@@ -1,6 +1,7 @@
 """Tests for logging configuration."""
 
 import logging
+from logging.handlers import QueueHandler
 from pathlib import Path
 from unittest.mock import patch
 
@@ -47,14 +48,34 @@ class TestSetupLogging:
         assert len(stream_handlers) >= 1
 
     def test_setup_logging_creates_file_handler_when_log_to_file_true(self, tmp_path: Path):
-        """setup_logging adds a FileHandler when log_to_file=True."""
-        from hanasu.logging_config import setup_logging
+        """setup_logging routes records to a FileHandler via a queue when log_to_file=True."""
+        from hanasu import logging_config
+        from hanasu.logging_config import setup_logging, shutdown_logging
 
         with patch("hanasu.logging_config.Path.home", return_value=tmp_path):
             logger = setup_logging(debug=False, log_to_file=True)
 
+        queue_handlers = [h for h in logger.handlers if isinstance(h, QueueHandler)]
+        assert len(queue_handlers) == 1
+        assert logging_config._file_listener is not None
+        file_handlers = [
+            h for h in logging_config._file_listener.handlers if isinstance(h, logging.FileHandler)
+        ]
+        assert len(file_handlers) == 1
+
+        shutdown_logging()
+
+    def test_setup_logging_does_not_write_file_on_calling_thread(self, tmp_path: Path):
+        """File writes happen on the listener thread, not in the logging call."""
+        from hanasu.logging_config import setup_logging, shutdown_logging
+
+        with patch("hanasu.logging_config.Path.home", return_value=tmp_path):
+            logger = setup_logging(debug=True, log_to_file=True)
+
         file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
-        assert len(file_handlers) >= 1
+        assert file_handlers == []
+
+        shutdown_logging()
 
     def test_setup_logging_creates_log_directory(self, tmp_path: Path):
         """setup_logging creates ~/Library/Logs/Hanasu directory."""
@@ -68,12 +89,15 @@ class TestSetupLogging:
 
     def test_setup_logging_writes_to_hanasu_log_file(self, tmp_path: Path):
         """setup_logging writes to hanasu.log file."""
-        from hanasu.logging_config import setup_logging
+        from hanasu.logging_config import setup_logging, shutdown_logging
 
         with patch("hanasu.logging_config.Path.home", return_value=tmp_path):
             logger = setup_logging(debug=True, log_to_file=True)
             logger.debug("test message")
 
+        # Flush the queue listener so the record is written
+        shutdown_logging()
+
         log_file = tmp_path / "Library" / "Logs" / "Hanasu" / "hanasu.log"
         assert log_file.exists()
         content = log_file.read_text()
@@ -121,8 +145,8 @@ class TestLoggingIntegration:
             patch("hanasu.main.setup_logging") as mock_setup,
             patch("hanasu.main.load_config") as mock_config,
             patch("hanasu.main.load_dictionary") as mock_dict,
-            patch("hanasu.main.Recorder"),
-            patch("hanasu.main.Transcriber"),
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
             patch("hanasu.main.HotkeyListener"),
         ):
             mock_setup.return_value = MagicMock()
@@ -1,22 +1,31 @@
 """Tests for main orchestration and CLI."""
 
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
+from hanasu.config import Config
 from hanasu.main import (
+    FILE_TRANSCRIPTION_TIMEOUT,
     Hanasu,
+    download_model,
     ensure_homebrew_in_path,
     extract_audio_from_video,
     get_status,
+    invalidate_model_cache,
     is_model_cached,
     is_video_file,
+    print_status,
     run_setup,
     run_transcribe,
     run_update,
 )
+from hanasu.transcribe_worker import WorkerUnavailableError
 
 
 class TestHanasu:
@@ -26,8 +35,8 @@ class TestHanasu:
         """All components are initialized on creation."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -42,12 +51,62 @@ class TestHanasu:
 
                             assert app is not None
 
+    def test_warms_up_transcriber_in_background(self, tmp_path: Path):
+        """The transcriber's model is loaded on a background thread at startup."""
+        with patch("hanasu.main.load_config") as mock_config:
+            with patch("hanasu.main.load_dictionary") as mock_dict:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber") as mock_transcriber_class:
+                        with patch("hanasu.main.HotkeyListener"):
+                            with patch("hanasu.main.threading.Thread") as mock_thread:
+                                mock_config.return_value = MagicMock(
+                                    hotkey="ctrl+shift+space",
+                                    model="small",
+                                    language="en",
+                                    audio_device=None,
+                                    debug=False,
+                                )
+                                mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+                                app = Hanasu(config_dir=tmp_path)
+
+                                mock_thread.assert_any_call(
+                                    target=app._warmup_transcriber,
+                                    args=(mock_transcriber_class.return_value,),
+                                    daemon=True,
+                                )
+                                mock_thread.return_value.start.assert_called()
+
+    def test_warmup_failure_is_logged_not_raised(self, tmp_path: Path):
+        """A failing warmup (e.g. offline, model not downloaded) doesn't raise."""
+        with patch("hanasu.main.load_config") as mock_config:
+            with patch("hanasu.main.load_dictionary") as mock_dict:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
+                        with patch("hanasu.main.HotkeyListener"):
+                            mock_config.return_value = MagicMock(
+                                hotkey="ctrl+shift+space",
+                                model="small",
+                                language="en",
+                                audio_device=None,
+                                debug=False,
+                            )
+                            mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+                            app = Hanasu(config_dir=tmp_path)
+                            transcriber = MagicMock()
+                            transcriber.warmup.side_effect = RuntimeError("offline")
+
+                            app._warmup_transcriber(transcriber)
+
+                            transcriber.warmup.assert_called_once()
+
     def test_on_hotkey_press_starts_recording(self, tmp_path: Path):
         """Pressing hotkey starts audio recording."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder") as mock_recorder_class:
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder") as mock_recorder_class:
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -69,8 +128,8 @@ class TestHanasu:
         """Releasing hotkey transcribes audio and injects text."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder") as mock_recorder_class:
-                    with patch("hanasu.main.Transcriber") as mock_transcriber_class:
+                with patch("hanasu.recorder.Recorder") as mock_recorder_class:
+                    with patch("hanasu.transcriber.Transcriber") as mock_transcriber_class:
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.inject_text") as mock_inject:
                                 import numpy as np
@@ -87,6 +146,7 @@ class TestHanasu:
 
                                 mock_recorder = MagicMock()
                                 # Need at least 8000 samples (0.5s at 16kHz) to pass minimum length check
+                                mock_recorder.sample_count.return_value = 16000
                                 mock_recorder.stop.return_value = (
                                     np.ones(16000, dtype=np.float32) * 0.1
                                 )
@@ -98,10 +158,135 @@ class TestHanasu:
 
                                 app = Hanasu(config_dir=tmp_path)
                                 app._on_hotkey_release()
+                                # Transcription runs on the dictation worker
+                                app._dictation_executor.shutdown(wait=True)
 
                                 mock_recorder.stop.assert_called_once()
                                 mock_transcriber.transcribe.assert_called_once()
-                                mock_inject.assert_called_once_with("hello world", clear_after=True)
+                                mock_inject.assert_called_once_with(
+                                    "hello world",
+                                    clear_after=True,
+                                    modifiers_released=app.hotkey_listener.modifiers_released,
+                                )
+
+    def test_on_hotkey_release_discards_short_recording(self, tmp_path: Path):
+        """Taps shorter than the minimum are discarded without building the buffer."""
+        with patch("hanasu.main.load_config") as mock_config:
+            with patch("hanasu.main.load_dictionary") as mock_dict:
+                with patch("hanasu.recorder.Recorder") as mock_recorder_class:
+                    with patch("hanasu.transcriber.Transcriber") as mock_transcriber_class:
+                        with patch("hanasu.main.HotkeyListener"):
+                            with patch("hanasu.main.inject_text") as mock_inject:
+                                mock_config.return_value = MagicMock(
+                                    hotkey="ctrl+shift+space",
+                                    model="small",
+                                    language="en",
+                                    audio_device=None,
+                                    debug=False,
+                                    clear_clipboard=False,
+                                )
+                                mock_dict.return_value = MagicMock(terms=[], replacements={})
+                                mock_recorder = mock_recorder_class.return_value
+                                mock_recorder.sample_count.return_value = 4000
+
+                                app = Hanasu(config_dir=tmp_path)
+                                app._on_hotkey_release()
+
+                                mock_recorder.discard.assert_called_once()
+                                mock_recorder.stop.assert_not_called()
+                                mock_transcriber_class.return_value.transcribe.assert_not_called()
+                                mock_inject.assert_not_called()
+
+    def test_release_does_not_block_the_event_tap_thread(self, tmp_path: Path):
+        """The paste's wait for modifier release is met by a later tap event.
+
+        The tap delivers the hotkey key-up (modifiers still held) and then the
+        flags-changed release on the same thread, so the dictation has to run
+        elsewhere for the paste to see the modifiers come up.
+        """
+        from hanasu.hotkey import (
+            EVENT_FLAGS_CHANGED,
+            EVENT_KEY_UP,
+            FLAG_MASK_CONTROL,
+            FLAG_MASK_SHIFT,
+            KEYCODE_MAP,
+        )
+
+        waited = []
+        with (
+            patch("hanasu.main.load_config") as mock_config,
+            patch("hanasu.main.load_dictionary") as mock_dict,
+            patch("hanasu.recorder.Recorder") as mock_recorder_class,
+            patch("hanasu.transcriber.Transcriber") as mock_transcriber_class,
+            patch("hanasu.main.inject_text") as mock_inject,
+            patch("hanasu.hotkey._CGEventGetIntegerValueField") as get_field,
+            patch("hanasu.hotkey._CGEventGetFlags") as get_flags,
+        ):
+            mock_config.return_value = MagicMock(
+                hotkey="ctrl+shift+space",
+                model="small",
+                language="en",
+                audio_device=None,
+                debug=False,
+                clear_clipboard=False,
+            )
+            mock_dict.return_value = MagicMock(terms=[], replacements={})
+            mock_recorder = mock_recorder_class.return_value
+            mock_recorder.sample_count.return_value = 16000
+            mock_recorder.stop.return_value = np.ones(16000, dtype=np.float32) * 0.1
+            mock_transcriber_class.return_value.transcribe.return_value = "hello"
+            # Stand in for inject_text's wait on the released event
+            mock_inject.side_effect = lambda text, clear_after, modifiers_released: waited.append(
+                modifiers_released.wait(5.0)
+            )
+
+            app = Hanasu(config_dir=tmp_path)
+            listener = app.hotkey_listener
+            app._recording = True
+
+            # Modifiers go down, then the hotkey is released while they're held
+            get_flags.return_value = FLAG_MASK_CONTROL | FLAG_MASK_SHIFT
+            listener._event_callback(None, EVENT_FLAGS_CHANGED, MagicMock(), None)
+            get_field.return_value = KEYCODE_MAP["space"]
+            listener._hotkey_active = True
+            assert listener._event_callback(None, EVENT_KEY_UP, MagicMock(), None) is None
+
+            # Then the modifiers come up, delivered by the same tap thread
+            get_flags.return_value = 0
+            listener._event_callback(None, EVENT_FLAGS_CHANGED, MagicMock(), None)
+            app._dictation_executor.shutdown(wait=True)
+
+        assert waited == [True]
+
+
+class TestOnUpdate:
+    """Test update request handling from the menu bar."""
+
+    def test_second_update_ignored_while_first_in_progress(self, tmp_path: Path):
+        """A second update click while one is running doesn't start another."""
+        with patch("hanasu.main.load_config") as mock_config:
+            with patch("hanasu.main.load_dictionary") as mock_dict:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
+                        with patch("hanasu.main.HotkeyListener"):
+                            mock_config.return_value = MagicMock(
+                                hotkey="ctrl+shift+space",
+                                model="small",
+                                language="en",
+                                audio_device=None,
+                                debug=False,
+                            )
+                            mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+                            app = Hanasu(config_dir=tmp_path)
+                            assert app._update_in_progress is False
+
+                            with patch("hanasu.main.threading.Thread") as mock_thread:
+                                app._on_update()
+                                app._on_update()
+
+                            mock_thread.assert_called_once()
+                            assert app._update_in_progress is True
 
 
 class TestRunSetup:
@@ -111,7 +296,7 @@ class TestRunSetup:
         """Setup creates config directory."""
         with patch("hanasu.main.download_model"):
             with patch("hanasu.main.check_accessibility"):
-                with patch("hanasu.main.list_input_devices", return_value=["Mic"]):
+                with patch("hanasu.recorder.list_input_devices", return_value=["Mic"]):
                     run_setup(config_dir=tmp_path)
 
                     assert tmp_path.exists()
@@ -120,17 +305,30 @@ class TestRunSetup:
         """Setup creates default config file."""
         with patch("hanasu.main.download_model"):
             with patch("hanasu.main.check_accessibility"):
-                with patch("hanasu.main.list_input_devices", return_value=["Mic"]):
+                with patch("hanasu.recorder.list_input_devices", return_value=["Mic"]):
                     run_setup(config_dir=tmp_path)
 
                     config_file = tmp_path / "config.json"
                     assert config_file.exists()
 
+    def test_keeps_existing_config_and_dictionary(self, tmp_path: Path):
+        """Setup doesn't overwrite config or dictionary files that already exist."""
+        (tmp_path / "config.json").write_text('{"hotkey": "ctrl+v"}')
+        (tmp_path / "dictionary.json").write_text('{"terms": ["AMROK"]}')
+
+        with patch("hanasu.main.download_model"):
+            with patch("hanasu.main.check_accessibility"):
+                with patch("hanasu.recorder.list_input_devices", return_value=["Mic"]):
+                    run_setup(config_dir=tmp_path)
+
+        assert (tmp_path / "config.json").read_text() == '{"hotkey": "ctrl+v"}'
+        assert (tmp_path / "dictionary.json").read_text() == '{"terms": ["AMROK"]}'
+
     def test_downloads_model(self, tmp_path: Path):
         """Setup downloads the whisper model."""
         with patch("hanasu.main.download_model") as mock_download:
             with patch("hanasu.main.check_accessibility"):
-                with patch("hanasu.main.list_input_devices", return_value=["Mic"]):
+                with patch("hanasu.recorder.list_input_devices", return_value=["Mic"]):
                     run_setup(config_dir=tmp_path)
 
                     mock_download.assert_called_once()
@@ -141,12 +339,50 @@ class TestGetStatus:
 
     def test_returns_status_dict(self, tmp_path: Path):
         """get_status returns status information."""
-        with patch("hanasu.main.list_input_devices", return_value=["MacBook Pro Microphone"]):
+        with patch("hanasu.recorder.list_input_devices", return_value=["MacBook Pro Microphone"]):
             status = get_status(config_dir=tmp_path)
 
             assert "config_dir" in status
             assert "audio_devices" in status
 
+    def test_checks_devices_and_accessibility_concurrently(self, tmp_path: Path):
+        """Device listing and the accessibility check run at the same time."""
+        import threading
+
+        # Each call waits for the other; run one after the other, they'd time out
+        both_running = threading.Barrier(2, timeout=5)
+
+        def list_devices():
+            both_running.wait()
+            return ["MacBook Pro Microphone"]
+
+        def accessibility():
+            both_running.wait()
+            return True
+
+        with (
+            patch("hanasu.recorder.list_input_devices", side_effect=list_devices),
+            patch("hanasu.main.check_accessibility", side_effect=accessibility),
+        ):
+            status = get_status(config_dir=tmp_path)
+
+        assert status["audio_devices"] == ["MacBook Pro Microphone"]
+        assert status["accessibility"] is True
+
+    def test_reports_backend(self, tmp_path: Path, capsys):
+        """The configured backend is included in the status and printed."""
+        (tmp_path / "config.json").write_text('{"backend": "faster-whisper"}')
+
+        with (
+            patch("hanasu.recorder.list_input_devices", return_value=[]),
+            patch("hanasu.main.check_accessibility", return_value=True),
+        ):
+            status = get_status(config_dir=tmp_path)
+            print_status(config_dir=tmp_path)
+
+        assert status["backend"] == "faster-whisper"
+        assert "Backend: faster-whisper" in capsys.readouterr().out
+
 
 class TestRunUpdate:
     """Test update command."""
@@ -223,6 +459,39 @@ class TestRunUpdate:
                 cmd = uv_call[0][0]  # First positional arg is the command list
                 assert str(uv_path) in str(cmd), f"Expected full path {uv_path}, got {cmd}"
 
+    @pytest.mark.parametrize(
+        ("backend", "installed", "expect_extra"),
+        [
+            ("mlx", False, False),
+            ("faster-whisper", False, True),
+            ("mlx", True, True),
+        ],
+    )
+    def test_uv_sync_is_exact_and_keeps_faster_whisper_extra(
+        self, tmp_path: Path, backend, installed, expect_extra
+    ):
+        """uv sync runs exactly, adding the faster-whisper extra when it's in use."""
+        source_dir = tmp_path / ".hanasu" / "src"
+        source_dir.mkdir(parents=True)
+
+        with patch("hanasu.main.subprocess.run") as mock_run:
+            with patch("hanasu.main.Path.home", return_value=tmp_path):
+                with patch("hanasu.main.find_uv_binary", return_value=Path("/bin/uv")):
+                    with patch(
+                        "hanasu.main.importlib.util.find_spec",
+                        return_value=MagicMock() if installed else None,
+                    ):
+                        mock_run.return_value = MagicMock(returncode=0)
+
+                        run_update(backend=backend)
+
+        sync_cmd = next(c[0][0] for c in mock_run.call_args_list if "sync" in c[0][0])
+        assert "--inexact" not in sync_cmd
+        if expect_extra:
+            assert sync_cmd[-2:] == ["--extra", "faster-whisper"]
+        else:
+            assert sync_cmd == ["/bin/uv", "sync"]
+
 
 class TestFindUvBinary:
     """Test uv binary discovery."""
@@ -285,8 +554,8 @@ class TestChangeHotkey:
         """Changing hotkey stops the existing listener."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener") as mock_listener_class:
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -310,8 +579,8 @@ class TestChangeHotkey:
         """Changing hotkey creates new listener with the new hotkey."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener") as mock_listener_class:
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -337,8 +606,8 @@ class TestChangeHotkey:
         """Changing hotkey starts the new listener."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener") as mock_listener_class:
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -363,8 +632,8 @@ class TestChangeHotkey:
         """Changing hotkey persists to config file."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             mock_config_obj = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -389,8 +658,8 @@ class TestChangeHotkey:
         """Changing hotkey updates menu bar display."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -416,8 +685,8 @@ class TestChangeHotkey:
 
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener") as mock_listener_class:
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -439,6 +708,92 @@ class TestChangeHotkey:
                             with pytest.raises(HotkeyParseError):
                                 app.change_hotkey("invalid+hotkey+combo")
 
+    def test_invalid_hotkey_leaves_old_listener_running_and_keeps_config(self, tmp_path: Path):
+        """An invalid hotkey never stops the old listener and leaves config untouched."""
+        from hanasu.hotkey import HotkeyParseError
+
+        with patch("hanasu.main.load_config") as mock_config:
+            with patch("hanasu.main.load_dictionary") as mock_dict:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
+                        with patch("hanasu.main.HotkeyListener") as mock_listener_class:
+                            mock_config.return_value = MagicMock(
+                                hotkey="ctrl+shift+space",
+                                model="small",
+                                language="en",
+                                audio_device=None,
+                                debug=False,
+                            )
+                            mock_dict.return_value = MagicMock(terms=[], replacements={})
+                            old_listener = MagicMock()
+                            mock_listener_class.side_effect = [
+                                old_listener,
+                                HotkeyParseError("Unknown key: invalid"),
+                                HotkeyParseError("Unknown key: invalid"),
+                            ]
+
+                            app = Hanasu(config_dir=tmp_path)
+
+                            with patch("hanasu.main.save_config") as mock_save:
+                                with pytest.raises(HotkeyParseError):
+                                    app.change_hotkey("invalid+key")
+                                app._on_hotkey_change("invalid+key")
+
+                            assert app.hotkey_listener is old_listener
+                            old_listener.stop.assert_not_called()
+                            old_listener.start.assert_not_called()
+                            assert app.config.hotkey == "ctrl+shift+space"
+                            mock_save.assert_not_called()
+
+    def test_change_hotkey_to_same_hotkey_is_noop(self, tmp_path: Path):
+        """Changing to the current hotkey doesn't restart the listener or save config."""
+        with patch("hanasu.main.load_config") as mock_config:
+            with patch("hanasu.main.load_dictionary") as mock_dict:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
+                        with patch("hanasu.main.HotkeyListener") as mock_listener_class:
+                            mock_config.return_value = MagicMock(
+                                hotkey="ctrl+shift+space",
+                                model="small",
+                                language="en",
+                                audio_device=None,
+                                debug=False,
+                            )
+                            mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+                            app = Hanasu(config_dir=tmp_path)
+
+                            with patch("hanasu.main.save_config") as mock_save:
+                                app.change_hotkey("ctrl+shift+space")
+
+                            mock_listener_class.return_value.stop.assert_not_called()
+                            mock_save.assert_not_called()
+
+    def test_on_hotkey_change_to_same_hotkey_is_noop(self, tmp_path: Path):
+        """Confirming the current hotkey doesn't rebuild the listener or save config."""
+        with patch("hanasu.main.load_config") as mock_config:
+            with patch("hanasu.main.load_dictionary") as mock_dict:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
+                        with patch("hanasu.main.HotkeyListener") as mock_listener_class:
+                            mock_config.return_value = MagicMock(
+                                hotkey="ctrl+shift+space",
+                                model="small",
+                                language="en",
+                                audio_device=None,
+                                debug=False,
+                            )
+                            mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+                            app = Hanasu(config_dir=tmp_path)
+
+                            with patch("hanasu.main.save_config") as mock_save:
+                                app._on_hotkey_change("ctrl+shift+space")
+
+                            mock_listener_class.return_value.stop.assert_not_called()
+                            assert mock_listener_class.call_count == 1
+                            mock_save.assert_not_called()
+
 
 class TestIsVideoFile:
     """Test video file detection."""
@@ -481,6 +836,12 @@ class TestIsVideoFile:
         assert is_video_file(Path("/path/to/video.mp4")) is True
         assert is_video_file(Path("/path/to/audio.wav")) is False
 
+    def test_only_looks_at_file_name_extension(self):
+        """Dots in directory names and dotfiles without an extension aren't video."""
+        assert is_video_file("/videos.mp4/notes") is False
+        assert is_video_file("/path/to/.mp4") is False
+        assert is_video_file("/path/to/archive.mp4.wav") is False
+
 
 class TestExtractAudioFromVideo:
     """Test audio extraction from video files."""
@@ -493,9 +854,9 @@ class TestExtractAudioFromVideo:
         with patch("hanasu.main.find_ffmpeg") as mock_find:
             with patch("hanasu.main.subprocess.run") as mock_run:
                 mock_find.return_value = "/opt/homebrew/bin/ffmpeg"
-                mock_run.return_value = MagicMock(returncode=0, stderr="")
+                mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
 
-                result = extract_audio_from_video(str(video_file))
+                extract_audio_from_video(str(video_file))
 
                 # Verify ffmpeg was called
                 mock_run.assert_called_once()
@@ -506,35 +867,82 @@ class TestExtractAudioFromVideo:
                 assert "-i" in call_args
                 assert str(video_file) in call_args
                 assert "-vn" in call_args  # No video
-                assert "-acodec" in call_args
-                assert "pcm_s16le" in call_args  # WAV codec
-                assert "-ar" in call_args
+                assert "s16le" in call_args  # Raw PCM, no container
+                assert "pcm_s16le" in call_args
                 assert "16000" in call_args  # 16kHz sample rate
                 assert "-ac" in call_args
                 assert "1" in call_args  # Mono
-                assert "-y" in call_args  # Overwrite
+                assert call_args[-1] == "pipe:1"  # Written to stdout, not a file
+
+    def test_limits_ffmpeg_log_to_errors(self, tmp_path: Path):
+        """ffmpeg's progress log isn't collected, only errors."""
+        video_file = tmp_path / "test.mp4"
+        video_file.touch()
+
+        with patch("hanasu.main.find_ffmpeg") as mock_find:
+            with patch("hanasu.main.subprocess.run") as mock_run:
+                mock_find.return_value = "/opt/homebrew/bin/ffmpeg"
+                mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+                extract_audio_from_video(str(video_file))
+
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index("-loglevel") + 1] == "error"
+
+    def test_ffmpeg_is_detached_from_stdin_and_threaded(self, tmp_path: Path):
+        """ffmpeg never reads stdin (the worker's job pipe) and decodes on all cores."""
+        import subprocess
+
+        video_file = tmp_path / "test.mp4"
+        video_file.touch()
+
+        with patch("hanasu.main.find_ffmpeg") as mock_find:
+            with patch("hanasu.main.subprocess.run") as mock_run:
+                mock_find.return_value = "/opt/homebrew/bin/ffmpeg"
+                mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
 
-                # Clean up temp file
-                if Path(result).exists():
-                    Path(result).unlink()
+                extract_audio_from_video(str(video_file))
 
-    def test_returns_temp_wav_path(self, tmp_path: Path):
-        """Returns path to temporary WAV file."""
+        call_args = mock_run.call_args[0][0]
+        assert "-nostdin" in call_args
+        assert mock_run.call_args[1]["stdin"] is subprocess.DEVNULL
+        # Input options must come before -i to apply to decoding
+        input_index = call_args.index("-i")
+        assert call_args[call_args.index("-threads") + 1] == "0"
+        assert call_args.index("-threads") < input_index
+        assert call_args[call_args.index("-filter_threads") + 1] == "0"
+
+    def test_returns_float32_samples_from_stdout(self, tmp_path: Path):
+        """Raw 16-bit PCM from ffmpeg's stdout is returned as normalized float32."""
         video_file = tmp_path / "test.mp4"
         video_file.touch()
+        pcm = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
 
         with patch("hanasu.main.find_ffmpeg") as mock_find:
             with patch("hanasu.main.subprocess.run") as mock_run:
                 mock_find.return_value = "/opt/homebrew/bin/ffmpeg"
-                mock_run.return_value = MagicMock(returncode=0, stderr="")
+                mock_run.return_value = MagicMock(returncode=0, stdout=pcm, stderr=b"")
 
                 result = extract_audio_from_video(str(video_file))
 
-                assert result.endswith(".wav")
+        assert result.dtype == np.float32
+        assert result.tolist() == [0.0, 0.5, -1.0]
+
+    def test_does_not_create_temp_files(self, tmp_path: Path):
+        """Nothing is written to disk during extraction."""
+        video_file = tmp_path / "test.mp4"
+        video_file.touch()
 
-                # Clean up temp file
-                if Path(result).exists():
-                    Path(result).unlink()
+        with patch("hanasu.main.find_ffmpeg") as mock_find:
+            with patch("hanasu.main.subprocess.run") as mock_run:
+                with patch("tempfile.NamedTemporaryFile") as mock_temp:
+                    mock_find.return_value = "/opt/homebrew/bin/ffmpeg"
+                    mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+                    extract_audio_from_video(str(video_file))
+
+        mock_temp.assert_not_called()
+        assert list(tmp_path.iterdir()) == [video_file]
 
     def test_raises_error_on_ffmpeg_failure(self, tmp_path: Path):
         """Raises RuntimeError when ffmpeg fails."""
@@ -545,10 +953,10 @@ class TestExtractAudioFromVideo:
             with patch("hanasu.main.subprocess.run") as mock_run:
                 mock_find.return_value = "/opt/homebrew/bin/ffmpeg"
                 mock_run.return_value = MagicMock(
-                    returncode=1, stderr="Error: No audio stream found"
+                    returncode=1, stdout=b"", stderr=b"Error: No audio stream found"
                 )
 
-                with pytest.raises(RuntimeError, match="(?i)ffmpeg|audio"):
+                with pytest.raises(RuntimeError, match="No audio stream found"):
                     extract_audio_from_video(str(video_file))
 
     def test_raises_error_when_ffmpeg_not_installed(self, tmp_path: Path):
@@ -566,6 +974,15 @@ class TestExtractAudioFromVideo:
 class TestFindFfmpeg:
     """Test ffmpeg binary discovery for macOS GUI apps."""
 
+    @pytest.fixture(autouse=True)
+    def clear_ffmpeg_cache(self):
+        """Each test mocks a different filesystem, so start with nothing remembered."""
+        from hanasu.main import _find_ffmpeg
+
+        _find_ffmpeg.cache_clear()
+        yield
+        _find_ffmpeg.cache_clear()
+
     def test_returns_homebrew_apple_silicon_path_when_exists(self):
         """Returns /opt/homebrew/bin/ffmpeg when it exists."""
         from hanasu.main import find_ffmpeg
@@ -619,6 +1036,30 @@ class TestFindFfmpeg:
 
                 assert result is None
 
+    def test_remembers_found_path(self):
+        """A found ffmpeg isn't looked up again."""
+        from hanasu.main import find_ffmpeg
+
+        with patch("hanasu.main.Path.exists") as mock_exists:
+            mock_exists.side_effect = [True]
+
+            assert find_ffmpeg() == "/opt/homebrew/bin/ffmpeg"
+            assert find_ffmpeg() == "/opt/homebrew/bin/ffmpeg"
+
+        assert mock_exists.call_count == 1
+
+    def test_looks_again_after_not_found(self):
+        """A miss isn't remembered, so ffmpeg installed later is found."""
+        from hanasu.main import find_ffmpeg
+
+        with patch("hanasu.main.Path.exists") as mock_exists:
+            with patch("hanasu.main.shutil.which") as mock_which:
+                mock_exists.side_effect = [False, False, True]
+                mock_which.return_value = None
+
+                assert find_ffmpeg() is None
+                assert find_ffmpeg() == "/opt/homebrew/bin/ffmpeg"
+
 
 class TestExtractAudioUsesFoundFfmpeg:
     """Test that extract_audio_from_video uses find_ffmpeg result."""
@@ -631,33 +1072,28 @@ class TestExtractAudioUsesFoundFfmpeg:
         with patch("hanasu.main.find_ffmpeg") as mock_find:
             with patch("hanasu.main.subprocess.run") as mock_run:
                 mock_find.return_value = "/opt/homebrew/bin/ffmpeg"
-                mock_run.return_value = MagicMock(returncode=0, stderr="")
+                mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
 
-                result = extract_audio_from_video(str(video_file))
+                extract_audio_from_video(str(video_file))
 
                 # Verify ffmpeg path is used
                 call_args = mock_run.call_args[0][0]
                 assert call_args[0] == "/opt/homebrew/bin/ffmpeg"
 
-                # Clean up
-                if Path(result).exists():
-                    Path(result).unlink()
-
 
 class TestRunTranscribeVideo:
     """Test video transcription integration."""
 
     def test_transcribes_video_file(self, tmp_path: Path, capsys):
-        """Video file is extracted and transcribed."""
+        """Video file is extracted and the samples are transcribed."""
         video_file = tmp_path / "test.mp4"
         video_file.touch()
+        samples = np.zeros(16000, dtype=np.float32)
 
         with patch("hanasu.main.is_video_file", return_value=True):
             with patch("hanasu.main.extract_audio_from_video") as mock_extract:
                 with patch("mlx_whisper.transcribe") as mock_transcribe:
-                    temp_audio = tmp_path / "temp.wav"
-                    temp_audio.touch()
-                    mock_extract.return_value = str(temp_audio)
+                    mock_extract.return_value = samples
                     mock_transcribe.return_value = {
                         "text": "Hello from video",
                         "segments": [],
@@ -668,54 +1104,45 @@ class TestRunTranscribeVideo:
                     # Verify extraction was called
                     mock_extract.assert_called_once_with(str(video_file))
 
-                    # Verify transcription was called with extracted audio
+                    # Verify transcription was called with extracted samples
                     mock_transcribe.assert_called_once()
-                    call_args = mock_transcribe.call_args[0]
-                    assert str(temp_audio) in call_args
+                    assert mock_transcribe.call_args[0][0] is samples
 
                     # Verify output
                     captured = capsys.readouterr()
                     assert "Hello from video" in captured.out
 
-    def test_cleans_up_temp_file_after_transcription(self, tmp_path: Path):
-        """Temporary audio file is deleted after successful transcription."""
+    def test_extraction_error_propagates(self, tmp_path: Path):
+        """An ffmpeg failure stops transcription before the model runs."""
         video_file = tmp_path / "test.mp4"
         video_file.touch()
-        temp_audio = tmp_path / "temp.wav"
-        temp_audio.touch()
 
         with patch("hanasu.main.is_video_file", return_value=True):
             with patch("hanasu.main.extract_audio_from_video") as mock_extract:
                 with patch("mlx_whisper.transcribe") as mock_transcribe:
-                    mock_extract.return_value = str(temp_audio)
-                    mock_transcribe.return_value = {
-                        "text": "Hello",
-                        "segments": [],
-                    }
+                    mock_extract.side_effect = RuntimeError("ffmpeg failed to extract audio")
 
-                    run_transcribe(str(video_file))
+                    with pytest.raises(RuntimeError, match="ffmpeg failed"):
+                        run_transcribe(str(video_file))
 
-                    # Temp file should be cleaned up
-                    assert not temp_audio.exists()
+                    mock_transcribe.assert_not_called()
 
-    def test_cleans_up_temp_file_on_error(self, tmp_path: Path):
-        """Temporary audio file is deleted even when transcription fails."""
+    def test_faster_whisper_decodes_video_without_ffmpeg(self, tmp_path: Path):
+        """With faster-whisper, the video path goes straight to the model."""
         video_file = tmp_path / "test.mp4"
         video_file.touch()
-        temp_audio = tmp_path / "temp.wav"
-        temp_audio.touch()
 
-        with patch("hanasu.main.is_video_file", return_value=True):
-            with patch("hanasu.main.extract_audio_from_video") as mock_extract:
-                with patch("mlx_whisper.transcribe") as mock_transcribe:
-                    mock_extract.return_value = str(temp_audio)
-                    mock_transcribe.side_effect = Exception("Transcription failed")
+        with (
+            patch("hanasu.main.extract_audio_from_video") as mock_extract,
+            patch("hanasu.transcriber.load_faster_whisper_model"),
+            patch("hanasu.transcriber.transcribe_with_faster_whisper") as mock_transcribe,
+        ):
+            mock_transcribe.return_value = {"text": "Hello", "segments": []}
 
-                    with pytest.raises(Exception, match="Transcription failed"):
-                        run_transcribe(str(video_file))
+            run_transcribe(str(video_file), backend="faster-whisper")
 
-                    # Temp file should still be cleaned up
-                    assert not temp_audio.exists()
+        mock_extract.assert_not_called()
+        assert mock_transcribe.call_args[0][1] == str(video_file)
 
     def test_audio_files_transcribed_directly(self, tmp_path: Path, capsys):
         """Audio files bypass extraction and are transcribed directly."""
@@ -744,6 +1171,13 @@ class TestRunTranscribeVideo:
 class TestIsModelCached:
     """Test model cache detection."""
 
+    @pytest.fixture(autouse=True)
+    def clear_model_cache(self):
+        """Each test points Path.home at its own tmp_path, so start uncached."""
+        invalidate_model_cache()
+        yield
+        invalidate_model_cache()
+
     def test_returns_true_when_cache_directory_exists(self, tmp_path: Path):
         """Returns True when model cache directory exists."""
         # Create mock cache structure
@@ -792,6 +1226,91 @@ class TestIsModelCached:
 
         assert result is True
 
+    def test_checks_faster_whisper_cache_for_that_backend(self, tmp_path: Path):
+        """faster-whisper models are looked up under their own hub repos."""
+        cache_dir = tmp_path / ".cache" / "huggingface" / "hub"
+        (cache_dir / "models--mlx-community--whisper-small-mlx").mkdir(parents=True)
+        (cache_dir / "models--Systran--faster-whisper-large-v3").mkdir()
+
+        with patch("hanasu.main.Path.home", return_value=tmp_path):
+            assert is_model_cached("small", backend="faster-whisper") is False
+            assert is_model_cached("large", backend="faster-whisper") is True
+            assert is_model_cached("small") is True
+
+    def test_memoizes_result_until_invalidated(self, tmp_path: Path):
+        """Repeated checks reuse the result until invalidate_model_cache is called."""
+        cache_dir = tmp_path / ".cache" / "huggingface" / "hub"
+        cache_dir.mkdir(parents=True)
+
+        with patch("hanasu.main.Path.home", return_value=tmp_path) as mock_home:
+            assert is_model_cached("tiny") is False
+            (cache_dir / "models--mlx-community--whisper-tiny-mlx").mkdir()
+            assert is_model_cached("tiny") is False
+            assert mock_home.call_count == 1
+
+            invalidate_model_cache()
+
+            assert is_model_cached("tiny") is True
+
+    def test_download_model_invalidates_cache(self):
+        """download_model clears memoized results so new downloads show up."""
+        with patch.dict("sys.modules", {"mlx_whisper": MagicMock()}):
+            with patch("hanasu.main._model_files_cached", return_value=False):
+                with patch("hanasu.main.invalidate_model_cache") as mock_invalidate:
+                    download_model("tiny")
+
+        mock_invalidate.assert_called_once()
+
+
+class TestDownloadModel:
+    """Test model download for setup and model changes."""
+
+    def test_skips_transcription_when_files_cached(self, capsys):
+        """A fully cached model isn't loaded just to verify it."""
+        fake_whisper = MagicMock()
+
+        with patch.dict("sys.modules", {"mlx_whisper": fake_whisper}):
+            with patch("hanasu.main._model_files_cached", return_value=True) as mock_cached:
+                download_model("tiny")
+
+        mock_cached.assert_called_once_with("mlx-community/whisper-tiny-mlx")
+        fake_whisper.transcribe.assert_not_called()
+        assert "already cached" in capsys.readouterr().out
+
+    def test_downloads_when_files_missing(self):
+        """A missing model is fetched through a dummy transcription."""
+        fake_whisper = MagicMock()
+
+        with patch.dict("sys.modules", {"mlx_whisper": fake_whisper}):
+            with patch("hanasu.main._model_files_cached", return_value=False):
+                download_model("tiny")
+
+        fake_whisper.transcribe.assert_called_once()
+        assert fake_whisper.transcribe.call_args[1]["path_or_hf_repo"] == (
+            "mlx-community/whisper-tiny-mlx"
+        )
+
+    @pytest.mark.parametrize(
+        ("cached_files", "expected"),
+        [
+            ({"config.json", "weights.safetensors"}, True),
+            ({"config.json", "weights.npz"}, True),
+            ({"config.json"}, False),
+            ({"weights.npz"}, False),
+        ],
+    )
+    def test_model_files_cached_needs_config_and_weights(self, cached_files, expected):
+        """Only a config plus a weights file counts as cached."""
+        from hanasu.main import _model_files_cached
+
+        fake_hub = MagicMock()
+        fake_hub.try_to_load_from_cache.side_effect = lambda repo, filename: (
+            f"/cache/{repo}/{filename}" if filename in cached_files else None
+        )
+
+        with patch.dict("sys.modules", {"huggingface_hub": fake_hub}):
+            assert _model_files_cached("mlx-community/whisper-tiny-mlx") is expected
+
 
 class TestChangeModel:
     """Test model hot-swap functionality."""
@@ -800,8 +1319,8 @@ class TestChangeModel:
         """Changing model creates a new Transcriber instance with new model."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber") as mock_transcriber_class:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber") as mock_transcriber_class:
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.is_model_cached", return_value=True):
                                 with patch("hanasu.main.save_config"):
@@ -830,12 +1349,51 @@ class TestChangeModel:
                                     second_call = mock_transcriber_class.call_args_list[1]
                                     assert second_call[1]["model"] == "medium"
 
+                                    # New model is warmed before it is swapped in
+                                    new_transcriber = mock_transcriber_class.return_value
+                                    new_transcriber.warmup.assert_called()
+                                    assert app.transcriber is new_transcriber
+
+    def test_change_model_keeps_old_model_when_load_fails(self, tmp_path: Path):
+        """A new model that fails to load isn't swapped in or saved."""
+        with (
+            patch("hanasu.main.load_config") as mock_config,
+            patch("hanasu.main.load_dictionary") as mock_dict,
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber") as mock_transcriber_class,
+            patch("hanasu.main.HotkeyListener"),
+            patch("hanasu.main.is_model_cached", return_value=True),
+            patch("hanasu.main.save_config") as mock_save,
+            patch("hanasu.main.threading.Thread") as mock_thread,
+        ):
+            mock_config.return_value = MagicMock(
+                hotkey="ctrl+shift+space", model="small", language="en", backend="mlx"
+            )
+            mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+            app = Hanasu(config_dir=tmp_path)
+            old_transcriber = app.transcriber
+            app._menubar_app = MagicMock()
+            new_transcriber = MagicMock()
+            new_transcriber.warmup.side_effect = RuntimeError("out of memory")
+            mock_transcriber_class.return_value = new_transcriber
+
+            app.change_model("large")
+            do_change = mock_thread.call_args[1]["target"]
+            do_change()
+
+        assert app.transcriber is old_transcriber
+        assert app.config.model == "small"
+        mock_save.assert_not_called()
+        app._menubar_app.setCurrentModel_.assert_not_called()
+        assert app._model_change_in_progress is False
+
     def test_change_model_saves_config(self, tmp_path: Path):
         """Changing model persists the new model to config file."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.is_model_cached", return_value=True):
                                 with patch("hanasu.main.save_config") as mock_save:
@@ -863,12 +1421,54 @@ class TestChangeModel:
                                     saved_config = mock_save.call_args[0][0]
                                     assert saved_config.model == "medium"
 
+    def test_change_model_keeps_other_config_fields(self, tmp_path: Path):
+        """Changing model updates only the model; every other setting is kept."""
+        with patch("hanasu.main.load_config") as mock_config:
+            with patch("hanasu.main.load_dictionary") as mock_dict:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
+                        with patch("hanasu.main.HotkeyListener"):
+                            with patch("hanasu.main.is_model_cached", return_value=True):
+                                with patch("hanasu.main.save_config") as mock_save:
+                                    config = Config(
+                                        hotkey="cmd+alt+v",
+                                        model="small",
+                                        language="en",
+                                        audio_device="USB Mic",
+                                        debug=False,
+                                        clear_clipboard=True,
+                                        last_output_dir="/tmp/out",
+                                        backend="mlx",
+                                    )
+                                    mock_config.return_value = config
+                                    mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+                                    app = Hanasu(config_dir=tmp_path)
+                                    app.change_model("medium")
+
+                                    # Wait for background thread
+                                    import time
+
+                                    time.sleep(0.1)
+
+                                    saved_config = mock_save.call_args[0][0]
+                                    assert saved_config == Config(
+                                        hotkey="cmd+alt+v",
+                                        model="medium",
+                                        language="en",
+                                        audio_device="USB Mic",
+                                        debug=False,
+                                        clear_clipboard=True,
+                                        last_output_dir="/tmp/out",
+                                        backend="mlx",
+                                    )
+
     def test_change_model_blocked_while_recording(self, tmp_path: Path):
         """Model change is blocked while recording is in progress."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber") as mock_transcriber_class:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber") as mock_transcriber_class:
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.is_model_cached", return_value=True):
                                 with patch("hanasu.main.save_config") as mock_save:
@@ -904,8 +1504,8 @@ class TestChangeModel:
         """Model change downloads uncached model before switching."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.is_model_cached", return_value=False):
                                 with patch("hanasu.main.save_config"):
@@ -917,6 +1517,7 @@ class TestChangeModel:
                                             audio_device=None,
                                             debug=False,
                                             clear_clipboard=False,
+                                            backend="mlx",
                                         )
                                         mock_dict.return_value = MagicMock(
                                             terms=[], replacements={}
@@ -933,12 +1534,52 @@ class TestChangeModel:
 
                                         mock_download.assert_called_once_with("large")
 
+    def test_change_model_with_faster_whisper_skips_mlx_download(self, tmp_path: Path):
+        """faster-whisper loads its own weights, so no mlx model is downloaded."""
+        with (
+            patch("hanasu.main.load_config") as mock_config,
+            patch("hanasu.main.load_dictionary") as mock_dict,
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber") as mock_transcriber_class,
+            patch("hanasu.main.HotkeyListener"),
+            patch("hanasu.main.is_model_cached", return_value=False),
+            patch("hanasu.main.save_config"),
+            patch("hanasu.main.download_model") as mock_download,
+            patch("hanasu.main.threading.Thread") as mock_thread,
+        ):
+            mock_config.return_value = MagicMock(
+                hotkey="ctrl+shift+space",
+                model="small",
+                language="en",
+                backend="faster-whisper",
+            )
+            mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+            app = Hanasu(config_dir=tmp_path)
+            app._menubar_app = MagicMock()
+            # Record when the model loads relative to the menu's download state
+            events = []
+            app._menubar_app.setModelDownloading_.side_effect = lambda model, downloading: (
+                events.append(("downloading", downloading))
+            )
+            mock_transcriber_class.return_value.warmup.side_effect = lambda: events.append("warmup")
+            app.change_model("large")
+            do_change = mock_thread.call_args[1]["target"]
+            do_change()
+
+        mock_download.assert_not_called()
+        mock_transcriber_class.assert_called_with(
+            model="large", language="en", backend="faster-whisper"
+        )
+        # faster-whisper downloads while loading, so the warmup shows as a download
+        assert events == [("downloading", True), "warmup", ("downloading", False)]
+
     def test_change_model_same_model_does_nothing(self, tmp_path: Path):
         """Changing to the same model is a no-op."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber") as mock_transcriber_class:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber") as mock_transcriber_class:
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.save_config") as mock_save:
                                 mock_config.return_value = MagicMock(
@@ -970,8 +1611,8 @@ class TestChangeModel:
         """Changing to an invalid model is a no-op."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber") as mock_transcriber_class:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber") as mock_transcriber_class:
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.save_config") as mock_save:
                                 mock_config.return_value = MagicMock(
@@ -1003,8 +1644,8 @@ class TestChangeModel:
         """Model change is blocked while another change is in progress."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber") as mock_transcriber_class:
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber") as mock_transcriber_class:
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.is_model_cached", return_value=True):
                                 with patch("hanasu.main.save_config") as mock_save:
@@ -1035,8 +1676,8 @@ class TestChangeModel:
         """Changing model updates the menu bar state."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             with patch("hanasu.main.is_model_cached", return_value=True):
                                 with patch("hanasu.main.save_config"):
@@ -1062,7 +1703,8 @@ class TestChangeModel:
                                     time.sleep(0.1)
 
                                     mock_menubar.setCurrentModel_.assert_called_with("medium")
-                                    mock_menubar.refreshModelStates.assert_called()
+                                    # Menu items are only touched on the main thread
+                                    mock_menubar.refreshModelStates.assert_not_called()
 
 
 class TestMenubarWiring:
@@ -1072,11 +1714,11 @@ class TestMenubarWiring:
         """Hanasu.run() passes model callbacks to run_menubar_app."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener") as mock_listener:
-                            with patch("hanasu.main.run_menubar_app") as mock_menubar_app:
-                                with patch("hanasu.main.start_app_loop"):
+                            with patch("hanasu.menubar.run_menubar_app") as mock_menubar_app:
+                                with patch("hanasu.menubar.start_app_loop"):
                                     mock_config.return_value = MagicMock(
                                         hotkey="ctrl+shift+space",
                                         model="small",
@@ -1100,16 +1742,20 @@ class TestMenubarWiring:
                                     assert "current_model" in call_kwargs
                                     assert "is_model_cached" in call_kwargs
                                     assert call_kwargs["current_model"] == "small"
+                                    assert (
+                                        call_kwargs["invalidate_model_cache"]
+                                        is invalidate_model_cache
+                                    )
 
     def test_on_model_change_callback_calls_change_model(self, tmp_path: Path):
         """Model change callback from menubar triggers change_model."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
-                            with patch("hanasu.main.run_menubar_app") as mock_menubar_app:
-                                with patch("hanasu.main.start_app_loop"):
+                            with patch("hanasu.menubar.run_menubar_app") as mock_menubar_app:
+                                with patch("hanasu.menubar.start_app_loop"):
                                     mock_config.return_value = MagicMock(
                                         hotkey="ctrl+shift+space",
                                         model="small",
@@ -1155,6 +1801,30 @@ class TestRunTranscribeFileOutput:
                 captured = capsys.readouterr()
                 assert "Hello world" in captured.out
 
+    def test_vtt_to_stdout_is_a_single_write(self, tmp_path: Path):
+        """VTT output goes to stdout in one write, not one per line."""
+        audio_file = tmp_path / "audio.wav"
+        audio_file.touch()
+
+        with patch("hanasu.main.is_video_file", return_value=False):
+            with patch("mlx_whisper.transcribe") as mock_transcribe:
+                mock_transcribe.return_value = {
+                    "text": "Full text",
+                    "segments": [
+                        {"start": float(i), "end": float(i + 1), "text": f" Line {i}"}
+                        for i in range(50)
+                    ],
+                }
+
+                with patch("sys.stdout") as mock_stdout:
+                    run_transcribe(str(audio_file), use_vtt=True)
+
+        mock_stdout.write.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        assert output.startswith("WEBVTT\n\n")
+        assert "00:00:49.000 --> 00:00:50.000\nLine 49\n\n" in output
+        mock_stdout.flush.assert_called_once()
+
     def test_writes_plain_text_to_file(self, tmp_path: Path, capsys):
         """When output file specified, plain text written to file not stdout."""
         audio_file = tmp_path / "audio.wav"
@@ -1206,6 +1876,30 @@ class TestRunTranscribeFileOutput:
                 captured = capsys.readouterr()
                 assert captured.out == ""
 
+    def test_vtt_output_matches_cue_format(self, tmp_path: Path):
+        """Each segment becomes a timestamped cue, including past the hour mark."""
+        audio_file = tmp_path / "audio.wav"
+        audio_file.touch()
+        output_file = tmp_path / "output.vtt"
+
+        with patch("hanasu.main.is_video_file", return_value=False):
+            with patch("mlx_whisper.transcribe") as mock_transcribe:
+                mock_transcribe.return_value = {
+                    "text": "Full text",
+                    "segments": [
+                        {"start": 61.25, "end": 125.5, "text": " Hello world "},
+                        {"start": 3599.5, "end": 3723.042, "text": "Goodbye"},
+                    ],
+                }
+
+                run_transcribe(str(audio_file), use_vtt=True, output_file=str(output_file))
+
+        assert output_file.read_text() == (
+            "WEBVTT\n\n"
+            "00:01:01.250 --> 00:02:05.500\nHello world\n\n"
+            "00:59:59.500 --> 01:02:03.042\nGoodbye\n\n"
+        )
+
     def test_raises_error_when_parent_dir_missing(self, tmp_path: Path):
         """When output file's parent directory doesn't exist, raises error."""
         audio_file = tmp_path / "audio.wav"
@@ -1295,6 +1989,86 @@ class TestRunTranscribeModelFlag:
                     # Model path should contain the model name
                     assert model in model_path.lower()
 
+    def test_faster_whisper_backend(self, tmp_path: Path, capsys):
+        """backend="faster-whisper" transcribes with faster-whisper instead of mlx-whisper."""
+        audio_file = tmp_path / "audio.wav"
+        audio_file.touch()
+        result = {"text": "Hello", "segments": []}
+
+        with (
+            patch("hanasu.main.is_video_file", return_value=False),
+            patch("mlx_whisper.transcribe") as mock_mlx,
+            patch("hanasu.transcriber.load_faster_whisper_model") as mock_load,
+            patch(
+                "hanasu.transcriber.transcribe_with_faster_whisper", return_value=result
+            ) as mock_transcribe,
+        ):
+            run_transcribe(str(audio_file), model="medium", backend="faster-whisper")
+
+        mock_load.assert_called_once_with("medium")
+        mock_transcribe.assert_called_once_with(
+            mock_load.return_value, str(audio_file), batch_size=None, vad_filter=False
+        )
+        mock_mlx.assert_not_called()
+        assert capsys.readouterr().out == "Hello\n"
+
+    def test_cli_passes_backend(self, monkeypatch):
+        """hanasu transcribe --backend is passed to run_transcribe."""
+        from hanasu.main import main
+
+        monkeypatch.setattr(
+            "sys.argv", ["hanasu", "transcribe", "in.mp3", "--backend", "faster-whisper"]
+        )
+
+        with patch("hanasu.main.run_transcribe") as mock_run:
+            main()
+
+        assert mock_run.call_args[1]["backend"] == "faster-whisper"
+
+    def test_cli_passes_batch_size_and_vad_filter(self, monkeypatch):
+        """--batch-size and --vad-filter reach run_transcribe with faster-whisper."""
+        from hanasu.main import main
+
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "hanasu",
+                "transcribe",
+                "talk.mp4",
+                "--backend",
+                "faster-whisper",
+                "--batch-size",
+                "16",
+                "--vad-filter",
+            ],
+        )
+
+        with patch("hanasu.main.run_transcribe") as mock_run:
+            main()
+
+        assert mock_run.call_args[1]["batch_size"] == 16
+        assert mock_run.call_args[1]["vad_filter"] is True
+
+    @pytest.mark.parametrize(
+        "flags",
+        [
+            ["--batch-size", "16"],
+            ["--vad-filter"],
+            ["--backend", "faster-whisper", "--batch-size", "0"],
+        ],
+    )
+    def test_cli_rejects_unsupported_batch_options(self, monkeypatch, flags):
+        """Batching options need faster-whisper and a positive batch size."""
+        from hanasu.main import main
+
+        monkeypatch.setattr("sys.argv", ["hanasu", "transcribe", "talk.mp4", *flags])
+
+        with patch("hanasu.main.run_transcribe") as mock_run:
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_run.assert_not_called()
+
 
 class TestOnTranscribeFile:
     """Test file transcription menu handler."""
@@ -1303,8 +2077,8 @@ class TestOnTranscribeFile:
         """Hanasu class has _on_transcribe_file method."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -1326,10 +2100,10 @@ class TestOnTranscribeFile:
         """Opens file picker with correct audio/video extensions."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
-                            with patch("hanasu.main.open_file_picker") as mock_picker:
+                            with patch("hanasu.menubar.open_file_picker") as mock_picker:
                                 mock_config.return_value = MagicMock(
                                     hotkey="ctrl+shift+space",
                                     model="small",
@@ -1361,11 +2135,11 @@ class TestOnTranscribeFile:
         """Does nothing if user cancels file picker."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
-                            with patch("hanasu.main.open_file_picker") as mock_file_picker:
-                                with patch("hanasu.main.show_format_picker") as mock_format:
+                            with patch("hanasu.menubar.open_file_picker") as mock_file_picker:
+                                with patch("hanasu.menubar.show_format_picker") as mock_format:
                                     mock_config.return_value = MagicMock(
                                         hotkey="ctrl+shift+space",
                                         model="small",
@@ -1388,11 +2162,11 @@ class TestOnTranscribeFile:
         """Shows format picker after file is selected."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
-                            with patch("hanasu.main.open_file_picker") as mock_file_picker:
-                                with patch("hanasu.main.show_format_picker") as mock_format:
+                            with patch("hanasu.menubar.open_file_picker") as mock_file_picker:
+                                with patch("hanasu.menubar.show_format_picker") as mock_format:
                                     mock_config.return_value = MagicMock(
                                         hotkey="ctrl+shift+space",
                                         model="small",
@@ -1411,16 +2185,70 @@ class TestOnTranscribeFile:
 
                                     mock_format.assert_called_once()
 
+    def test_saves_config_only_when_output_dir_changes(self, tmp_path: Path):
+        """Saving into the last used directory doesn't rewrite config."""
+        with (
+            patch("hanasu.main.load_config") as mock_config,
+            patch("hanasu.main.load_dictionary") as mock_dict,
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
+            patch("hanasu.main.HotkeyListener"),
+            patch("hanasu.menubar.open_file_picker", return_value="/in/audio.mp3"),
+            patch("hanasu.menubar.show_format_picker", return_value="txt"),
+            patch("hanasu.menubar.save_file_picker") as mock_save_picker,
+            patch("hanasu.main.save_config") as mock_save,
+            patch("hanasu.main.threading.Thread"),
+        ):
+            mock_config.return_value = MagicMock(
+                hotkey="ctrl+shift+space",
+                model="small",
+                language="en",
+                audio_device=None,
+                debug=False,
+                clear_clipboard=False,
+                last_output_dir=None,
+            )
+            mock_dict.return_value = MagicMock(terms=[], replacements={})
+            mock_save_picker.return_value = "/out/audio.txt"
+
+            app = Hanasu(config_dir=tmp_path)
+            app._on_transcribe_file()
+
+            assert app.config.last_output_dir == "/out"
+            mock_save.assert_called_once()
+
+            mock_save.reset_mock()
+            mock_save_picker.return_value = "/out/other.txt"
+            app._on_transcribe_file()
+
+            mock_save.assert_not_called()
+
+
+def finished_process(returncode: int = 0, stderr: str = "") -> MagicMock:
+    """Mock Popen instance for a transcription process that has exited."""
+    process = MagicMock(returncode=returncode)
+    process.communicate.return_value = ("", stderr)
+    return process
+
 
 class TestRunFileTranscription:
-    """Test background file transcription via subprocess."""
+    """Test background file transcription via one-off subprocess (worker fallback)."""
+
+    @pytest.fixture(autouse=True)
+    def worker_unavailable(self):
+        """Make the persistent worker unavailable so the subprocess fallback runs."""
+        with patch("hanasu.main.TranscribeWorker") as mock_worker_class:
+            mock_worker_class.return_value.transcribe.side_effect = WorkerUnavailableError(
+                "cannot start"
+            )
+            yield mock_worker_class
 
     def test_run_file_transcription_method_exists(self, tmp_path: Path):
         """Hanasu class has _run_file_transcription method."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -1443,10 +2271,10 @@ class TestRunFileTranscription:
         with (
             patch("hanasu.main.load_config") as mock_config,
             patch("hanasu.main.load_dictionary") as mock_dict,
-            patch("hanasu.main.Recorder"),
-            patch("hanasu.main.Transcriber"),
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
             patch("hanasu.main.HotkeyListener"),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.return_value = MagicMock(
                 hotkey="ctrl+shift+space",
@@ -1458,16 +2286,16 @@ class TestRunFileTranscription:
                 last_output_dir=None,
             )
             mock_dict.return_value = MagicMock(terms=[], replacements={})
-            mock_run.return_value = MagicMock(returncode=0, stderr="")
+            mock_popen.return_value = finished_process(returncode=0)
 
             app = Hanasu(config_dir=tmp_path)
             output_file = tmp_path / "output.txt"
 
             app._run_file_transcription("/path/to/audio.mp3", str(output_file), False)
 
-            # Verify subprocess.run was called
-            mock_run.assert_called_once()
-            call_args = mock_run.call_args
+            # Verify a subprocess was started
+            mock_popen.assert_called_once()
+            call_args = mock_popen.call_args
             cmd = call_args[0][0]
 
             # Command should include hanasu transcribe
@@ -1482,10 +2310,10 @@ class TestRunFileTranscription:
         with (
             patch("hanasu.main.load_config") as mock_config,
             patch("hanasu.main.load_dictionary") as mock_dict,
-            patch("hanasu.main.Recorder"),
-            patch("hanasu.main.Transcriber"),
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
             patch("hanasu.main.HotkeyListener"),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.return_value = MagicMock(
                 hotkey="ctrl+shift+space",
@@ -1495,32 +2323,34 @@ class TestRunFileTranscription:
                 debug=False,
                 clear_clipboard=False,
                 last_output_dir=None,
+                backend="faster-whisper",
             )
             mock_dict.return_value = MagicMock(terms=[], replacements={})
-            mock_run.return_value = MagicMock(returncode=0, stderr="")
+            mock_popen.return_value = finished_process(returncode=0)
 
             app = Hanasu(config_dir=tmp_path)
             output_file = tmp_path / "output.txt"
 
             app._run_file_transcription("/path/to/audio.mp3", str(output_file), False)
 
-            call_args = mock_run.call_args
+            call_args = mock_popen.call_args
             cmd = call_args[0][0]
 
             # Command should include --model medium
             assert "--model" in cmd
             model_idx = cmd.index("--model")
             assert cmd[model_idx + 1] == "medium"
+            assert cmd[cmd.index("--backend") + 1] == "faster-whisper"
 
     def test_subprocess_includes_vtt_flag_when_requested(self, tmp_path: Path):
         """Subprocess command includes --vtt flag when VTT format requested."""
         with (
             patch("hanasu.main.load_config") as mock_config,
             patch("hanasu.main.load_dictionary") as mock_dict,
-            patch("hanasu.main.Recorder"),
-            patch("hanasu.main.Transcriber"),
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
             patch("hanasu.main.HotkeyListener"),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.return_value = MagicMock(
                 hotkey="ctrl+shift+space",
@@ -1532,14 +2362,14 @@ class TestRunFileTranscription:
                 last_output_dir=None,
             )
             mock_dict.return_value = MagicMock(terms=[], replacements={})
-            mock_run.return_value = MagicMock(returncode=0, stderr="")
+            mock_popen.return_value = finished_process(returncode=0)
 
             app = Hanasu(config_dir=tmp_path)
             output_file = tmp_path / "output.vtt"
 
             app._run_file_transcription("/path/to/audio.mp3", str(output_file), True)
 
-            call_args = mock_run.call_args
+            call_args = mock_popen.call_args
             cmd = call_args[0][0]
 
             # Command should include --vtt flag
@@ -1550,10 +2380,10 @@ class TestRunFileTranscription:
         with (
             patch("hanasu.main.load_config") as mock_config,
             patch("hanasu.main.load_dictionary") as mock_dict,
-            patch("hanasu.main.Recorder"),
-            patch("hanasu.main.Transcriber"),
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
             patch("hanasu.main.HotkeyListener"),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.return_value = MagicMock(
                 hotkey="ctrl+shift+space",
@@ -1565,7 +2395,7 @@ class TestRunFileTranscription:
                 last_output_dir=None,
             )
             mock_dict.return_value = MagicMock(terms=[], replacements={})
-            mock_run.return_value = MagicMock(returncode=1, stderr="ffmpeg not found")
+            mock_popen.return_value = finished_process(returncode=1, stderr="ffmpeg not found")
 
             app = Hanasu(config_dir=tmp_path)
             app._show_transcription_error = MagicMock()
@@ -1585,10 +2415,11 @@ class TestRunFileTranscription:
         with (
             patch("hanasu.main.load_config") as mock_config,
             patch("hanasu.main.load_dictionary") as mock_dict,
-            patch("hanasu.main.Recorder"),
-            patch("hanasu.main.Transcriber"),
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
             patch("hanasu.main.HotkeyListener"),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
+            patch("hanasu.main.FILE_TRANSCRIPTION_TIMEOUT", 0),
         ):
             mock_config.return_value = MagicMock(
                 hotkey="ctrl+shift+space",
@@ -1600,7 +2431,12 @@ class TestRunFileTranscription:
                 last_output_dir=None,
             )
             mock_dict.return_value = MagicMock(terms=[], replacements={})
-            mock_run.side_effect = subprocess.TimeoutExpired(cmd=["hanasu"], timeout=600)
+            process = finished_process(returncode=-9)
+            process.communicate.side_effect = [
+                subprocess.TimeoutExpired(cmd=["hanasu"], timeout=1),
+                ("", ""),
+            ]
+            mock_popen.return_value = process
 
             app = Hanasu(config_dir=tmp_path)
             app._show_transcription_error = MagicMock()
@@ -1612,16 +2448,59 @@ class TestRunFileTranscription:
             app._show_transcription_error.assert_called_once()
             error_msg = app._show_transcription_error.call_args[0][0]
             assert "timed out" in error_msg.lower() or "timeout" in error_msg.lower()
+            process.kill.assert_called_once()
+
+    def test_quitting_cancels_running_subprocess(self, tmp_path: Path):
+        """Quitting kills a running transcription without showing an error."""
+        import subprocess
+
+        with (
+            patch("hanasu.main.load_config") as mock_config,
+            patch("hanasu.main.load_dictionary") as mock_dict,
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
+            patch("hanasu.main.HotkeyListener"),
+            patch("subprocess.Popen") as mock_popen,
+        ):
+            mock_config.return_value = MagicMock(
+                hotkey="ctrl+shift+space",
+                model="small",
+                language="en",
+                audio_device=None,
+                debug=False,
+                clear_clipboard=False,
+                last_output_dir=None,
+            )
+            mock_dict.return_value = MagicMock(terms=[], replacements={})
+
+            app = Hanasu(config_dir=tmp_path)
+            app._show_transcription_error = MagicMock()
+            process = finished_process(returncode=-9)
+
+            def still_running(timeout=None):
+                # Quit arrives while the child is still transcribing
+                if timeout is not None:
+                    app._on_quit()
+                    raise subprocess.TimeoutExpired(cmd=["hanasu"], timeout=timeout)
+                return ("", "")
+
+            process.communicate.side_effect = still_running
+            mock_popen.return_value = process
+
+            app._run_file_transcription("/path/to/audio.mp3", str(tmp_path / "out.txt"), False)
+
+            process.kill.assert_called_once()
+            app._show_transcription_error.assert_not_called()
 
     def test_no_error_shown_on_successful_completion(self, tmp_path: Path):
         """No error dialog shown when subprocess succeeds."""
         with (
             patch("hanasu.main.load_config") as mock_config,
             patch("hanasu.main.load_dictionary") as mock_dict,
-            patch("hanasu.main.Recorder"),
-            patch("hanasu.main.Transcriber"),
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
             patch("hanasu.main.HotkeyListener"),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.return_value = MagicMock(
                 hotkey="ctrl+shift+space",
@@ -1633,7 +2512,7 @@ class TestRunFileTranscription:
                 last_output_dir=None,
             )
             mock_dict.return_value = MagicMock(terms=[], replacements={})
-            mock_run.return_value = MagicMock(returncode=0, stderr="")
+            mock_popen.return_value = finished_process(returncode=0)
 
             app = Hanasu(config_dir=tmp_path)
             app._show_transcription_error = MagicMock()
@@ -1649,10 +2528,10 @@ class TestRunFileTranscription:
         with (
             patch("hanasu.main.load_config") as mock_config,
             patch("hanasu.main.load_dictionary") as mock_dict,
-            patch("hanasu.main.Recorder"),
-            patch("hanasu.main.Transcriber"),
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
             patch("hanasu.main.HotkeyListener"),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.return_value = MagicMock(
                 hotkey="ctrl+shift+space",
@@ -1664,20 +2543,127 @@ class TestRunFileTranscription:
                 last_output_dir=None,
             )
             mock_dict.return_value = MagicMock(terms=[], replacements={})
-            mock_run.return_value = MagicMock(returncode=0, stderr="")
+            mock_popen.return_value = finished_process(returncode=0)
 
             app = Hanasu(config_dir=tmp_path)
             output_file = tmp_path / "my output file.txt"
 
             app._run_file_transcription("/path/to/my audio file.mp3", str(output_file), False)
 
-            call_args = mock_run.call_args
+            call_args = mock_popen.call_args
             cmd = call_args[0][0]
 
             # Paths with spaces should be passed as separate list elements (not shell-quoted)
             assert "/path/to/my audio file.mp3" in cmd
             assert str(output_file) in cmd
 
+    def test_discards_stdout_and_keeps_stderr(self, tmp_path: Path):
+        """Output goes to the -o file, so only stderr is piped back for errors."""
+        import subprocess
+
+        with (
+            patch("hanasu.main.load_config") as mock_config,
+            patch("hanasu.main.load_dictionary") as mock_dict,
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
+            patch("hanasu.main.HotkeyListener"),
+            patch("subprocess.Popen") as mock_popen,
+        ):
+            mock_config.return_value = MagicMock(
+                hotkey="ctrl+shift+space",
+                model="small",
+                language="en",
+                audio_device=None,
+                debug=False,
+                clear_clipboard=False,
+                last_output_dir=None,
+            )
+            mock_dict.return_value = MagicMock(terms=[], replacements={})
+            mock_popen.return_value = finished_process(returncode=0)
+
+            app = Hanasu(config_dir=tmp_path)
+            app._run_file_transcription("/path/to/audio.mp3", str(tmp_path / "out.txt"), False)
+
+            kwargs = mock_popen.call_args[1]
+            assert kwargs["stdout"] is subprocess.DEVNULL
+            assert kwargs["stderr"] is subprocess.PIPE
+
+
+class TestRunFileTranscriptionWorker:
+    """Test background file transcription via the persistent worker process."""
+
+    @pytest.fixture
+    def app(self, tmp_path: Path):
+        """Hanasu instance with a mocked transcription worker."""
+        with (
+            patch("hanasu.main.load_config") as mock_config,
+            patch("hanasu.main.load_dictionary") as mock_dict,
+            patch("hanasu.recorder.Recorder"),
+            patch("hanasu.transcriber.Transcriber"),
+            patch("hanasu.main.HotkeyListener"),
+            patch("hanasu.main.TranscribeWorker"),
+        ):
+            mock_config.return_value = MagicMock(
+                hotkey="ctrl+shift+space",
+                model="medium",
+                language="en",
+                audio_device=None,
+                debug=False,
+                clear_clipboard=False,
+                last_output_dir=None,
+                backend="faster-whisper",
+            )
+            mock_dict.return_value = MagicMock(terms=[], replacements={})
+            yield Hanasu(config_dir=tmp_path)
+
+    def test_sends_job_to_worker_instead_of_spawning(self, app):
+        """Jobs go to the worker with the configured model and backend; no one-off process."""
+        app._transcribe_worker.transcribe.return_value = None
+
+        with patch("subprocess.run") as mock_run:
+            with patch.object(app, "_show_transcription_error") as mock_error:
+                app._run_file_transcription("/path/to/audio.mp3", "/out/audio.vtt", True)
+
+        app._transcribe_worker.transcribe.assert_called_once_with(
+            "/path/to/audio.mp3",
+            "/out/audio.vtt",
+            True,
+            model="medium",
+            backend="faster-whisper",
+            timeout=FILE_TRANSCRIPTION_TIMEOUT,
+        )
+        mock_run.assert_not_called()
+        mock_error.assert_not_called()
+
+    def test_shows_error_reported_by_worker(self, app):
+        """An error message returned by the worker is shown to the user."""
+        app._transcribe_worker.transcribe.return_value = "ffmpeg not found"
+
+        with patch.object(app, "_show_transcription_error") as mock_error:
+            app._run_file_transcription("/path/to/video.mp4", "/out/video.txt", False)
+
+        mock_error.assert_called_once_with("ffmpeg not found")
+
+    def test_shows_error_on_worker_timeout(self, app):
+        """A worker timeout shows the timeout error."""
+        import subprocess
+
+        app._transcribe_worker.transcribe.side_effect = subprocess.TimeoutExpired(
+            cmd=["hanasu"], timeout=FILE_TRANSCRIPTION_TIMEOUT
+        )
+
+        with patch.object(app, "_show_transcription_error") as mock_error:
+            app._run_file_transcription("/path/to/audio.mp3", "/out/audio.txt", False)
+
+        mock_error.assert_called_once()
+        assert "timed out" in mock_error.call_args[0][0].lower()
+
+    def test_quit_stops_worker(self, app):
+        """Quitting shuts down the worker process."""
+        app._on_quit()
+
+        app._transcribe_worker.stop.assert_called_once()
+
 
 class TestShowTranscriptionError:
     """Test error dialog for file transcription."""
@@ -1686,8 +2672,8 @@ class TestShowTranscriptionError:
         """Hanasu class has _show_transcription_error method."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener"):
                             mock_config.return_value = MagicMock(
                                 hotkey="ctrl+shift+space",
@@ -1769,11 +2755,11 @@ class TestRunMethodLogging:
         """run() logs a debug message when entering the method."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener") as mock_listener_class:
-                            with patch("hanasu.main.run_menubar_app"):
-                                with patch("hanasu.main.start_app_loop"):
+                            with patch("hanasu.menubar.run_menubar_app"):
+                                with patch("hanasu.menubar.start_app_loop"):
                                     mock_config.return_value = MagicMock(
                                         hotkey="ctrl+shift+space",
                                         model="small",
@@ -1803,11 +2789,11 @@ class TestRunMethodLogging:
         """run() logs when starting the hotkey listener."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener") as mock_listener_class:
-                            with patch("hanasu.main.run_menubar_app"):
-                                with patch("hanasu.main.start_app_loop"):
+                            with patch("hanasu.menubar.run_menubar_app"):
+                                with patch("hanasu.menubar.start_app_loop"):
                                     mock_config.return_value = MagicMock(
                                         hotkey="ctrl+shift+space",
                                         model="small",
@@ -1836,11 +2822,11 @@ class TestRunMethodLogging:
         """run() logs when starting the event loop."""
         with patch("hanasu.main.load_config") as mock_config:
             with patch("hanasu.main.load_dictionary") as mock_dict:
-                with patch("hanasu.main.Recorder"):
-                    with patch("hanasu.main.Transcriber"):
+                with patch("hanasu.recorder.Recorder"):
+                    with patch("hanasu.transcriber.Transcriber"):
                         with patch("hanasu.main.HotkeyListener") as mock_listener_class:
-                            with patch("hanasu.main.run_menubar_app"):
-                                with patch("hanasu.main.start_app_loop"):
+                            with patch("hanasu.menubar.run_menubar_app"):
+                                with patch("hanasu.menubar.start_app_loop"):
                                     mock_config.return_value = MagicMock(
                                         hotkey="ctrl+shift+space",
                                         model="small",
@@ -1894,3 +2880,20 @@ class TestMainExceptionLogging:
                     assert mock_logger.exception.called or mock_logger.error.called, (
                         "Expected exception to be logged via logger"
                     )
+
+
+class TestStartupImports:
+    """Test that importing the CLI doesn't pull in the app's heavy dependencies."""
+
+    def test_importing_main_skips_audio_and_ui_modules(self):
+        """hanasu.main loads menubar, recorder and transcriber only when used."""
+        code = (
+            "import sys, hanasu.main; "
+            "print(' '.join(m for m in ('hanasu.menubar', 'hanasu.recorder', "
+            "'hanasu.transcriber', 'AppKit', 'sounddevice', 'numpy') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
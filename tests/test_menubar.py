@@ -83,9 +83,10 @@ class TestMenuBarUpdateIntegration:
                 latest_version="0.2.0",
             )
 
-            delegate.setUpdateStatus_(status)
-            # Simulate main thread execution (in tests, performSelectorOnMainThread doesn't run)
-            delegate.applyUpdateStatus()
+            # Run the main-thread callback immediately (there's no event loop in tests)
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                mock_helper.callAfter.side_effect = lambda fn, *args: fn(*args)
+                delegate.setUpdateStatus_(status)
 
             # Should update menu item title to show update available
             delegate._update_menu_item.setTitle_.assert_called()
@@ -107,13 +108,86 @@ class TestMenuBarUpdateIntegration:
                 latest_version="0.1.0",
             )
 
-            delegate.setUpdateStatus_(status)
-            # Simulate main thread execution (in tests, performSelectorOnMainThread doesn't run)
-            delegate.applyUpdateStatus()
+            # Run the main-thread callback immediately (there's no event loop in tests)
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                mock_helper.callAfter.side_effect = lambda fn, *args: fn(*args)
+                delegate.setUpdateStatus_(status)
 
             call_arg = delegate._update_menu_item.setTitle_.call_args[0][0]
             assert "up to date" in call_arg.lower() or "✓" in call_arg
 
+    def test_update_progress_states_apply_in_order(self):
+        """Queued update titles are each applied, so the last one posted wins."""
+        from hanasu.menubar import MenuBarApp
+
+        with patch("hanasu.menubar.NSStatusBar"):
+            delegate = MenuBarApp.alloc().initWithCallbacks_({})
+            delegate._status_item = MagicMock()
+            delegate._update_menu_item = MagicMock()
+
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                delegate.setUpdateInProgress()
+                delegate.setUpdateFailed()
+
+                for call in mock_helper.callAfter.call_args_list:
+                    fn, *args = call[0]
+                    fn(*args)
+
+            titles = [c[0][0] for c in delegate._update_menu_item.setTitle_.call_args_list]
+            assert titles == ["⏳ Updating...", "✗ Update failed - Click to retry"]
+            delegate._update_menu_item.setEnabled_.assert_called_with(True)
+
+    def test_repeated_update_status_is_applied_once(self):
+        """Re-posting the same update status doesn't retitle the menu item."""
+        from hanasu.menubar import MenuBarApp
+
+        with patch("hanasu.menubar.NSStatusBar"):
+            delegate = MenuBarApp.alloc().initWithCallbacks_({})
+            delegate._status_item = MagicMock()
+            delegate._update_menu_item = MagicMock()
+
+            status = UpdateStatus(checked=True, update_available=False, latest_version="0.1.0")
+            delegate.applyUpdateStatus(status)
+            delegate.applyUpdateStatus(status)
+
+            delegate._update_menu_item.setTitle_.assert_called_once_with("✓ Up to date")
+
+
+class TestRecordingState:
+    """Test the status bar recording indicator."""
+
+    def test_setRecording_skips_unchanged_state(self):
+        """setRecording_ with the current state doesn't schedule a UI update."""
+        from hanasu.menubar import MenuBarApp
+
+        with patch("hanasu.menubar.NSStatusBar"):
+            delegate = MenuBarApp.alloc().initWithCallbacks_({})
+            delegate._status_item = MagicMock()
+
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                delegate.setRecording_(False)
+
+            mock_helper.callAfter.assert_not_called()
+
+    def test_title_only_set_when_it_changes(self):
+        """Queued title updates that land on the same state set the title once."""
+        from hanasu.menubar import MenuBarApp
+
+        with patch("hanasu.menubar.NSStatusBar"):
+            delegate = MenuBarApp.alloc().initWithCallbacks_({})
+            delegate._status_item = MagicMock()
+
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                # Press and release before the main thread runs either update
+                delegate.setRecording_(True)
+                delegate.setRecording_(False)
+
+                for call in mock_helper.callAfter.call_args_list:
+                    fn, *args = call[0]
+                    fn(*args)
+
+            delegate._status_item.setTitle_.assert_called_once_with("\U0001f3a4")
+
 
 class TestHotkeyValidation:
     """Test hotkey validation using parse_hotkey for syntax checking."""
@@ -480,9 +554,9 @@ class TestModelStateUpdates:
             delegate._current_model = "small"
 
             delegate.setupStatusBar(version="0.1.0")
-            delegate.setCurrentModel_("large")
-            # Simulate main thread call
-            delegate.applyCurrentModel()
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                mock_helper.callAfter.side_effect = lambda fn, *args: fn(*args)
+                delegate.setCurrentModel_("large")
 
             assert delegate._current_model == "large"
 
@@ -496,9 +570,9 @@ class TestModelStateUpdates:
             delegate._is_model_cached_fn = lambda m: True
 
             delegate.setupStatusBar(version="0.1.0")
-            delegate.setModelDownloading_("large", True)
-            # Simulate main thread call
-            delegate.applyDownloadState()
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                mock_helper.callAfter.side_effect = lambda fn, *args: fn(*args)
+                delegate.setModelDownloading_("large", True)
 
             assert "large" in delegate._downloading_models
 
@@ -513,12 +587,33 @@ class TestModelStateUpdates:
             delegate._downloading_models = {"large"}
 
             delegate.setupStatusBar(version="0.1.0")
-            delegate.setModelDownloading_("large", False)
-            # Simulate main thread call
-            delegate.applyDownloadState()
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                mock_helper.callAfter.side_effect = lambda fn, *args: fn(*args)
+                delegate.setModelDownloading_("large", False)
 
             assert "large" not in delegate._downloading_models
 
+    def test_back_to_back_download_states_are_all_applied(self):
+        """Each setModelDownloading_ call carries its own state to the main thread."""
+        from hanasu.menubar import MenuBarApp
+
+        with patch("hanasu.menubar.NSStatusBar"):
+            delegate = MenuBarApp.alloc().initWithCallbacks_({})
+            delegate._status_item = MagicMock()
+            delegate._is_model_cached_fn = lambda m: True
+
+            delegate.setupStatusBar(version="0.1.0")
+            with patch("hanasu.menubar.AppHelper") as mock_helper:
+                # Post from "background threads" before the main thread runs anything
+                delegate.setModelDownloading_("medium", True)
+                delegate.setModelDownloading_("large", True)
+
+                for call in mock_helper.callAfter.call_args_list:
+                    fn, *args = call[0]
+                    fn(*args)
+
+            assert delegate._downloading_models == {"medium", "large"}
+
     def test_refreshModelStates_updates_all_menu_items(self):
         """refreshModelStates updates titles for all model menu items."""
         from hanasu.menubar import MenuBarApp
@@ -544,6 +639,31 @@ class TestModelStateUpdates:
             assert "●" not in large_title
             assert "↓" in large_title
 
+    def test_refreshModelStates_only_retitles_changed_items(self):
+        """Items whose title is unchanged aren't retitled on refresh."""
+        from hanasu.menubar import MenuBarApp
+
+        with patch("hanasu.menubar.NSStatusBar"):
+            delegate = MenuBarApp.alloc().initWithCallbacks_({})
+            delegate._status_item = MagicMock()
+            delegate._is_model_cached_fn = lambda m: True
+            delegate._current_model = "small"
+
+            delegate.setupStatusBar(version="0.1.0")
+            items = {model: MagicMock() for model in delegate._model_menu_items}
+            delegate._model_menu_items = items
+
+            delegate.refreshModelStates()
+            for item in items.values():
+                item.setTitle_.assert_not_called()
+
+            # Moving the current-model indicator changes exactly two titles
+            delegate._current_model = "large"
+            delegate.refreshModelStates()
+
+            retitled = {model for model, item in items.items() if item.setTitle_.called}
+            assert retitled == {"small", "large"}
+
 
 class TestMenuDelegate:
     """Test menu delegate for refreshing cache state on submenu open."""
@@ -562,6 +682,21 @@ class TestMenuDelegate:
             # Model submenu should have delegate set
             assert delegate._model_submenu.delegate() is not None
 
+    def test_menus_keep_explicit_enabled_states(self):
+        """Autoenabling is off so setEnabled_ on items isn't overridden by AppKit."""
+        from hanasu.menubar import MenuBarApp
+
+        with patch("hanasu.menubar.NSStatusBar") as mock_status_bar:
+            delegate = MenuBarApp.alloc().initWithCallbacks_({})
+            delegate._is_model_cached_fn = lambda m: True
+
+            delegate.setupStatusBar(version="0.1.0")
+
+            status_item = mock_status_bar.systemStatusBar.return_value.statusItemWithLength_
+            menu = status_item.return_value.setMenu_.call_args[0][0]
+            assert not menu.autoenablesItems()
+            assert not delegate._model_submenu.autoenablesItems()
+
     def test_menuWillOpen_refreshes_model_states(self):
         """menuWillOpen_ should refresh model states when model submenu opens."""
         from hanasu.menubar import MenuBarApp
@@ -589,6 +724,27 @@ class TestMenuDelegate:
             # Should have checked cache for all models
             assert len(cache_calls) == 5  # All 5 models checked
 
+    def test_menuWillOpen_invalidates_model_cache_first(self):
+        """Opening the model submenu drops memoized cache checks before refreshing."""
+        from hanasu.menubar import MenuBarApp
+
+        with patch("hanasu.menubar.NSStatusBar"):
+            calls = []
+
+            delegate = MenuBarApp.alloc().initWithCallbacks_({})
+            delegate._status_item = MagicMock()
+            delegate._is_model_cached_fn = lambda m: calls.append(m) or True
+            delegate._invalidate_model_cache_fn = lambda: calls.append("invalidate")
+
+            delegate.setupStatusBar(version="0.1.0")
+            calls.clear()
+
+            delegate.menuWillOpen_(delegate._model_submenu)
+
+            assert calls[0] == "invalidate"
+            assert calls.count("invalidate") == 1
+            assert len(calls) == 6  # Then all 5 models checked
+
 
 class TestOpenFilePicker:
     """Test open_file_picker function for selecting audio/video files."""
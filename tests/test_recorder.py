@@ -60,6 +60,48 @@ class TestRecorderStartStop:
             assert len(audio) == 4
 
 
+class TestRecorderSampleCount:
+    """Test cheap length checks and discarding short recordings."""
+
+    def test_sample_count_tracks_callback_frames(self):
+        """sample_count sums the frames delivered by the audio callback."""
+        with patch("hanasu.recorder.sd"):
+            recorder = Recorder()
+            recorder.start()
+            recorder._audio_callback(np.zeros((512, 1), dtype=np.float32), 512, None, None)
+            recorder._audio_callback(np.zeros((256, 1), dtype=np.float32), 256, None, None)
+
+            assert recorder.sample_count() == 768
+            assert len(recorder.stop()) == 768
+
+    def test_start_resets_sample_count(self):
+        """Starting a new recording resets the count."""
+        with patch("hanasu.recorder.sd"):
+            recorder = Recorder()
+            recorder.start()
+            recorder._audio_callback(np.zeros((512, 1), dtype=np.float32), 512, None, None)
+            recorder.stop()
+            recorder.start()
+
+            assert recorder.sample_count() == 0
+
+    def test_discard_closes_stream_and_drops_audio(self):
+        """discard stops the stream and clears buffered audio without concatenating."""
+        with patch("hanasu.recorder.sd") as mock_sd:
+            recorder = Recorder()
+            recorder.start()
+            recorder._audio_callback(np.zeros((512, 1), dtype=np.float32), 512, None, None)
+
+            with patch("hanasu.recorder.np.concatenate") as mock_concat:
+                recorder.discard()
+
+            mock_concat.assert_not_called()
+            mock_sd.InputStream.return_value.stop.assert_called_once()
+            mock_sd.InputStream.return_value.close.assert_called_once()
+            assert recorder.sample_count() == 0
+            assert len(recorder.stop()) == 0
+
+
 class TestRecorderDevice:
     """Test device selection."""
 
@@ -0,0 +1,169 @@
+"""Tests for the persistent file transcription worker."""
+
+import io
+import json
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from hanasu.transcribe_worker import TranscribeWorker, WorkerUnavailableError, main
+
+# Stand-in worker: answers each job with its own input path as the error (or ok
+# for "good" paths), "crash" exits, "hang" never answers
+FAKE_WORKER = """
+import json, os, sys, time
+for line in sys.stdin:
+    job = json.loads(line)
+    if job["input_path"] == "crash":
+        sys.exit(3)
+    if job["input_path"] == "hang":
+        time.sleep(60)
+    if job["input_path"] == "good":
+        response = {"ok": True, "pid": os.getpid()}
+    else:
+        response = {"ok": False, "error": job["input_path"] + ":" + job["model"]}
+    print(json.dumps(response), flush=True)
+"""
+
+
+@pytest.fixture
+def worker():
+    """TranscribeWorker talking to the fake worker script."""
+    with patch("hanasu.transcribe_worker.WORKER_COMMAND", [sys.executable, "-c", FAKE_WORKER]):
+        worker = TranscribeWorker()
+        yield worker
+        worker.stop()
+
+
+class TestTranscribeWorker:
+    """Test the client side of the worker protocol."""
+
+    def test_does_not_start_process_until_first_job(self):
+        """Creating a worker doesn't spawn anything."""
+        with patch("hanasu.transcribe_worker.subprocess.Popen") as mock_popen:
+            TranscribeWorker()
+
+        mock_popen.assert_not_called()
+
+    def test_returns_none_on_success(self, worker):
+        """A successful job returns None."""
+        assert worker.transcribe("good", "out.txt", False, model="small", timeout=5) is None
+
+    def test_returns_worker_error_message(self, worker):
+        """A failed job returns the worker's error message."""
+        error = worker.transcribe("missing.mp3", "out.txt", False, model="tiny", timeout=5)
+
+        assert error == "missing.mp3:tiny"
+
+    def test_reuses_process_across_jobs(self, worker):
+        """Consecutive jobs are handled by the same process."""
+        worker.transcribe("good", "a.txt", False, model="small", timeout=5)
+        first = worker._process
+        worker.transcribe("good", "b.txt", False, model="small", timeout=5)
+
+        assert worker._process is first
+        assert first.poll() is None
+
+    def test_reports_crash_and_restarts_for_next_job(self, worker):
+        """A worker that dies mid-job reports an error; the next job gets a new process."""
+        error = worker.transcribe("crash", "out.txt", False, model="small", timeout=5)
+
+        assert "exited unexpectedly" in error
+        assert "3" in error
+        assert worker.transcribe("good", "out.txt", False, model="small", timeout=5) is None
+
+    def test_timeout_kills_worker(self, worker):
+        """A job exceeding the timeout raises TimeoutExpired and kills the process."""
+        worker.transcribe("good", "out.txt", False, model="small", timeout=5)
+        process = worker._process
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            worker.transcribe("hang", "out.txt", False, model="small", timeout=0.2)
+
+        assert process.poll() is not None
+        assert worker._process is None
+
+    def test_raises_unavailable_when_process_cannot_start(self):
+        """Failure to spawn the worker raises WorkerUnavailableError."""
+        with patch("hanasu.transcribe_worker.WORKER_COMMAND", ["/nonexistent/python"]):
+            worker = TranscribeWorker()
+
+            with pytest.raises(WorkerUnavailableError):
+                worker.transcribe("good", "out.txt", False, model="small", timeout=5)
+
+    def test_stop_ends_process(self, worker):
+        """stop() shuts the process down."""
+        worker.transcribe("good", "out.txt", False, model="small", timeout=5)
+        process = worker._process
+
+        worker.stop()
+
+        assert process.poll() is not None
+        assert worker._process is None
+
+    def test_stop_cancels_running_job_without_waiting(self, worker):
+        """stop() during a job kills the process instead of waiting for the job."""
+        result = {}
+
+        def run_job():
+            result["error"] = worker.transcribe("hang", "out.txt", False, model="small", timeout=30)
+
+        job = threading.Thread(target=run_job)
+        job.start()
+        # Wait until the job has been handed to the worker
+        deadline = time.monotonic() + 5
+        while not worker._lock.locked() or worker._process is None:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        worker.stop()
+        job.join(timeout=5)
+
+        assert time.monotonic() - started < 5
+        assert not job.is_alive()
+        assert "exited unexpectedly" in result["error"]
+
+
+class TestWorkerLoop:
+    """Test the worker side of the protocol."""
+
+    def test_runs_each_job_and_reports_result(self):
+        """Each job line runs run_transcribe and writes one response line."""
+        jobs = [
+            {
+                "input_path": "a.mp3",
+                "output_path": "a.txt",
+                "use_vtt": False,
+                "model": "small",
+                "backend": "mlx",
+            },
+            {
+                "input_path": "b.mp4",
+                "output_path": "b.vtt",
+                "use_vtt": True,
+                "model": "tiny",
+                "backend": "faster-whisper",
+            },
+        ]
+        stdin = io.StringIO("".join(json.dumps(job) + "\n" for job in jobs))
+        stdout = io.StringIO()
+
+        with (
+            patch("hanasu.main.run_transcribe") as mock_run,
+            patch("sys.stdin", stdin),
+            patch("sys.stdout", stdout),
+        ):
+            mock_run.side_effect = [None, RuntimeError("ffmpeg not found")]
+            main()
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert responses == [{"ok": True}, {"ok": False, "error": "ffmpeg not found"}]
+        mock_run.assert_any_call(
+            "b.mp4", use_vtt=True, model="tiny", output_file="b.vtt", backend="faster-whisper"
+        )
@@ -1,11 +1,24 @@
 """Tests for transcription functionality."""
 
-from unittest.mock import patch
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 
 from hanasu.config import Dictionary
-from hanasu.transcriber import Transcriber, apply_replacements
+from hanasu.transcriber import (
+    FASTER_WHISPER_CACHE_NAMES,
+    MODEL_CACHE_NAMES,
+    MODEL_PATHS,
+    SILENCE_1S,
+    WARMUP_SAMPLES,
+    Transcriber,
+    apply_replacements,
+    load_faster_whisper_model,
+    transcribe_with_faster_whisper,
+)
 
 
 class TestTranscriberTranscribe:
@@ -41,6 +54,18 @@ class TestTranscriberTranscribe:
             assert result == ""
             mock_whisper.transcribe.assert_not_called()
 
+    def test_imports_mlx_whisper_on_first_transcription(self):
+        """mlx-whisper is loaded lazily, on the first transcription."""
+        fake_whisper = MagicMock()
+        fake_whisper.transcribe.return_value = {"text": "hi"}
+
+        with patch("hanasu.transcriber.mlx_whisper", None):
+            with patch.dict(sys.modules, {"mlx_whisper": fake_whisper}):
+                result = Transcriber(model="small").transcribe(np.array([0.1], dtype=np.float32))
+
+        assert result == "hi"
+        fake_whisper.transcribe.assert_called_once()
+
 
 class TestTranscriberDictionary:
     """Test dictionary context for improved accuracy."""
@@ -151,3 +176,151 @@ class TestTranscriberModel:
 
             call_kwargs = mock_whisper.transcribe.call_args[1]
             assert call_kwargs["language"] == "en"
+
+
+class TestTranscriberWarmup:
+    """Test model warmup ahead of the first transcription."""
+
+    def test_warmup_runs_silence_through_model(self):
+        """Warmup transcribes one second of silence with the configured model."""
+        with patch("hanasu.transcriber.mlx_whisper") as mock_whisper:
+            mock_whisper.transcribe.return_value = {"text": ""}
+
+            transcriber = Transcriber(model="tiny")
+            transcriber.warmup()
+
+            mock_whisper.transcribe.assert_called_once()
+            audio = mock_whisper.transcribe.call_args[0][0]
+            assert audio is SILENCE_1S
+            assert audio.shape == (WARMUP_SAMPLES,)
+            assert not audio.any()
+            assert not audio.flags.writeable
+            assert mock_whisper.transcribe.call_args[1]["path_or_hf_repo"] == (
+                "mlx-community/whisper-tiny-mlx"
+            )
+
+
+class TestModelCacheNames:
+    """Test HuggingFace cache directory names derived from model paths."""
+
+    def test_cache_names_follow_hub_layout(self):
+        """Each model maps to models--<org>--<repo>."""
+        assert MODEL_CACHE_NAMES["small"] == "models--mlx-community--whisper-small-mlx"
+        assert MODEL_CACHE_NAMES["large"] == "models--mlx-community--whisper-large-v3-mlx"
+        assert MODEL_CACHE_NAMES.keys() == MODEL_PATHS.keys()
+
+    def test_faster_whisper_cache_names_use_systran_repos(self):
+        """faster-whisper models map to models--Systran--faster-whisper-<name>."""
+        assert FASTER_WHISPER_CACHE_NAMES["small"] == "models--Systran--faster-whisper-small"
+        assert FASTER_WHISPER_CACHE_NAMES["large"] == "models--Systran--faster-whisper-large-v3"
+        assert FASTER_WHISPER_CACHE_NAMES.keys() == MODEL_PATHS.keys()
+
+
+@pytest.fixture
+def fake_faster_whisper():
+    """Stand-in faster_whisper module, with no model remembered from other tests."""
+    fake = MagicMock()
+    fake.WhisperModel.return_value.transcribe.return_value = (
+        iter(
+            [
+                SimpleNamespace(start=0.0, end=1.5, text=" Hello"),
+                SimpleNamespace(start=1.5, end=3.0, text=" world."),
+            ]
+        ),
+        MagicMock(),
+    )
+    load_faster_whisper_model.cache_clear()
+    with patch("hanasu.transcriber.faster_whisper", fake):
+        yield fake
+    load_faster_whisper_model.cache_clear()
+
+
+class TestFasterWhisperBackend:
+    """Test transcription with faster-whisper."""
+
+    def test_loads_int8_model(self, fake_faster_whisper):
+        """Models load with int8 weights under faster-whisper's model names."""
+        load_faster_whisper_model("large")
+
+        fake_faster_whisper.WhisperModel.assert_called_once_with(
+            "large-v3", device="auto", compute_type="int8"
+        )
+
+    def test_keeps_loaded_model(self, fake_faster_whisper):
+        """Loading the same model again reuses the loaded instance."""
+        first = load_faster_whisper_model("small")
+        second = load_faster_whisper_model("small")
+
+        assert first is second
+        fake_faster_whisper.WhisperModel.assert_called_once()
+
+    def test_result_matches_mlx_whisper_shape(self, fake_faster_whisper):
+        """Segments are collected into mlx-whisper's text/segments result."""
+        model = load_faster_whisper_model("small")
+
+        result = transcribe_with_faster_whisper(model, "audio.wav", language="en")
+
+        assert result == {
+            "text": " Hello world.",
+            "segments": [
+                {"start": 0.0, "end": 1.5, "text": " Hello"},
+                {"start": 1.5, "end": 3.0, "text": " world."},
+            ],
+        }
+        model.transcribe.assert_called_once_with("audio.wav", beam_size=1, language="en")
+
+    def test_batch_size_uses_batched_pipeline(self, fake_faster_whisper):
+        """With batch_size, chunks are decoded through BatchedInferencePipeline."""
+        pipeline = fake_faster_whisper.BatchedInferencePipeline.return_value
+        pipeline.transcribe.return_value = (
+            iter([SimpleNamespace(start=0.0, end=30.0, text=" Batched")]),
+            MagicMock(),
+        )
+        model = load_faster_whisper_model("small")
+
+        result = transcribe_with_faster_whisper(model, "long.wav", batch_size=16, vad_filter=True)
+
+        assert result["text"] == " Batched"
+        fake_faster_whisper.BatchedInferencePipeline.assert_called_once_with(model=model)
+        pipeline.transcribe.assert_called_once_with(
+            "long.wav", batch_size=16, beam_size=1, vad_filter=True
+        )
+        model.transcribe.assert_not_called()
+
+    def test_transcriber_uses_faster_whisper_backend(self, fake_faster_whisper):
+        """Transcriber routes to faster-whisper and skips mlx-whisper."""
+        dictionary = Dictionary(terms=["Hanasu"])
+
+        with patch("hanasu.transcriber.mlx_whisper") as mock_mlx:
+            transcriber = Transcriber(model="small", language="ja", backend="faster-whisper")
+            result = transcriber.transcribe(np.array([0.1], dtype=np.float32), dictionary)
+
+        assert result == "Hello world."
+        mock_mlx.transcribe.assert_not_called()
+        options = fake_faster_whisper.WhisperModel.return_value.transcribe.call_args[1]
+        assert options["language"] == "ja"
+        assert options["initial_prompt"] == "Vocabulary: Hanasu"
+
+    def test_transcriber_keeps_its_model_loaded(self, fake_faster_whisper):
+        """A transcriber doesn't reload its model after another model was loaded."""
+        fake_faster_whisper.WhisperModel.side_effect = lambda name, **kwargs: MagicMock(
+            name=name, **{"transcribe.return_value": ([], MagicMock())}
+        )
+        audio = np.array([0.1], dtype=np.float32)
+        current = Transcriber(model="small", backend="faster-whisper")
+        current.transcribe(audio)
+
+        # Loading the next model (as change_model's warmup does) evicts the cached one
+        Transcriber(model="large", backend="faster-whisper").transcribe(audio)
+        current.transcribe(audio)
+
+        loaded = [c.args[0] for c in fake_faster_whisper.WhisperModel.call_args_list]
+        assert loaded == ["small", "large-v3"]
+
+    def test_missing_package_raises_install_hint(self):
+        """A missing faster-whisper package gives an actionable error."""
+        load_faster_whisper_model.cache_clear()
+        with patch("hanasu.transcriber.faster_whisper", None):
+            with patch.dict(sys.modules, {"faster_whisper": None}):
+                with pytest.raises(RuntimeError, match="faster-whisper"):
+                    load_faster_whisper_model("small")
@@ -204,6 +204,19 @@ class TestCheckForUpdate:
         assert status.update_available is False
         assert status.latest_version is None
 
+    def test_refetches_when_cache_is_corrupt(self, tmp_path: Path):
+        """An unreadable cache file is ignored and the version fetched again."""
+        (tmp_path / "update_cache.json").write_text("{not json")
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps({"tag_name": "v0.2.0"}).encode()
+        mock_response.__enter__ = lambda s: s
+        mock_response.__exit__ = MagicMock(return_value=False)
+
+        with patch("hanasu.updater.urllib.request.urlopen", return_value=mock_response):
+            status = check_for_update("0.1.0", cache_dir=tmp_path)
+
+        assert status.latest_version == "0.2.0"
+
     def test_saves_result_to_cache(self, tmp_path: Path):
         """Saves check result to cache file."""
         mock_response = MagicMock()